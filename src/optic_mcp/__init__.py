@@ -1,13 +1,15 @@
 """OpticMCP - MCP server for USB camera capture with OpenCV."""
 
+import importlib
+
 __version__ = "0.6.0"
 
-# Core modules are imported here for backwards compatibility
-from optic_mcp import usb
-from optic_mcp import rtsp
-from optic_mcp import hls
+# Core modules are exposed here for backwards compatibility. They are
+# resolved on first attribute access so that importing the package
+# (e.g. optic_mcp.server) does not load OpenCV up front.
+_LAZY_SUBMODULES = ("usb", "rtsp", "hls")
 
-# New modules are NOT auto-imported to avoid requiring dependencies
+# New modules are NOT exposed here to avoid requiring dependencies
 # at import time. Users can import them directly:
 #   from optic_mcp import mjpeg
 #   from optic_mcp import screen
@@ -15,3 +17,10 @@ from optic_mcp import hls
 #   from optic_mcp import decode (requires libzbar)
 
 __all__ = ["usb", "rtsp", "hls"]
+
+
+def __getattr__(name: str):
+    """Import core submodules lazily on first access."""
+    if name in _LAZY_SUBMODULES:
+        return importlib.import_module(f"optic_mcp.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,8 +5,10 @@ histograms, and dominant colors from images. All operations follow
 the token-efficient design - returning only metadata, never raw image data.
 """
 
+import base64
 import os
-from typing import Dict, Any, List, Optional
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
 
 import cv2
 import numpy as np
@@ -15,6 +17,16 @@ from PIL.ExifTags import TAGS
 
 from optic_mcp.validation import validate_file_path, ALLOWED_IMAGE_EXTENSIONS
 
+# Number of per-file results kept by each analysis cache. Entries are keyed by
+# (path, (mtime_ns, size)) so an edited file is always re-read.
+ANALYSIS_CACHE_SIZE = 512
+
+# get_dominant_colors works on a copy downscaled to at most this size
+DOMINANT_COLORS_MAX_DIM = 256
+
+# Bits kept per channel when binning colors (5 bits = 32 levels, 32^3 bins)
+DOMINANT_COLORS_BITS = 5
+
 
 def _validate_input_file(file_path: str) -> str:
     """
@@ -51,6 +63,20 @@ def _validate_input_file(file_path: str) -> str:
     return abs_path
 
 
+def _stat_key(abs_path: str) -> Tuple[int, int]:
+    """
+    Return the (st_mtime_ns, st_size) pair used to key the analysis caches.
+
+    Args:
+        abs_path: Validated absolute path to the image file.
+
+    Returns:
+        Tuple of modification time in nanoseconds and size in bytes.
+    """
+    st = os.stat(abs_path)
+    return (st.st_mtime_ns, st.st_size)
+
+
 def get_metadata(file_path: str) -> Dict[str, Any]:
     """
     Extract metadata from an image file including dimensions, format, and EXIF data.
@@ -75,7 +101,30 @@ def get_metadata(file_path: str) -> Dict[str, Any]:
         ValueError: If the file is not a valid image.
     """
     abs_path = _validate_input_file(file_path)
+    stat_key = _stat_key(abs_path)
+
+    result = _cached_metadata(abs_path, stat_key)
+    return {**result, "exif": dict(result["exif"])}
+
+
+@lru_cache(maxsize=ANALYSIS_CACHE_SIZE)
+def _cached_metadata(abs_path: str, stat_key: Tuple[int, int]) -> Dict[str, Any]:
+    """
+    Read image metadata, cached by file path, modification time, and size.
+
+    Callers must copy the result before returning it to avoid mutating the
+    cached entry.
+
+    Args:
+        abs_path: Validated absolute path to the image file.
+        stat_key: Tuple of the file's st_mtime_ns and st_size.
 
+    Returns:
+        Metadata dictionary as described in get_metadata.
+
+    Raises:
+        ValueError: If the file is not a valid image.
+    """
     try:
         with Image.open(abs_path) as img:
             width, height = img.size
@@ -103,14 +152,12 @@ def get_metadata(file_path: str) -> Dict[str, Any]:
                 # No EXIF data available
                 pass
 
-            file_size = os.path.getsize(abs_path)
-
             return {
                 "width": width,
                 "height": height,
                 "format": img_format,
                 "mode": mode,
-                "file_size_bytes": file_size,
+                "file_size_bytes": stat_key[1],
                 "exif": exif_data,
             }
 
@@ -143,6 +190,24 @@ def get_stats(file_path: str) -> Dict[str, Any]:
     """
     abs_path = _validate_input_file(file_path)
 
+    return dict(_cached_stats(abs_path, _stat_key(abs_path)))
+
+
+@lru_cache(maxsize=ANALYSIS_CACHE_SIZE)
+def _cached_stats(abs_path: str, stat_key: Tuple[int, int]) -> Dict[str, Any]:
+    """
+    Compute image statistics, cached by file path, modification time, and size.
+
+    Args:
+        abs_path: Validated absolute path to the image file.
+        stat_key: Tuple of the file's st_mtime_ns and st_size.
+
+    Returns:
+        Statistics dictionary as described in get_stats.
+
+    Raises:
+        ValueError: If the file is not a valid image.
+    """
     img = cv2.imread(abs_path)
     if img is None:
         raise ValueError(f"Failed to load image with OpenCV: {abs_path}")
@@ -186,7 +251,9 @@ def get_stats(file_path: str) -> Dict[str, Any]:
         del img
 
 
-def get_histogram(file_path: str, output_path: Optional[str] = None) -> Dict[str, Any]:
+def get_histogram(
+    file_path: str, output_path: Optional[str] = None, packed: bool = False
+) -> Dict[str, Any]:
     """
     Calculate color histogram for an image, optionally saving a visualization.
 
@@ -196,11 +263,17 @@ def get_histogram(file_path: str, output_path: Optional[str] = None) -> Dict[str
     Args:
         file_path: Path to the image file.
         output_path: Optional path to save histogram visualization.
+        packed: If True, return raw pixel counts as one base64 buffer instead
+                of three lists of normalized values.
 
     Returns:
         Dictionary containing:
         - channels: Dictionary with 'r', 'g', 'b' keys, each containing
                    list of 256 bin values (normalized to 0-1)
+        - channels_b64, shape, dtype, order, total_pixels: Instead of
+          channels when packed is True. channels_b64 is a little-endian
+          uint32 array of pixel counts with shape [3, 256], rows in 'rgb'
+          order, readable with numpy.frombuffer(...).reshape(shape).
         - output_path: Path to saved visualization (if output_path provided)
 
     Raises:
@@ -212,88 +285,128 @@ def get_histogram(file_path: str, output_path: Optional[str] = None) -> Dict[str
     if output_path:
         output_path = validate_file_path(output_path)
 
-    img = cv2.imread(abs_path)
-    if img is None:
-        raise ValueError(f"Failed to load image with OpenCV: {abs_path}")
-
-    try:
-        # Calculate histograms for each channel
-        hist_b = cv2.calcHist([img], [0], None, [256], [0, 256]).flatten()
-        hist_g = cv2.calcHist([img], [1], None, [256], [0, 256]).flatten()
-        hist_r = cv2.calcHist([img], [2], None, [256], [0, 256]).flatten()
-
-        # Normalize to 0-1 range
-        total_pixels = img.shape[0] * img.shape[1]
-        hist_b_norm = (hist_b / total_pixels).tolist()
-        hist_g_norm = (hist_g / total_pixels).tolist()
-        hist_r_norm = (hist_r / total_pixels).tolist()
-
-        result: Dict[str, Any] = {
+    hist_b, hist_g, hist_r, total_pixels = _cached_histogram(abs_path, _stat_key(abs_path))
+
+    result: Dict[str, Any]
+    if packed:
+        counts = np.stack([hist_r, hist_g, hist_b]).astype("<u4")
+        result = {
+            "channels_b64": base64.b64encode(counts.tobytes()).decode("ascii"),
+            "shape": list(counts.shape),
+            "dtype": "uint32",
+            "order": "rgb",
+            "total_pixels": total_pixels,
+        }
+    else:
+        # Normalize to 0-1 range, rounding whole arrays before converting to lists
+        result = {
             "channels": {
-                "r": [round(v, 6) for v in hist_r_norm],
-                "g": [round(v, 6) for v in hist_g_norm],
-                "b": [round(v, 6) for v in hist_b_norm],
+                "r": np.round(hist_r / total_pixels, 6).tolist(),
+                "g": np.round(hist_g / total_pixels, 6).tolist(),
+                "b": np.round(hist_b / total_pixels, 6).tolist(),
             }
         }
 
-        # Save visualization if requested
-        if output_path:
-            # Create histogram visualization using OpenCV
-            hist_height = 300
-            hist_width = 512
-            hist_img = np.zeros((hist_height, hist_width, 3), dtype=np.uint8)
-
-            # Find max value for scaling
-            max_val = max(hist_r.max(), hist_g.max(), hist_b.max())
-            if max_val == 0:
-                max_val = 1
-
-            # Draw histograms
-            bin_width = hist_width // 256
-            for i in range(256):
-                # Blue channel
-                h_b = int(hist_b[i] * hist_height / max_val)
-                cv2.line(
-                    hist_img,
-                    (i * bin_width, hist_height),
-                    (i * bin_width, hist_height - h_b),
-                    (255, 0, 0),
-                    1,
-                )
-                # Green channel
-                h_g = int(hist_g[i] * hist_height / max_val)
-                cv2.line(
-                    hist_img,
-                    (i * bin_width, hist_height),
-                    (i * bin_width, hist_height - h_g),
-                    (0, 255, 0),
-                    1,
-                )
-                # Red channel
-                h_r = int(hist_r[i] * hist_height / max_val)
-                cv2.line(
-                    hist_img,
-                    (i * bin_width, hist_height),
-                    (i * bin_width, hist_height - h_r),
-                    (0, 0, 255),
-                    1,
-                )
+    # Save visualization if requested
+    if output_path:
+        # Create histogram visualization using OpenCV
+        hist_height = 300
+        hist_width = 512
+        hist_img = np.zeros((hist_height, hist_width, 3), dtype=np.uint8)
+
+        # Find max value for scaling
+        max_val = max(hist_r.max(), hist_g.max(), hist_b.max())
+        if max_val == 0:
+            max_val = 1
+
+        # Draw histograms
+        bin_width = hist_width // 256
+        for i in range(256):
+            # Blue channel
+            h_b = int(hist_b[i] * hist_height / max_val)
+            cv2.line(
+                hist_img,
+                (i * bin_width, hist_height),
+                (i * bin_width, hist_height - h_b),
+                (255, 0, 0),
+                1,
+            )
+            # Green channel
+            h_g = int(hist_g[i] * hist_height / max_val)
+            cv2.line(
+                hist_img,
+                (i * bin_width, hist_height),
+                (i * bin_width, hist_height - h_g),
+                (0, 255, 0),
+                1,
+            )
+            # Red channel
+            h_r = int(hist_r[i] * hist_height / max_val)
+            cv2.line(
+                hist_img,
+                (i * bin_width, hist_height),
+                (i * bin_width, hist_height - h_r),
+                (0, 0, 255),
+                1,
+            )
+
+        cv2.imwrite(output_path, hist_img)
+        result["output_path"] = output_path
+
+    return result
 
-            cv2.imwrite(output_path, hist_img)
-            result["output_path"] = output_path
 
-        return result
+@lru_cache(maxsize=ANALYSIS_CACHE_SIZE)
+def _cached_histogram(
+    abs_path: str, stat_key: Tuple[int, int]
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, int]:
+    """
+    Compute raw per-channel histograms, cached by file path, modification time, and size.
+
+    The returned arrays are read-only since they are shared between calls.
+
+    Args:
+        abs_path: Validated absolute path to the image file.
+        stat_key: Tuple of the file's st_mtime_ns and st_size.
+
+    Returns:
+        Tuple of (hist_b, hist_g, hist_r, total_pixels), each histogram a
+        256-bin float32 array of pixel counts.
+
+    Raises:
+        ValueError: If the file is not a valid image.
+    """
+    img = cv2.imread(abs_path)
+    if img is None:
+        raise ValueError(f"Failed to load image with OpenCV: {abs_path}")
+
+    try:
+        hists = []
+        for channel in range(3):
+            hist = cv2.calcHist([img], [channel], None, [256], [0, 256]).flatten()
+            hist.flags.writeable = False
+            hists.append(hist)
+
+        return hists[0], hists[1], hists[2], img.shape[0] * img.shape[1]
 
     finally:
         del img
 
 
+def clear_analysis_cache() -> None:
+    """Drops cached metadata, statistics, and histograms for all files."""
+    _cached_metadata.cache_clear()
+    _cached_stats.cache_clear()
+    _cached_histogram.cache_clear()
+
+
 def get_dominant_colors(file_path: str, num_colors: int = 5) -> Dict[str, Any]:
     """
-    Extract dominant colors from an image using K-means clustering.
+    Extract dominant colors from an image using a quantized color histogram.
 
-    Analyzes the image and identifies the most prevalent colors.
-    Returns colors sorted by prevalence (most common first).
+    Pixels are binned by their top DOMINANT_COLORS_BITS bits per channel and
+    the most populated bins are returned, each as the mean color of the
+    pixels in it. Returns colors sorted by prevalence (most common first).
 
     Args:
         file_path: Path to the image file.
@@ -301,7 +414,8 @@ def get_dominant_colors(file_path: str, num_colors: int = 5) -> Dict[str, Any]:
 
     Returns:
         Dictionary containing:
-        - colors: List of color dictionaries, each with:
+        - colors: List of up to num_colors color dictionaries (fewer if the
+          image has fewer distinct colors), each with:
             - rgb: [r, g, b] values (0-255)
             - hex: Hex color code (e.g., "#FF5733")
             - percentage: Percentage of image this color represents
@@ -323,40 +437,42 @@ def get_dominant_colors(file_path: str, num_colors: int = 5) -> Dict[str, Any]:
         # Convert to RGB (OpenCV loads as BGR)
         img_rgb = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
 
-        # Resize for faster processing (max 100x100)
+        # Resize for faster processing
         h, w = img_rgb.shape[:2]
-        max_dim = 100
-        if max(h, w) > max_dim:
-            scale = max_dim / max(h, w)
-            new_size = (int(w * scale), int(h * scale))
+        if max(h, w) > DOMINANT_COLORS_MAX_DIM:
+            scale = DOMINANT_COLORS_MAX_DIM / max(h, w)
+            new_size = (max(1, int(w * scale)), max(1, int(h * scale)))
             img_rgb = cv2.resize(img_rgb, new_size, interpolation=cv2.INTER_AREA)
 
-        # Reshape to list of pixels
-        pixels = img_rgb.reshape(-1, 3).astype(np.float32)
-
-        # K-means clustering
-        criteria = (cv2.TERM_CRITERIA_EPS + cv2.TERM_CRITERIA_MAX_ITER, 100, 0.2)
-        _, labels, centers = cv2.kmeans(
-            pixels, num_colors, None, criteria, 10, cv2.KMEANS_RANDOM_CENTERS
+        # Bin each pixel by the high bits of its channels
+        pixels = img_rgb.reshape(-1, 3)
+        bits = DOMINANT_COLORS_BITS
+        quantized = (pixels >> (8 - bits)).astype(np.intp)
+        bins = (quantized[:, 0] << (2 * bits)) | (quantized[:, 1] << bits) | quantized[:, 2]
+        num_bins = 1 << (3 * bits)
+        counts = np.bincount(bins, minlength=num_bins)
+
+        # Most populated bins, most common first
+        k = min(num_colors, int(np.count_nonzero(counts)))
+        top = np.argpartition(counts, -k)[-k:]
+        top = top[np.argsort(counts[top])[::-1]]
+
+        # Mean color of the pixels in each selected bin
+        sums = np.stack(
+            [np.bincount(bins, weights=pixels[:, c], minlength=num_bins)[top] for c in range(3)],
+            axis=1,
         )
-
-        # Calculate percentage for each color
-        label_counts = np.bincount(labels.flatten(), minlength=num_colors)
-        total_pixels = len(labels)
-        percentages = (label_counts / total_pixels * 100).tolist()
-
-        # Sort by percentage (descending)
-        sorted_indices = np.argsort(percentages)[::-1]
+        means = np.rint(sums / counts[top, None]).astype(int)
+        percentages = counts[top] / len(bins) * 100
 
         colors: List[Dict[str, Any]] = []
-        for idx in sorted_indices:
-            r, g, b = [int(c) for c in centers[idx]]
+        for (r, g, b), percentage in zip(means.tolist(), percentages.tolist()):
             hex_color = f"#{r:02X}{g:02X}{b:02X}"
             colors.append(
                 {
                     "rgb": [r, g, b],
                     "hex": hex_color,
-                    "percentage": round(percentages[idx], 2),
+                    "percentage": round(percentage, 2),
                 }
             )
 
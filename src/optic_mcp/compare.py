@@ -5,14 +5,25 @@ differences, and changes. Useful for change detection, duplicate finding,
 and visual testing. All operations follow the token-efficient design.
 """
 
+import filecmp
 import os
-from typing import Dict, Any
+from functools import lru_cache
+from typing import Dict, Any, List, Tuple
 
 import cv2
 import numpy as np
 
 from optic_mcp.validation import validate_file_path, ALLOWED_IMAGE_EXTENSIONS
 
+# Maximum number of images accepted by the batch comparison functions
+MAX_BATCH_IMAGES = 50
+
+# Hash distance at or below which two images are considered similar
+HASH_SIMILARITY_THRESHOLD = 10
+
+# Number of (file, hash_type) results kept by the perceptual hash cache
+HASH_CACHE_SIZE = 512
+
 
 def _validate_input_file(file_path: str) -> str:
     """
@@ -223,7 +234,7 @@ def compare_hash(file_path_1: str, file_path_2: str, hash_type: str = "phash") -
         - hash_1: Hash string of first image
         - hash_2: Hash string of second image
         - distance: Hamming distance between hashes (0 = identical)
-        - is_similar: True if distance <= 10 (typical threshold)
+        - is_similar: True if distance <= HASH_SIMILARITY_THRESHOLD (10)
         - hash_type: The hash type used
 
     Raises:
@@ -247,7 +258,7 @@ def compare_hash(file_path_1: str, file_path_2: str, hash_type: str = "phash") -
         "hash_1": hash1,
         "hash_2": hash2,
         "distance": distance,
-        "is_similar": distance <= 10,
+        "is_similar": distance <= HASH_SIMILARITY_THRESHOLD,
         "hash_type": hash_type,
     }
 
@@ -257,7 +268,8 @@ def get_hash(file_path: str, hash_type: str = "phash") -> Dict[str, Any]:
     Calculate perceptual hash for a single image.
 
     Generates a compact hash string that represents the image content.
-    Images with similar content will have similar hash values.
+    Images with similar content will have similar hash values. Hashes are
+    cached until the file's modification time or size changes.
 
     Args:
         file_path: Path to the image file.
@@ -277,7 +289,34 @@ def get_hash(file_path: str, hash_type: str = "phash") -> Dict[str, Any]:
         raise ValueError(f"Invalid hash_type: '{hash_type}'. Must be one of {valid_hash_types}")
 
     abs_path = _validate_input_file(file_path)
+    st = os.stat(abs_path)
+
+    return {
+        "hash": _cached_hash(abs_path, (st.st_mtime_ns, st.st_size), hash_type),
+        "hash_type": hash_type,
+    }
+
+
+@lru_cache(maxsize=HASH_CACHE_SIZE)
+def _cached_hash(abs_path: str, stat_key: Tuple[int, int], hash_type: str) -> str:
+    """
+    Compute the perceptual hash of an image file.
+
+    Results are cached by (path, (mtime_ns, size), hash_type), so repeated
+    calls on an unchanged file skip decoding it. stat_key is only part of the
+    cache key; a modified file gets a new key and is hashed again.
+
+    Args:
+        abs_path: Validated absolute path to the image file.
+        stat_key: Tuple of the file's st_mtime_ns and st_size.
+        hash_type: Type of hash to use ('phash', 'dhash', 'ahash').
+
+    Returns:
+        The hash string (hexadecimal).
 
+    Raises:
+        ValueError: If the file is not a valid image.
+    """
     img = cv2.imread(abs_path, cv2.IMREAD_GRAYSCALE)
     if img is None:
         raise ValueError(f"Failed to load image: {abs_path}")
@@ -314,15 +353,170 @@ def get_hash(file_path: str, hash_type: str = "phash") -> Dict[str, Any]:
         hex_len = len(hash_bits) // 4
         hash_str = format(hash_int, f"0{hex_len}x")
 
-        return {
-            "hash": hash_str,
-            "hash_type": hash_type,
-        }
+        return hash_str
 
     finally:
         del img
 
 
+def clear_hash_cache() -> None:
+    """Drops all cached perceptual hashes."""
+    _cached_hash.cache_clear()
+
+
+def _validate_batch(file_paths: List[str]) -> List[str]:
+    """
+    Validate a list of input image paths for batch comparison.
+
+    Args:
+        file_paths: List of image paths.
+
+    Returns:
+        List of validated absolute file paths.
+
+    Raises:
+        ValueError: If the list is empty, too long, or contains invalid paths.
+        FileNotFoundError: If any image file doesn't exist.
+    """
+    if not isinstance(file_paths, list) or not file_paths:
+        raise ValueError("file_paths must be a non-empty list of image paths")
+
+    if len(file_paths) > MAX_BATCH_IMAGES:
+        raise ValueError(f"At most {MAX_BATCH_IMAGES} images can be compared per batch")
+
+    return [_validate_input_file(path) for path in file_paths]
+
+
+def compare_hash_batch(file_paths: List[str], hash_type: str = "phash") -> Dict[str, Any]:
+    """
+    Compare every pair in a list of images using perceptual hashing.
+
+    Each image is hashed once, then all pairwise distances are computed
+    together. Distances use the same metric as compare_hash (number of
+    differing hex digits), so results match calling compare_hash per pair.
+
+    Args:
+        file_paths: List of image paths (1 to MAX_BATCH_IMAGES).
+        hash_type: Type of hash to use ('phash', 'dhash', 'ahash').
+
+    Returns:
+        Dictionary containing:
+        - hashes: Hash string for each image, in input order
+        - distances: N x N matrix of hash distances (0 = identical)
+        - similar_pairs: List of [i, j] index pairs (i < j) with
+          distance <= HASH_SIMILARITY_THRESHOLD
+        - hash_type: The hash type used
+
+    Raises:
+        FileNotFoundError: If any image file doesn't exist.
+        ValueError: If the list or hash_type is invalid, or an image can't be loaded.
+    """
+    paths = _validate_batch(file_paths)
+    hashes = [get_hash(path, hash_type)["hash"] for path in paths]
+
+    # One row of hex digits per hash; compare all rows against each other at once
+    digits = np.array([list(h) for h in hashes])
+    distances = (digits[:, None, :] != digits[None, :, :]).sum(axis=2)
+
+    rows, cols = np.nonzero(np.triu(distances <= HASH_SIMILARITY_THRESHOLD, k=1))
+
+    return {
+        "hashes": hashes,
+        "distances": distances.tolist(),
+        "similar_pairs": [[int(i), int(j)] for i, j in zip(rows, cols)],
+        "hash_type": hash_type,
+    }
+
+
+def compare_mse_batch(file_paths: List[str]) -> Dict[str, Any]:
+    """
+    Compare every pair in a list of images using Mean Squared Error (MSE).
+
+    Each image is loaded and converted to grayscale once. Images whose size
+    differs from the first image are resized to match it.
+
+    Args:
+        file_paths: List of image paths (1 to MAX_BATCH_IMAGES).
+
+    Returns:
+        Dictionary containing:
+        - mse: N x N matrix of MSE values (0 = identical)
+        - normalized_mse: N x N matrix of MSE divided by max possible (0-1)
+        - identical_pairs: List of [i, j] index pairs (i < j) with MSE of 0
+
+    Raises:
+        FileNotFoundError: If any image file doesn't exist.
+        ValueError: If the list is invalid or an image can't be loaded.
+    """
+    paths = _validate_batch(file_paths)
+
+    grays = []
+    size = None
+    for path in paths:
+        img = cv2.imread(path)
+        if img is None:
+            raise ValueError(f"Failed to load image: {path}")
+        if size is None:
+            size = (img.shape[1], img.shape[0])
+        elif (img.shape[1], img.shape[0]) != size:
+            img = cv2.resize(img, size)
+        grays.append(cv2.cvtColor(img, cv2.COLOR_BGR2GRAY))
+
+    n = len(grays)
+    total_pixels = size[0] * size[1]
+    mse = np.zeros((n, n), dtype=np.float64)
+    for i in range(n):
+        for j in range(i + 1, n):
+            # Sum of squared differences, computed exactly in C without temporaries
+            mse[i, j] = mse[j, i] = cv2.norm(grays[i], grays[j], cv2.NORM_L2SQR) / total_pixels
+
+    rows, cols = np.nonzero(np.triu(mse == 0, k=1))
+
+    return {
+        "mse": np.round(mse, 4).tolist(),
+        "normalized_mse": np.round(mse / 65025.0, 6).tolist(),
+        "identical_pairs": [[int(i), int(j)] for i, j in zip(rows, cols)],
+    }
+
+
+def _same_content(path1: str, path2: str) -> bool:
+    """
+    Check whether two files hold byte-identical content without decoding them.
+
+    Args:
+        path1: Validated path to the first file.
+        path2: Validated path to the second file.
+
+    Returns:
+        True if both paths are the same file or their bytes are equal.
+    """
+    if os.path.samefile(path1, path2):
+        return True
+    # Compares sizes first and only reads the files if they match
+    return filecmp.cmp(path1, path2, shallow=False)
+
+
+def _save_unchanged(source_path: str, output_path: str) -> None:
+    """
+    Write the diff output for identical inputs: the decoded input, re-encoded.
+
+    The input is decoded like on the normal diff path, so corrupt files are
+    still rejected and the output is always an 8-bit BGR image without the
+    input's metadata. Only one image has to be decoded, not two.
+
+    Args:
+        source_path: Validated path to the input image.
+        output_path: Validated path to save the diff visualization.
+
+    Raises:
+        ValueError: If the input is not a readable image.
+    """
+    img = cv2.imread(source_path)
+    if img is None:
+        raise ValueError(f"Failed to load image: {source_path}")
+    cv2.imwrite(output_path, img)
+
+
 def image_diff(
     file_path_1: str, file_path_2: str, output_path: str, threshold: int = 30
 ) -> Dict[str, Any]:
@@ -330,7 +524,9 @@ def image_diff(
     Create a visual diff highlighting differences between two images.
 
     Generates an output image where different regions are highlighted.
-    Useful for spotting changes between versions of an image.
+    Useful for spotting changes between versions of an image. Byte-identical
+    inputs are detected before decoding, so only the second image is decoded
+    to write the (unmarked) diff.
 
     Args:
         file_path_1: Path to the first (reference) image.
@@ -353,7 +549,19 @@ def image_diff(
         raise ValueError("Threshold must be an integer between 0 and 255")
 
     output_path = validate_file_path(output_path)
-    img1, img2, gray1, gray2 = _load_and_prepare_images(file_path_1, file_path_2)
+
+    path1 = _validate_input_file(file_path_1)
+    path2 = _validate_input_file(file_path_2)
+    if _same_content(path1, path2):
+        _save_unchanged(path2, output_path)
+        return {
+            "status": "success",
+            "output_path": output_path,
+            "diff_percentage": 0.0,
+            "diff_pixels": 0,
+        }
+
+    img1, img2, gray1, gray2 = _load_and_prepare_images(path1, path2)
 
     try:
         # Calculate absolute difference
@@ -38,6 +38,32 @@ SYMBOL_TYPE_NAMES = {
 }
 
 
+# All barcode types except QR
+BARCODE_SYMBOLS = [
+    ZBarSymbol.EAN13,
+    ZBarSymbol.EAN8,
+    ZBarSymbol.UPCA,
+    ZBarSymbol.UPCE,
+    ZBarSymbol.ISBN10,
+    ZBarSymbol.ISBN13,
+    ZBarSymbol.I25,
+    ZBarSymbol.CODE39,
+    ZBarSymbol.CODE93,
+    ZBarSymbol.CODE128,
+    ZBarSymbol.PDF417,
+    ZBarSymbol.DATABAR,
+    ZBarSymbol.DATABAR_EXP,
+    ZBarSymbol.CODABAR,
+]
+
+# Symbol filter for each decode_codes kind (None decodes every type)
+DECODE_KINDS = {
+    "qr": [ZBarSymbol.QRCODE],
+    "barcode": BARCODE_SYMBOLS,
+    "all": None,
+}
+
+
 def _decode_symbols(image, symbols: Optional[List[ZBarSymbol]] = None) -> List[Dict]:
     """
     Internal helper to decode symbols from an image.
@@ -90,28 +116,32 @@ def _decode_symbols(image, symbols: Optional[List[ZBarSymbol]] = None) -> List[D
     return results
 
 
-def decode_qr(file_path: str) -> Dict:
+def decode_codes(file_path: str, kind: str = "all") -> Dict:
     """
-    Decodes QR codes from an image file.
-    Only detects QR codes, ignores other barcode types.
+    Decodes QR codes and/or barcodes from an image file.
 
     Args:
         file_path: Path to the image file to decode.
+        kind: Which codes to look for: 'qr', 'barcode' (every type except QR),
+            or 'all'.
 
     Returns:
         Dictionary with decode results:
-            - found: True if QR codes were found
-            - count: number of QR codes found
-            - codes: list of decoded QR codes, each with:
+            - found: True if any codes were found
+            - count: number of codes found
+            - codes: list of decoded codes, each with:
                 - data: decoded string content
-                - type: always "QRCODE"
+                - type: code type (QRCODE, EAN13, CODE128, etc.)
                 - rect: bounding box {x, y, width, height}
                 - polygon: list of corner points [{x, y}, ...]
 
     Raises:
-        ValueError: If file_path is invalid.
+        ValueError: If file_path or kind is invalid.
         RuntimeError: If image cannot be read.
     """
+    if kind not in DECODE_KINDS:
+        raise ValueError(f"Invalid kind: '{kind}'. Must be one of {list(DECODE_KINDS)}")
+
     # Validate file path for reading (not writing)
     # We don't need to validate directory for reading, just check file exists
     if not file_path or not isinstance(file_path, str):
@@ -122,8 +152,7 @@ def decode_qr(file_path: str) -> Dict:
     if image is None:
         raise RuntimeError(f"Could not read image from {file_path}")
 
-    # Decode QR codes only
-    results = _decode_symbols(image, symbols=[ZBarSymbol.QRCODE])
+    results = _decode_symbols(image, symbols=DECODE_KINDS[kind])
 
     return {
         "found": len(results) > 0,
@@ -132,6 +161,31 @@ def decode_qr(file_path: str) -> Dict:
     }
 
 
+def decode_qr(file_path: str) -> Dict:
+    """
+    Decodes QR codes from an image file.
+    Only detects QR codes, ignores other barcode types.
+
+    Args:
+        file_path: Path to the image file to decode.
+
+    Returns:
+        Dictionary with decode results:
+            - found: True if QR codes were found
+            - count: number of QR codes found
+            - codes: list of decoded QR codes, each with:
+                - data: decoded string content
+                - type: always "QRCODE"
+                - rect: bounding box {x, y, width, height}
+                - polygon: list of corner points [{x, y}, ...]
+
+    Raises:
+        ValueError: If file_path is invalid.
+        RuntimeError: If image cannot be read.
+    """
+    return decode_codes(file_path, kind="qr")
+
+
 def decode_barcode(file_path: str) -> Dict:
     """
     Decodes barcodes from an image file.
@@ -155,38 +209,7 @@ def decode_barcode(file_path: str) -> Dict:
         ValueError: If file_path is invalid.
         RuntimeError: If image cannot be read.
     """
-    if not file_path or not isinstance(file_path, str):
-        raise ValueError("File path must be a non-empty string")
-
-    image = cv2.imread(file_path)
-    if image is None:
-        raise RuntimeError(f"Could not read image from {file_path}")
-
-    # Decode all barcode types except QR
-    barcode_symbols = [
-        ZBarSymbol.EAN13,
-        ZBarSymbol.EAN8,
-        ZBarSymbol.UPCA,
-        ZBarSymbol.UPCE,
-        ZBarSymbol.ISBN10,
-        ZBarSymbol.ISBN13,
-        ZBarSymbol.I25,
-        ZBarSymbol.CODE39,
-        ZBarSymbol.CODE93,
-        ZBarSymbol.CODE128,
-        ZBarSymbol.PDF417,
-        ZBarSymbol.DATABAR,
-        ZBarSymbol.DATABAR_EXP,
-        ZBarSymbol.CODABAR,
-    ]
-
-    results = _decode_symbols(image, symbols=barcode_symbols)
-
-    return {
-        "found": len(results) > 0,
-        "count": len(results),
-        "codes": results,
-    }
+    return decode_codes(file_path, kind="barcode")
 
 
 def decode_all(file_path: str) -> Dict:
@@ -211,21 +234,7 @@ def decode_all(file_path: str) -> Dict:
         ValueError: If file_path is invalid.
         RuntimeError: If image cannot be read.
     """
-    if not file_path or not isinstance(file_path, str):
-        raise ValueError("File path must be a non-empty string")
-
-    image = cv2.imread(file_path)
-    if image is None:
-        raise RuntimeError(f"Could not read image from {file_path}")
-
-    # Decode all symbol types
-    results = _decode_symbols(image, symbols=None)
-
-    return {
-        "found": len(results) > 0,
-        "count": len(results),
-        "codes": results,
-    }
+    return decode_codes(file_path, kind="all")
 
 
 def decode_and_annotate(
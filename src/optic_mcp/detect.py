@@ -5,13 +5,19 @@ Uses OpenCV's built-in detectors (Haar cascades, DNN). No external ML frameworks
 """
 
 import os
-from typing import Dict, Any, List
+import threading
+from functools import lru_cache
+from typing import Dict, Any, List, Optional
 
 import cv2
 import numpy as np
 
 from optic_mcp.validation import validate_file_path, ALLOWED_IMAGE_EXTENSIONS
 
+# cv2.dnn.Net keeps its input blob as state, so a shared net must not run
+# setInput()/forward() from two threads at once.
+_DNN_LOCK = threading.Lock()
+
 
 def _validate_input_file(file_path: str) -> str:
     """
@@ -47,6 +53,69 @@ def _validate_input_file(file_path: str) -> str:
     return abs_path
 
 
+@lru_cache(maxsize=1)
+def _load_haar() -> "cv2.CascadeClassifier":
+    """
+    Load the frontal face Haar cascade once and reuse it across calls.
+
+    Returns:
+        Shared CascadeClassifier (alt2 is more accurate for real faces).
+    """
+    return cv2.CascadeClassifier(cv2.data.haarcascades + "haarcascade_frontalface_alt2.xml")
+
+
+@lru_cache(maxsize=1)
+def _load_face_dnn() -> Optional["cv2.dnn.Net"]:
+    """
+    Load the ResNet SSD face detector once and reuse it across calls.
+
+    Returns:
+        Shared cv2.dnn.Net, or None if the model files are not installed.
+    """
+    model_path = cv2.data.haarcascades + "../dnn/deploy.prototxt"
+    weights_path = cv2.data.haarcascades + "../dnn/res10_300x300_ssd_iter_140000.caffemodel"
+
+    if os.path.exists(model_path) and os.path.exists(weights_path):
+        return cv2.dnn.readNetFromCaffe(model_path, weights_path)
+    return None
+
+
+@lru_cache(maxsize=1)
+def _load_object_dnn() -> Optional["cv2.dnn.Net"]:
+    """
+    Load the MobileNet SSD object detector once and reuse it across calls.
+
+    Returns:
+        Shared cv2.dnn.Net, or None if the model files are not installed.
+    """
+    # These paths are common locations for OpenCV DNN models
+    model_paths = [
+        (
+            cv2.data.haarcascades + "../dnn/MobileNetSSD_deploy.prototxt",
+            cv2.data.haarcascades + "../dnn/MobileNetSSD_deploy.caffemodel",
+        ),
+    ]
+
+    for prototxt, caffemodel in model_paths:
+        if os.path.exists(prototxt) and os.path.exists(caffemodel):
+            return cv2.dnn.readNetFromCaffe(prototxt, caffemodel)
+    return None
+
+
+def prewarm_models() -> None:
+    """
+    Load the face and object detection models ahead of the first request.
+
+    Model loading errors are ignored here; they surface (or fall back) when
+    a detection tool actually runs.
+    """
+    for loader in (_load_haar, _load_face_dnn, _load_object_dnn):
+        try:
+            loader()
+        except cv2.error:
+            pass
+
+
 def detect_faces(file_path: str, method: str = "haar") -> Dict[str, Any]:
     """
     Detect faces in an image using Haar cascades or DNN.
@@ -83,9 +152,7 @@ def detect_faces(file_path: str, method: str = "haar") -> Dict[str, Any]:
         faces: List[Dict[str, Any]] = []
 
         if method == "haar":
-            # Use Haar cascade classifier - alt2 is more accurate for real faces
-            cascade_path = cv2.data.haarcascades + "haarcascade_frontalface_alt2.xml"
-            face_cascade = cv2.CascadeClassifier(cascade_path)
+            face_cascade = _load_haar()
 
             # Calculate minimum face size based on image dimensions
             # Minimum 60px, or 5% of smallest dimension
@@ -136,19 +203,16 @@ def detect_faces(file_path: str, method: str = "haar") -> Dict[str, Any]:
             # Use DNN face detector (more accurate but requires model files)
             # Fall back to Haar if DNN models not available
             try:
-                model_path = cv2.data.haarcascades + "../dnn/deploy.prototxt"
-                weights_path = (
-                    cv2.data.haarcascades + "../dnn/res10_300x300_ssd_iter_140000.caffemodel"
-                )
+                net = _load_face_dnn()
 
-                if os.path.exists(model_path) and os.path.exists(weights_path):
-                    net = cv2.dnn.readNetFromCaffe(model_path, weights_path)
+                if net is not None:
                     h, w = img.shape[:2]
                     blob = cv2.dnn.blobFromImage(
                         cv2.resize(img, (300, 300)), 1.0, (300, 300), (104.0, 177.0, 123.0)
                     )
-                    net.setInput(blob)
-                    detections = net.forward()
+                    with _DNN_LOCK:
+                        net.setInput(blob)
+                        detections = net.forward()
 
                     for i in range(detections.shape[2]):
                         confidence = detections[0, 0, i, 2]
@@ -448,19 +512,7 @@ def detect_objects(file_path: str, confidence_threshold: float = 0.5) -> Dict[st
 
     try:
         # Try to load MobileNet SSD model
-        # These paths are common locations for OpenCV DNN models
-        model_paths = [
-            (
-                cv2.data.haarcascades + "../dnn/MobileNetSSD_deploy.prototxt",
-                cv2.data.haarcascades + "../dnn/MobileNetSSD_deploy.caffemodel",
-            ),
-        ]
-
-        net = None
-        for prototxt, caffemodel in model_paths:
-            if os.path.exists(prototxt) and os.path.exists(caffemodel):
-                net = cv2.dnn.readNetFromCaffe(prototxt, caffemodel)
-                break
+        net = _load_object_dnn()
 
         if net is None:
             # Model not available, return empty result
@@ -473,8 +525,9 @@ def detect_objects(file_path: str, confidence_threshold: float = 0.5) -> Dict[st
 
         h, w = img.shape[:2]
         blob = cv2.dnn.blobFromImage(cv2.resize(img, (300, 300)), 0.007843, (300, 300), 127.5)
-        net.setInput(blob)
-        detections = net.forward()
+        with _DNN_LOCK:
+            net.setInput(blob)
+            detections = net.forward()
 
         objects: List[Dict[str, Any]] = []
         for i in range(detections.shape[2]):
@@ -0,0 +1,149 @@
+"""FFmpeg capture opening and options shared by the RTSP and HLS modules.
+
+OpenCV's FFmpeg backend runs avformat_find_stream_info() inside the
+VideoCapture constructor, reading up to probesize bytes / analyzeduration of
+media before open() returns. The only way to tune that, or any other FFmpeg
+demuxer/protocol option, from Python is the OPENCV_FFMPEG_CAPTURE_OPTIONS
+environment variable, which OpenCV reads on every open.
+"""
+
+import os
+import threading
+from contextlib import contextmanager
+from typing import Optional
+
+import cv2
+
+CAPTURE_OPTIONS_ENV = "OPENCV_FFMPEG_CAPTURE_OPTIONS"
+
+# Minimal stream probing: 32 KiB / 0.5 s instead of FFmpeg's 5 MB / 5 s
+# defaults. Enough to open the stream, but fps and codec may be unknown.
+QUICK_PROBE_OPTIONS = "probesize;32768|analyzeduration;500000"
+
+# OpenCV only defaults RTSP to TCP transport when the environment variable is
+# unset, so every RTSP option set has to ask for it explicitly.
+RTSP_TRANSPORT_OPTIONS = "rtsp_transport;tcp"
+
+# Send small RTSP requests immediately and hand packets to the decoder without
+# reordering delay or demuxer buffering, so the first frame arrives sooner.
+RTSP_LOW_LATENCY_OPTIONS = "tcp_nodelay;1|max_delay;0|fflags;nobuffer"
+
+# Reuse one HTTP connection for the playlist and segments, reconnect instead
+# of failing on a dropped segment request, and disable Nagle's algorithm.
+HLS_LOW_LATENCY_OPTIONS = "http_persistent;1|reconnect;1|tcp_nodelay;1"
+
+# The environment is process-wide: opens that need the same options share it,
+# opens that need different options wait until it is released. "" (OpenCV's
+# defaults) counts as an option set of its own, and so does a variable the
+# user set: every open then runs with it, so all of them may share it.
+_options_condition = threading.Condition()
+_active_options: Optional[str] = None
+_active_opens = 0
+_user_options_active = False
+
+
+@contextmanager
+def capture_options(options: str):
+    """
+    Open FFmpeg captures inside this block with the given options.
+
+    Leaves the environment untouched if options is empty or the user already
+    set OPENCV_FFMPEG_CAPTURE_OPTIONS themselves. Such opens still hold the
+    variable, so opens with other options wait until they are done.
+
+    Args:
+        options: FFmpeg options in OpenCV's "key;value|key;value" format.
+    """
+    global _active_options, _active_opens, _user_options_active
+
+    with _options_condition:
+        _options_condition.wait_for(
+            lambda: _active_opens == 0 or _user_options_active or _active_options == options
+        )
+        if _active_opens == 0:
+            _user_options_active = CAPTURE_OPTIONS_ENV in os.environ
+            if options and not _user_options_active:
+                os.environ[CAPTURE_OPTIONS_ENV] = options
+            _active_options = options
+        _active_opens += 1
+
+    try:
+        yield
+    finally:
+        with _options_condition:
+            _active_opens -= 1
+            if _active_opens == 0:
+                if _active_options and not _user_options_active:
+                    os.environ.pop(CAPTURE_OPTIONS_ENV, None)
+                _active_options = None
+                _user_options_active = False
+                _options_condition.notify_all()
+
+
+def open_capture(url: str, timeout_seconds: int, options: str) -> cv2.VideoCapture:
+    """
+    Open an FFmpeg capture with the given options and timeouts.
+
+    The timeouts are passed to the constructor because FFmpeg connects and
+    probes the stream inside it; setting them afterwards has no effect on
+    the open.
+
+    Args:
+        url: Validated stream URL.
+        timeout_seconds: Open and read timeout in seconds.
+        options: FFmpeg options for capture_options.
+
+    Returns:
+        VideoCapture for the stream (check isOpened() before use).
+    """
+    timeout_ms = timeout_seconds * 1000
+    params = [
+        cv2.CAP_PROP_OPEN_TIMEOUT_MSEC,
+        timeout_ms,
+        cv2.CAP_PROP_READ_TIMEOUT_MSEC,
+        timeout_ms,
+    ]
+    with capture_options(options):
+        return cv2.VideoCapture(url, cv2.CAP_FFMPEG, params)
+
+
+def join_options(*options: str) -> str:
+    """Join FFmpeg option strings, skipping empty ones."""
+    return "|".join(option for option in options if option)
+
+
+def rtsp_options(low_latency: bool = True, quick: bool = False) -> str:
+    """
+    Build capture options for an RTSP open.
+
+    Args:
+        low_latency: Include RTSP_LOW_LATENCY_OPTIONS.
+        quick: Include QUICK_PROBE_OPTIONS.
+
+    Returns:
+        Option string, or "" to leave OpenCV's defaults untouched.
+    """
+    if not (low_latency or quick):
+        return ""
+    return join_options(
+        RTSP_TRANSPORT_OPTIONS,
+        RTSP_LOW_LATENCY_OPTIONS if low_latency else "",
+        QUICK_PROBE_OPTIONS if quick else "",
+    )
+
+
+def hls_options(low_latency: bool = True, quick: bool = False) -> str:
+    """
+    Build capture options for an HLS open.
+
+    Args:
+        low_latency: Include HLS_LOW_LATENCY_OPTIONS.
+        quick: Include QUICK_PROBE_OPTIONS.
+
+    Returns:
+        Option string, or "" to leave OpenCV's defaults untouched.
+    """
+    return join_options(
+        HLS_LOW_LATENCY_OPTIONS if low_latency else "",
+        QUICK_PROBE_OPTIONS if quick else "",
+    )
@@ -2,6 +2,7 @@
 
 import cv2
 
+from optic_mcp.ffmpeg import open_capture, hls_options
 from optic_mcp.validation import (
     validate_file_path,
     validate_timeout,
@@ -10,7 +11,9 @@ from optic_mcp.validation import (
 )
 
 
-def save_image(hls_url: str, file_path: str, timeout_seconds: int = 30) -> str:
+def save_image(
+    hls_url: str, file_path: str, timeout_seconds: int = 30, low_latency: bool = True
+) -> str:
     """
     Captures a frame from an HLS stream and saves it to the given file path.
     Returns a success message with the file path.
@@ -20,6 +23,8 @@ def save_image(hls_url: str, file_path: str, timeout_seconds: int = 30) -> str:
         file_path: The path where the image will be saved. Must be in an allowed
                    directory and have a valid image extension.
         timeout_seconds: Connection timeout in seconds (default: 30, max: 300)
+        low_latency: Open the stream with FFmpeg's low-latency options
+            (HLS_LOW_LATENCY_OPTIONS) so the first frame arrives sooner.
 
     Returns:
         Success message with file path.
@@ -41,10 +46,7 @@ def save_image(hls_url: str, file_path: str, timeout_seconds: int = 30) -> str:
     # Use sanitized URL for error messages to avoid credential exposure
     safe_url = sanitize_url_for_display(validated_url)
 
-    cap = cv2.VideoCapture(validated_url, cv2.CAP_FFMPEG)
-
-    cap.set(cv2.CAP_PROP_OPEN_TIMEOUT_MSEC, validated_timeout * 1000)
-    cap.set(cv2.CAP_PROP_READ_TIMEOUT_MSEC, validated_timeout * 1000)
+    cap = open_capture(validated_url, validated_timeout, hls_options(low_latency))
     cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
 
     if not cap.isOpened():
@@ -66,7 +68,9 @@ def save_image(hls_url: str, file_path: str, timeout_seconds: int = 30) -> str:
         cap.release()
 
 
-def check_stream(hls_url: str, timeout_seconds: int = 30) -> dict:
+def check_stream(
+    hls_url: str, timeout_seconds: int = 30, quick: bool = False, low_latency: bool = True
+) -> dict:
     """
     Validates an HLS stream URL and returns stream information.
     Useful for testing connectivity before capturing images.
@@ -74,6 +78,10 @@ def check_stream(hls_url: str, timeout_seconds: int = 30) -> dict:
     Args:
         hls_url: The HLS stream URL to validate
         timeout_seconds: Connection timeout in seconds (default: 30, max: 300)
+        quick: If True, open the stream with minimal probing and check that a
+            frame arrives without converting it. Only status, url, and backend
+            are returned. Use when the stream's properties are already known.
+        low_latency: Open the stream with FFmpeg's low-latency options.
 
     Returns:
         Dictionary with stream status and properties including:
@@ -94,10 +102,7 @@ def check_stream(hls_url: str, timeout_seconds: int = 30) -> dict:
     # Use sanitized URL in responses to avoid credential exposure
     safe_url = sanitize_url_for_display(validated_url)
 
-    cap = cv2.VideoCapture(validated_url, cv2.CAP_FFMPEG)
-
-    cap.set(cv2.CAP_PROP_OPEN_TIMEOUT_MSEC, validated_timeout * 1000)
-    cap.set(cv2.CAP_PROP_READ_TIMEOUT_MSEC, validated_timeout * 1000)
+    cap = open_capture(validated_url, validated_timeout, hls_options(low_latency, quick))
 
     if not cap.isOpened():
         return {
@@ -107,7 +112,11 @@ def check_stream(hls_url: str, timeout_seconds: int = 30) -> dict:
         }
 
     try:
-        ret, _ = cap.read()
+        if quick:
+            # grab() skips the color conversion and copy done by retrieve()
+            ret = cap.grab()
+        else:
+            ret, _ = cap.read()
         if not ret:
             return {
                 "status": "unavailable",
@@ -115,6 +124,13 @@ def check_stream(hls_url: str, timeout_seconds: int = 30) -> dict:
                 "error": "Connected but could not read frame",
             }
 
+        if quick:
+            return {
+                "status": "available",
+                "url": safe_url,
+                "backend": cap.getBackendName(),
+            }
+
         width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
         height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
         fps = cap.get(cv2.CAP_PROP_FPS)
@@ -30,11 +30,39 @@ IMAGE_CONTENT_TYPES = {
     "image/x-tiff",
 }
 
+# Status codes meaning the server does not implement HEAD for this URL
+HEAD_NOT_SUPPORTED_CODES = {405, 501}
+
+
+def _content_size(response: requests.Response) -> int:
+    """
+    Get the full size of the resource behind a HEAD or ranged GET response.
+
+    Args:
+        response: Response to a HEAD request or a GET with a Range header.
+
+    Returns:
+        Size in bytes, or -1 if the server did not report it.
+    """
+    # A 206 reply's Content-Length is the range length; the total is after the '/'
+    content_range = response.headers.get("Content-Range", "")
+    if response.status_code == 206 and "/" in content_range:
+        total = content_range.rsplit("/", 1)[1]
+    else:
+        total = response.headers.get("Content-Length", "-1")
+
+    try:
+        return int(total)
+    except (ValueError, TypeError):
+        return -1
+
 
 def check_image(url: str, timeout_seconds: int = 10) -> Dict:
     """
     Validates an HTTP image URL using a HEAD request.
     Useful for checking image availability without downloading.
+    If the server rejects HEAD (405/501), a GET for the first byte only
+    is sent instead and the connection is closed before the body is read.
 
     Args:
         url: URL of the image (http:// or https://).
@@ -60,15 +88,20 @@ def check_image(url: str, timeout_seconds: int = 10) -> Dict:
             allow_redirects=True,
         )
 
-        content_type = response.headers.get("Content-Type", "unknown")
-        content_length = response.headers.get("Content-Length", "-1")
+        if response.status_code in HEAD_NOT_SUPPORTED_CODES:
+            response = requests.get(
+                url,
+                timeout=validated_timeout,
+                allow_redirects=True,
+                stream=True,
+                headers={"Range": "bytes=0-0"},
+            )
+            response.close()
 
-        try:
-            size_bytes = int(content_length)
-        except (ValueError, TypeError):
-            size_bytes = -1
+        content_type = response.headers.get("Content-Type", "unknown")
+        size_bytes = _content_size(response)
 
-        if response.status_code == 200:
+        if response.status_code in (200, 206):
             return {
                 "status": "available",
                 "url": sanitized_url,
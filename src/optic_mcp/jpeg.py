@@ -0,0 +1,126 @@
+"""JPEG encoding helpers.
+
+This module encodes frames to JPEG and writes them to disk. When the optional
+PyTurboJPEG package and the libjpeg-turbo library are installed (extra
+`[turbojpeg]`), frames are encoded with TurboJPEG; otherwise OpenCV is used.
+Encoded bytes are written with a single unbuffered os.write() so no Python
+file object or extra copy sits between the encoder and the kernel.
+"""
+
+import os
+from functools import lru_cache
+from typing import Optional, Union
+
+import cv2
+import numpy as np
+
+# Matches cv2.imwrite's default so output quality does not depend on the encoder
+DEFAULT_JPEG_QUALITY = 95
+
+# Both encoders are asked for 4:2:0 chroma subsampling explicitly: TurboJPEG
+# defaults to 4:2:2, and OpenCV's default depends on the build. 4:2:0 halves
+# the chroma blocks the DCT has to process compared to 4:2:2.
+OPENCV_JPEG_SUBSAMPLING = getattr(cv2, "IMWRITE_JPEG_SAMPLING_FACTOR_420", None)
+
+JPEG_EXTENSIONS = {".jpg", ".jpeg"}
+
+# os.open flags for image output; O_BINARY keeps Windows from translating newlines
+OUTPUT_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+
+@lru_cache(maxsize=1)
+def _get_turbojpeg():
+    """
+    Load a shared TurboJPEG encoder.
+
+    Returns:
+        TurboJPEG instance, or None if PyTurboJPEG or libjpeg-turbo is unavailable.
+    """
+    try:
+        from turbojpeg import TurboJPEG
+
+        return TurboJPEG()
+    except (ImportError, OSError, RuntimeError):
+        return None
+
+
+def turbojpeg_available() -> bool:
+    """Return True if frames will be encoded with libjpeg-turbo."""
+    return _get_turbojpeg() is not None
+
+
+def encode_jpeg(image: np.ndarray, quality: int = DEFAULT_JPEG_QUALITY) -> Union[bytes, np.ndarray]:
+    """
+    Encode a BGR or BGRA uint8 image as JPEG with 4:2:0 chroma subsampling.
+
+    Args:
+        image: Image array of shape (H, W, 3) BGR or (H, W, 4) BGRA.
+        quality: JPEG quality (1-100).
+
+    Returns:
+        Encoded JPEG as a bytes-like object (bytes from TurboJPEG, a uint8
+        numpy buffer from OpenCV). Both can be passed to os.write directly.
+
+    Raises:
+        RuntimeError: If encoding fails.
+    """
+    turbo = _get_turbojpeg()
+    if turbo is not None:
+        from turbojpeg import TJPF_BGR, TJPF_BGRA, TJSAMP_420
+
+        pixel_format = TJPF_BGRA if image.ndim == 3 and image.shape[2] == 4 else TJPF_BGR
+        return turbo.encode(
+            image, quality=quality, pixel_format=pixel_format, jpeg_subsample=TJSAMP_420
+        )
+
+    params = [cv2.IMWRITE_JPEG_QUALITY, quality]
+    if OPENCV_JPEG_SUBSAMPLING is not None:
+        # IMWRITE_JPEG_SAMPLING_FACTOR needs OpenCV 4.5.5+
+        params += [cv2.IMWRITE_JPEG_SAMPLING_FACTOR, OPENCV_JPEG_SUBSAMPLING]
+    ok, buffer = cv2.imencode(".jpg", image, params)
+    if not ok:
+        raise RuntimeError("Failed to encode image as JPEG")
+    return buffer
+
+
+def write_bytes(file_path: str, data: Union[bytes, np.ndarray]) -> int:
+    """
+    Write an encoded buffer to file_path with unbuffered os.write() calls.
+
+    Args:
+        file_path: Validated destination path.
+        data: Bytes-like object to write.
+
+    Returns:
+        Number of bytes written.
+    """
+    view = memoryview(data).cast("B")
+    total = len(view)
+    fd = os.open(file_path, OUTPUT_FLAGS, 0o644)
+    try:
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
+    return total
+
+
+def save_jpeg(file_path: str, image: np.ndarray, quality: Optional[int] = None) -> int:
+    """
+    Encode an image as JPEG and write it to file_path.
+
+    Args:
+        file_path: Validated destination path.
+        image: Image array of shape (H, W, 3) BGR or (H, W, 4) BGRA.
+        quality: JPEG quality (1-100), defaults to DEFAULT_JPEG_QUALITY.
+
+    Returns:
+        Size of the written file in bytes.
+
+    Raises:
+        RuntimeError: If encoding fails.
+    """
+    if quality is None:
+        quality = DEFAULT_JPEG_QUALITY
+    return write_bytes(file_path, encode_jpeg(image, quality))
@@ -6,7 +6,7 @@ surveillance systems.
 """
 
 import os
-from typing import Dict
+from typing import Dict, Iterable, Optional
 
 import requests
 
@@ -32,30 +32,50 @@ MJPEG_BOUNDARY_MARKERS = [
 JPEG_START = b"\xff\xd8"
 JPEG_END = b"\xff\xd9"
 
+# Status codes meaning the server does not implement HEAD for this URL
+HEAD_NOT_SUPPORTED_CODES = {405, 501}
 
-def _find_jpeg_frame(data: bytes) -> bytes:
+
+def _read_jpeg_frame(chunks: Iterable[bytes], max_bytes: int) -> Optional[bytes]:
     """
-    Extract first complete JPEG frame from data buffer.
+    Extract the first complete JPEG frame from a stream of byte chunks.
+
+    Chunks are appended to a single bytearray and each byte is scanned once:
+    every marker search resumes where the previous one stopped (one byte
+    earlier, in case a marker is split across two chunks).
 
     Args:
-        data: Raw bytes from MJPEG stream.
+        chunks: Byte chunks read from the MJPEG stream.
+        max_bytes: Give up once more than this many bytes have been read.
 
     Returns:
-        JPEG image bytes.
+        JPEG image bytes, or None if the stream ended before a complete frame.
 
     Raises:
-        ValueError: If no complete JPEG frame found.
+        ValueError: If no complete JPEG frame was found within max_bytes.
     """
-    start_idx = data.find(JPEG_START)
-    if start_idx == -1:
-        raise ValueError("No JPEG start marker found in stream data")
+    buffer = bytearray()
+    start = -1
+    scanned = 0
+
+    for chunk in chunks:
+        buffer += chunk
+        resume = max(scanned - 1, 0)
+
+        if start == -1:
+            start = buffer.find(JPEG_START, resume)
+
+        if start != -1:
+            end = buffer.find(JPEG_END, max(resume, start + 2))
+            if end != -1:
+                # Include the end marker (2 bytes)
+                return bytes(buffer[start : end + 2])
 
-    end_idx = data.find(JPEG_END, start_idx)
-    if end_idx == -1:
-        raise ValueError("No JPEG end marker found in stream data")
+        scanned = len(buffer)
+        if scanned > max_bytes:
+            raise ValueError(f"Could not find complete JPEG frame in first {max_bytes} bytes")
 
-    # Include the end marker (2 bytes)
-    return data[start_idx : end_idx + 2]
+    return None
 
 
 def check_stream(mjpeg_url: str, timeout_seconds: int = 10) -> Dict:
@@ -88,6 +108,16 @@ def check_stream(mjpeg_url: str, timeout_seconds: int = 10) -> Dict:
             allow_redirects=True,
         )
 
+        if response.status_code in HEAD_NOT_SUPPORTED_CODES:
+            # Server rejects HEAD; read only the response headers of a GET
+            response = requests.get(
+                mjpeg_url,
+                timeout=validated_timeout,
+                allow_redirects=True,
+                stream=True,
+            )
+            response.close()
+
         content_type = response.headers.get("Content-Type", "unknown")
 
         if response.status_code == 200:
@@ -109,6 +139,7 @@ def check_stream(mjpeg_url: str, timeout_seconds: int = 10) -> Dict:
                 response = requests.get(
                     mjpeg_url,
                     timeout=validated_timeout,
+                    allow_redirects=True,
                     stream=True,
                 )
                 content_type = response.headers.get("Content-Type", "unknown")
@@ -201,26 +232,14 @@ def save_image(mjpeg_url: str, file_path: str, timeout_seconds: int = 10) -> Dic
         # Most JPEG frames are under 500KB, read up to 2MB to be safe
         max_bytes = 2 * 1024 * 1024
         chunk_size = 4096
-        data = b""
-        jpeg_data = None
 
         try:
-            for chunk in response.iter_content(chunk_size=chunk_size):
-                data += chunk
-
-                # Try to find a complete JPEG frame
-                if JPEG_START in data and JPEG_END in data:
-                    try:
-                        jpeg_data = _find_jpeg_frame(data)
-                        break
-                    except ValueError:
-                        pass
-
-                if len(data) > max_bytes:
-                    raise RuntimeError(
-                        f"Could not find complete JPEG frame in first {max_bytes} bytes "
-                        f"of MJPEG stream at {sanitized_url}"
-                    )
+            jpeg_data = _read_jpeg_frame(response.iter_content(chunk_size=chunk_size), max_bytes)
+        except ValueError:
+            raise RuntimeError(
+                f"Could not find complete JPEG frame in first {max_bytes} bytes "
+                f"of MJPEG stream at {sanitized_url}"
+            )
         finally:
             response.close()
 
@@ -6,18 +6,118 @@ dashboards, or remote desktop scenarios.
 """
 
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List
 
+import cv2
 import mss
+import mss.exception
 import mss.tools
+import numpy as np
 
-from optic_mcp.validation import validate_file_path
+from optic_mcp.jpeg import JPEG_EXTENSIONS, OUTPUT_FLAGS, save_jpeg
+from optic_mcp.validation import validate_file_path, validate_file_paths
+
+# Monitor layout only changes on hotplug, so list_monitors results are cached
+# for a few seconds instead of opening mss on every call.
+MONITOR_CACHE_TTL_SECONDS = 5.0
+_monitor_cache: Dict = {"ts": 0.0, "data": None}
+
+# Upper bounds for save_images sequences
+MAX_SEQUENCE_FRAMES = 100
+MAX_SEQUENCE_INTERVAL_MS = 60_000
+# count * interval_ms may not exceed this, so one call can't hold a worker
+# thread (and the screen) for long
+MAX_SEQUENCE_DURATION_MS = 60_000
+
+# Write buffer for encoded output. PIL encoders write in small chunks; a large
+# buffer coalesces them into a few write() syscalls.
+OUTPUT_BUFFER_SIZE = 1 << 20
+
+
+def _bgra_array(screenshot) -> np.ndarray:
+    """
+    Wraps a screenshot's raw BGRA pixels as an (H, W, 4) uint8 array without copying.
+
+    Args:
+        screenshot: mss ScreenShot instance.
+
+    Returns:
+        Read-only numpy view over the screenshot's BGRA buffer.
+    """
+    return np.frombuffer(screenshot.bgra, dtype=np.uint8).reshape(
+        screenshot.height, screenshot.width, 4
+    )
+
+
+def _to_rgb(screenshot) -> np.ndarray:
+    """
+    Converts a screenshot to a contiguous (H, W, 3) RGB array.
+    Uses OpenCV's SIMD color conversion, which is much faster than mss's
+    byte-slicing ScreenShot.rgb property on large captures.
+
+    Args:
+        screenshot: mss ScreenShot instance.
+
+    Returns:
+        C-contiguous uint8 RGB array.
+    """
+    return cv2.cvtColor(_bgra_array(screenshot), cv2.COLOR_BGRA2RGB)
+
+
+def _open_output(file_path: str):
+    """
+    Opens file_path for writing with a single os.open() and a large write buffer.
+
+    Args:
+        file_path: Validated destination path.
+
+    Returns:
+        Binary file object wrapping the new file descriptor.
+    """
+    fd = os.open(file_path, OUTPUT_FLAGS, 0o644)
+    return os.fdopen(fd, "wb", buffering=OUTPUT_BUFFER_SIZE)
+
+
+def _write_image(screenshot, file_path: str) -> None:
+    """
+    Encodes a screenshot and writes it to file_path.
+    PNG output is encoded by mss in memory and written with a single write()
+    (mss's own file output issues several writes plus an fsync per image).
+    JPEG output is encoded straight from the raw BGRA buffer (TurboJPEG if
+    available, else OpenCV) and written with os.write(). Other formats are
+    encoded with PIL into a buffered file descriptor. Only the PNG and PIL
+    paths need an RGB conversion.
+
+    Args:
+        screenshot: mss ScreenShot instance to encode.
+        file_path: Validated destination path; its extension selects the format.
+    """
+    _, ext = os.path.splitext(file_path)
+    ext = ext.lower()
+
+    if ext in JPEG_EXTENSIONS:
+        save_jpeg(file_path, _bgra_array(screenshot))
+    elif ext == ".png":
+        rgb = memoryview(_to_rgb(screenshot)).cast("B")
+        png_bytes = mss.tools.to_png(rgb, screenshot.size)
+        with _open_output(file_path) as f:
+            f.write(png_bytes)
+    else:
+        from PIL import Image
+
+        image_format = Image.registered_extensions()[ext]
+        with _open_output(file_path) as f:
+            Image.fromarray(_to_rgb(screenshot)).save(f, format=image_format)
 
 
 def list_monitors() -> List[Dict]:
     """
     Lists all available monitors/displays connected to the system.
     Monitor 0 represents all monitors combined, monitor 1+ are individual displays.
+    Results are cached for MONITOR_CACHE_TTL_SECONDS; call clear_monitor_cache()
+    to force a re-scan after a hotplug.
 
     Returns:
         List of monitor dictionaries with:
@@ -28,6 +128,11 @@ def list_monitors() -> List[Dict]:
             - height: monitor height in pixels
             - primary: True if this is the primary monitor (always False for id=0)
     """
+    now = time.monotonic()
+    cached = _monitor_cache["data"]
+    if cached is not None and now - _monitor_cache["ts"] < MONITOR_CACHE_TTL_SECONDS:
+        return [dict(m) for m in cached]
+
     with mss.mss() as sct:
         monitors = []
         for i, monitor in enumerate(sct.monitors):
@@ -41,7 +146,16 @@ def list_monitors() -> List[Dict]:
                     "primary": i == 1,  # Monitor 1 is typically the primary
                 }
             )
-        return monitors
+
+    _monitor_cache["data"] = monitors
+    _monitor_cache["ts"] = now
+    return [dict(m) for m in monitors]
+
+
+def clear_monitor_cache() -> None:
+    """Drops the cached monitor list so the next list_monitors call re-queries mss."""
+    _monitor_cache["data"] = None
+    _monitor_cache["ts"] = 0.0
 
 
 def save_image(file_path: str, monitor: int = 0) -> Dict:
@@ -66,6 +180,7 @@ def save_image(file_path: str, monitor: int = 0) -> Dict:
     Raises:
         ValueError: If file_path is invalid or monitor index out of range.
         RuntimeError: If screenshot capture fails.
+        OSError: If the image cannot be written.
     """
     validated_path = validate_file_path(file_path)
 
@@ -82,31 +197,18 @@ def save_image(file_path: str, monitor: int = 0) -> Dict:
         try:
             # Capture the monitor
             screenshot = sct.grab(sct.monitors[monitor])
+        except mss.exception.ScreenShotError as e:
+            raise RuntimeError(f"Failed to capture screenshot: {e}") from e
 
-            # Determine output format from file extension
-            _, ext = os.path.splitext(validated_path)
-            ext = ext.lower()
-
-            # mss.tools.to_png can save to file
-            if ext == ".png":
-                mss.tools.to_png(screenshot.rgb, screenshot.size, output=validated_path)
-            else:
-                # For other formats, use PIL
-                from PIL import Image
-
-                img = Image.frombytes("RGB", screenshot.size, screenshot.rgb)
-                img.save(validated_path)
-
-            return {
-                "status": "success",
-                "file_path": validated_path,
-                "width": screenshot.width,
-                "height": screenshot.height,
-                "monitor": monitor,
-            }
+    _write_image(screenshot, validated_path)
 
-        except Exception as e:
-            raise RuntimeError(f"Failed to capture screenshot: {str(e)}")
+    return {
+        "status": "success",
+        "file_path": validated_path,
+        "width": screenshot.width,
+        "height": screenshot.height,
+        "monitor": monitor,
+    }
 
 
 def save_region(file_path: str, x: int, y: int, width: int, height: int) -> Dict:
@@ -133,6 +235,7 @@ def save_region(file_path: str, x: int, y: int, width: int, height: int) -> Dict
     Raises:
         ValueError: If file_path is invalid or region parameters are invalid.
         RuntimeError: If screenshot capture fails.
+        OSError: If the image cannot be written.
     """
     validated_path = validate_file_path(file_path)
 
@@ -146,34 +249,206 @@ def save_region(file_path: str, x: int, y: int, width: int, height: int) -> Dict
     if not isinstance(height, int) or height <= 0:
         raise ValueError(f"height must be a positive integer, got {height}")
 
+    # Define the region to capture
+    region = {"left": x, "top": y, "width": width, "height": height}
+
     with mss.mss() as sct:
         try:
-            # Define the region to capture
-            region = {"left": x, "top": y, "width": width, "height": height}
-
             # Capture the region
             screenshot = sct.grab(region)
+        except mss.exception.ScreenShotError as e:
+            raise RuntimeError(f"Failed to capture screen region: {e}") from e
+
+    _write_image(screenshot, validated_path)
+
+    return {
+        "status": "success",
+        "file_path": validated_path,
+        "width": screenshot.width,
+        "height": screenshot.height,
+        "region": {"x": x, "y": y, "width": width, "height": height},
+    }
+
+
+def _capture_monitor(monitor: int, file_path: str) -> Dict:
+    """
+    Captures a single monitor and saves it to file_path.
+    Runs in a worker thread, so it opens its own mss instance
+    (mss handles are not shareable across threads).
+
+    Args:
+        monitor: Monitor index to capture (1+).
+        file_path: Validated destination path.
+
+    Returns:
+        Dictionary with file_path, width, height, and monitor index.
+    """
+    with mss.mss() as sct:
+        screenshot = sct.grab(sct.monitors[monitor])
 
-            # Determine output format from file extension
-            _, ext = os.path.splitext(validated_path)
-            ext = ext.lower()
-
-            # Save the image
-            if ext == ".png":
-                mss.tools.to_png(screenshot.rgb, screenshot.size, output=validated_path)
-            else:
-                from PIL import Image
-
-                img = Image.frombytes("RGB", screenshot.size, screenshot.rgb)
-                img.save(validated_path)
-
-            return {
-                "status": "success",
-                "file_path": validated_path,
-                "width": screenshot.width,
-                "height": screenshot.height,
-                "region": {"x": x, "y": y, "width": width, "height": height},
-            }
-
-        except Exception as e:
-            raise RuntimeError(f"Failed to capture screen region: {str(e)}")
+    _write_image(screenshot, file_path)
+
+    return {
+        "file_path": file_path,
+        "width": screenshot.width,
+        "height": screenshot.height,
+        "monitor": monitor,
+    }
+
+
+def save_all_monitors(output_dir: str, extension: str = ".jpg") -> Dict:
+    """
+    Captures every individual monitor and saves each one to its own file.
+    Captures and encodes run in parallel (one worker per monitor, bounded by
+    CPU count) since the image encoders release the GIL.
+
+    Files are named monitor_<id><extension> inside output_dir.
+
+    Args:
+        output_dir: Directory where the images will be saved. Must be an
+            existing, allowed directory.
+        extension: Image extension to save as (.jpg, .png, etc.)
+
+    Returns:
+        Dictionary with capture result:
+            - status: 'success'
+            - count: number of monitors captured
+            - images: list of dicts with file_path, width, height, monitor
+
+    Raises:
+        ValueError: If output_dir or extension is invalid.
+        RuntimeError: If screenshot capture fails.
+        OSError: If the image cannot be written.
+    """
+    if not output_dir or not isinstance(output_dir, str):
+        raise ValueError("Output directory must be a non-empty string")
+
+    with mss.mss() as sct:
+        # Skip monitor 0 (all monitors combined)
+        monitor_ids = list(range(1, len(sct.monitors)))
+
+    if not monitor_ids:
+        raise RuntimeError("No monitors found")
+
+    file_paths = validate_file_paths(
+        [os.path.join(output_dir, f"monitor_{i}{extension}") for i in monitor_ids]
+    )
+
+    max_workers = min(len(monitor_ids), os.cpu_count() or 1)
+
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            images = list(executor.map(_capture_monitor, monitor_ids, file_paths))
+    except mss.exception.ScreenShotError as e:
+        raise RuntimeError(f"Failed to capture monitors: {e}") from e
+
+    return {
+        "status": "success",
+        "count": len(images),
+        "images": images,
+    }
+
+
+def _encode_frame(screenshot, file_path: str) -> Dict:
+    """
+    Encodes one frame of a save_images sequence. Runs on the encoder thread.
+
+    Args:
+        screenshot: mss ScreenShot instance to encode.
+        file_path: Validated destination path.
+
+    Returns:
+        Dictionary with file_path, width, and height.
+    """
+    _write_image(screenshot, file_path)
+
+    return {
+        "file_path": file_path,
+        "width": screenshot.width,
+        "height": screenshot.height,
+    }
+
+
+def save_images(path_template: str, count: int, interval_ms: int = 1000, monitor: int = 0) -> Dict:
+    """
+    Captures a timed sequence of screenshots of a monitor.
+    Each frame is encoded on a background thread while the next one is
+    grabbed, so a sequence takes about count * max(grab, encode) rather than
+    count * (grab + encode). At most one frame waits for encoding at a time.
+
+    Args:
+        path_template: Destination path containing an {index} placeholder,
+            e.g. /tmp/frame_{index}.jpg. Each resulting path must be in an
+            allowed directory and have a valid image extension.
+        count: Number of frames to capture (1 to MAX_SEQUENCE_FRAMES).
+        interval_ms: Time between the start of consecutive grabs in
+            milliseconds (0 to MAX_SEQUENCE_INTERVAL_MS). Frames are taken as
+            fast as possible if encoding is slower than the interval.
+            count * interval_ms may be at most MAX_SEQUENCE_DURATION_MS.
+        monitor: Monitor index to capture (0 = all monitors, 1+ = specific monitor).
+
+    Returns:
+        Dictionary with capture result:
+            - status: 'success'
+            - count: number of frames captured
+            - monitor: monitor index that was captured
+            - images: list of dicts with file_path, width, height
+
+    Raises:
+        ValueError: If any parameter is invalid or monitor index out of range.
+        RuntimeError: If screenshot capture fails.
+        OSError: If an image cannot be written.
+    """
+    if not isinstance(path_template, str) or "{index}" not in path_template:
+        raise ValueError("path_template must be a string containing '{index}'")
+    if not isinstance(count, int) or not 1 <= count <= MAX_SEQUENCE_FRAMES:
+        raise ValueError(f"count must be an integer between 1 and {MAX_SEQUENCE_FRAMES}")
+    if not isinstance(interval_ms, int) or not 0 <= interval_ms <= MAX_SEQUENCE_INTERVAL_MS:
+        raise ValueError(f"interval_ms must be an integer between 0 and {MAX_SEQUENCE_INTERVAL_MS}")
+    if count * interval_ms > MAX_SEQUENCE_DURATION_MS:
+        raise ValueError(
+            f"count * interval_ms must be at most {MAX_SEQUENCE_DURATION_MS} "
+            f"(a sequence may last {MAX_SEQUENCE_DURATION_MS // 1000} seconds), "
+            f"got {count * interval_ms}"
+        )
+    if not isinstance(monitor, int) or monitor < 0:
+        raise ValueError(f"Monitor must be a non-negative integer, got {monitor}")
+
+    file_paths = validate_file_paths(
+        [path_template.replace("{index}", str(i)) for i in range(count)]
+    )
+
+    images = []
+    pending = None
+
+    with mss.mss() as sct, ThreadPoolExecutor(max_workers=1) as encoder:
+        if monitor >= len(sct.monitors):
+            raise ValueError(
+                f"Invalid monitor index {monitor}. Available monitors: 0-{len(sct.monitors) - 1}"
+            )
+        region = sct.monitors[monitor]
+        start = time.monotonic()
+
+        for i, file_path in enumerate(file_paths):
+            delay = start + i * interval_ms / 1000.0 - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+
+            try:
+                screenshot = sct.grab(region)
+            except mss.exception.ScreenShotError as e:
+                raise RuntimeError(f"Failed to capture screenshot: {e}") from e
+
+            # Previous frame was encoding while this one was grabbed
+            if pending is not None:
+                images.append(pending.result())
+            pending = encoder.submit(_encode_frame, screenshot, file_path)
+
+        images.append(pending.result())
+
+    return {
+        "status": "success",
+        "count": len(images),
+        "monitor": monitor,
+        "images": images,
+    }
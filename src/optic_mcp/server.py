@@ -1,68 +1,145 @@
+import contextlib
+import ctypes
+import importlib
 import os
+import platform
+import sys
+import threading
+from typing import List, Optional
 
+import anyio.to_thread
+from mcp.server.fastmcp import FastMCP
 
-# Suppress OpenCV's stderr noise BEFORE importing cv2
-# This is critical for MCP stdio communication
+# OpenCV's runtime warnings (e.g. while probing camera indices) are not useful
+# to MCP clients; keep them quiet unless the user asks for them.
+os.environ.setdefault("OPENCV_LOG_LEVEL", "ERROR")
+
+# Serializes the fd 2 swap in _suppress_opencv_stderr across tool threads
+_IMPORT_LOCK = threading.Lock()
+
+
+@contextlib.contextmanager
 def _suppress_opencv_stderr():
-    """Redirect stderr to /dev/null at the OS level to silence OpenCV debug messages."""
-    original_stderr_fd = os.dup(2)
+    """
+    Redirect stderr to /dev/null at the OS level for the duration of the block.
+
+    Used only around the first import of cv2 so OpenCV's load-time messages
+    stay out of the MCP log, while later tracebacks still reach stderr.
+    """
+    sys.stderr.flush()
+    saved_fd = os.dup(2)
     devnull = os.open(os.devnull, os.O_WRONLY)
-    os.dup2(devnull, 2)
-    os.close(devnull)
-    return original_stderr_fd
+    try:
+        os.dup2(devnull, 2)
+        yield
+    finally:
+        os.dup2(saved_fd, 2)
+        os.close(saved_fd)
+        os.close(devnull)
+
+
+def _import_tool(name: str):
+    """
+    Import a tool module on first use, silencing stderr while it loads.
+
+    Tool modules (and with them cv2, numpy, PIL, mss) are imported lazily so
+    server startup only pays for the tools a client actually uses.
+
+    Args:
+        name: Module name inside the optic_mcp package (e.g. 'usb').
+
+    Returns:
+        The imported module.
+    """
+    # No unlocked sys.modules lookup: it could return a module another
+    # thread is still initializing. import_module waits for that import to
+    # finish and is cheap once the module is loaded.
+    with _IMPORT_LOCK:
+        if "cv2" in sys.modules:
+            return importlib.import_module(f"optic_mcp.{name}")
+        with _suppress_opencv_stderr():
+            return importlib.import_module(f"optic_mcp.{name}")
 
 
-# Suppress stderr before cv2 import
-_original_stderr = _suppress_opencv_stderr()
+# Shared library names dlopen'd directly when probing for libzbar
+_LIBZBAR_NAMES = {
+    "Linux": ("libzbar.so.0",),
+    "Darwin": ("libzbar.0.dylib", "libzbar.dylib"),
+}
 
-from mcp.server.fastmcp import FastMCP  # noqa: E402
 
-from optic_mcp import usb as usb  # noqa: E402
-from optic_mcp import rtsp as rtsp  # noqa: E402
-from optic_mcp import hls as hls  # noqa: E402
-from optic_mcp import stream as stream  # noqa: E402
-from optic_mcp import mjpeg as mjpeg  # noqa: E402
-from optic_mcp import screen as screen  # noqa: E402
-from optic_mcp import http_image as http_image  # noqa: E402
-from optic_mcp import analyze as analyze  # noqa: E402
-from optic_mcp import compare as compare  # noqa: E402
-from optic_mcp import detect as detect  # noqa: E402
+def _probe_libzbar() -> bool:
+    """
+    Check whether the decode tools can load the libzbar system library.
+
+    Loads libzbar by its shared library name first, which takes well under
+    a millisecond. Importing pyzbar instead runs ctypes.util.find_library,
+    which shells out on Linux. On other platforms, and for libraries outside
+    the default search path, falls back to importing pyzbar (not decode, so
+    the probe does not pull in cv2).
+
+    Returns:
+        True if libzbar can be loaded.
+    """
+    system = platform.system()
+    for name in _LIBZBAR_NAMES.get(system, ()):
+        try:
+            ctypes.CDLL(name)
+            return True
+        except OSError:
+            continue
 
-# decode module requires libzbar system library, import conditionally
-try:
-    from optic_mcp import decode as decode  # noqa: E402
+    if system == "Linux":
+        # pyzbar looks for the same soname, so its import would fail too
+        return False
 
-    DECODE_AVAILABLE = True
-except ImportError:
-    decode = None  # noqa: E402
-    DECODE_AVAILABLE = False
+    try:
+        import pyzbar.pyzbar  # noqa: F401
+    except Exception:
+        # A broken libzbar raises OSError rather than ImportError; either way
+        # only the decode tools are skipped, not the whole server
+        return False
+    return True
 
-# Initialize the MCP server
-mcp = FastMCP("optic-mcp")
+
+DECODE_AVAILABLE = _probe_libzbar()
+
+# URI template for reading tool output images as MCP resources
+IMAGE_RESOURCE_TEMPLATE = "optic://image/{path}"
+
+# Transports accepted via OPTIC_MCP_TRANSPORT (stdio is what MCP clients launch)
+SUPPORTED_TRANSPORTS = ("stdio", "streamable-http")
+
+# Initialize the MCP server. stateless_http lets several server processes
+# share streamable-HTTP traffic; it has no effect on stdio.
+mcp = FastMCP("optic-mcp", stateless_http=True)
 
 
 # USB Camera Tools
-@mcp.tool()
 def list_cameras():
     """
     Scans for available USB cameras connected to the system.
     Returns a list of available camera indices and their status.
     """
+    usb = _import_tool("usb")
+
     return usb.list_cameras()
 
 
-@mcp.tool()
 def save_image(file_path: str, camera_index: int = 0):
     """
     Captures a frame from the specified camera and saves it to the given file path.
     Returns a success message.
     """
+    usb = _import_tool("usb")
+
     return usb.save_image(file_path, camera_index)
 
 
 # RTSP Stream Tools
-@mcp.tool()
-def rtsp_save_image(rtsp_url: str, file_path: str, timeout_seconds: int = 10):
+def rtsp_save_image(
+    rtsp_url: str, file_path: str, timeout_seconds: int = 10, low_latency: bool = True
+):
     """
     Captures a frame from an RTSP stream and saves it to the given file path.
     Returns a success message with the file path.
@@ -72,12 +149,18 @@ def rtsp_save_image(rtsp_url: str, file_path: str, timeout_seconds: int = 10):
         - rtsp://username:password@ip:554/stream
         - rtsp://ip:554/cam/realmonitor?channel=1&subtype=0 (Dahua)
         - rtsp://ip:554/Streaming/Channels/101 (Hikvision)
+
+    low_latency (default True) opens the stream with FFmpeg's low-latency
+    options; set it to False if a camera misbehaves with them.
     """
-    return rtsp.save_image(rtsp_url, file_path, timeout_seconds)
+    rtsp = _import_tool("rtsp")
+
+    return rtsp.save_image(rtsp_url, file_path, timeout_seconds, low_latency)
 
 
-@mcp.tool()
-def rtsp_check_stream(rtsp_url: str, timeout_seconds: int = 10):
+def rtsp_check_stream(
+    rtsp_url: str, timeout_seconds: int = 10, quick: bool = False, low_latency: bool = True
+):
     """
     Validates an RTSP stream URL and returns stream information.
     Useful for testing connectivity before capturing images.
@@ -88,13 +171,19 @@ def rtsp_check_stream(rtsp_url: str, timeout_seconds: int = 10):
         - height: frame height in pixels
         - fps: frames per second
         - codec: video codec fourcc code
+
+    Set quick=True to only check that the stream opens and sends data, with
+    minimal probing; width, height, fps, and codec are then omitted.
     """
-    return rtsp.check_stream(rtsp_url, timeout_seconds)
+    rtsp = _import_tool("rtsp")
+
+    return rtsp.check_stream(rtsp_url, timeout_seconds, quick, low_latency)
 
 
 # HLS Stream Tools
-@mcp.tool()
-def hls_save_image(hls_url: str, file_path: str, timeout_seconds: int = 30):
+def hls_save_image(
+    hls_url: str, file_path: str, timeout_seconds: int = 30, low_latency: bool = True
+):
     """
     Captures a frame from an HLS stream and saves it to the given file path.
     Returns a success message with the file path.
@@ -106,12 +195,18 @@ def hls_save_image(hls_url: str, file_path: str, timeout_seconds: int = 30):
         - http://server/stream.m3u8
         - https://server/live/stream.m3u8
         - http://server/streams/{stream_id}/stream.m3u8
+
+    low_latency (default True) opens the stream with FFmpeg's low-latency
+    options; set it to False if a server misbehaves with them.
     """
-    return hls.save_image(hls_url, file_path, timeout_seconds)
+    hls = _import_tool("hls")
+
+    return hls.save_image(hls_url, file_path, timeout_seconds, low_latency)
 
 
-@mcp.tool()
-def hls_check_stream(hls_url: str, timeout_seconds: int = 30):
+def hls_check_stream(
+    hls_url: str, timeout_seconds: int = 30, quick: bool = False, low_latency: bool = True
+):
     """
     Validates an HLS stream URL and returns stream information.
     Useful for testing connectivity before capturing images.
@@ -122,13 +217,17 @@ def hls_check_stream(hls_url: str, timeout_seconds: int = 30):
         - height: frame height in pixels
         - fps: frames per second
         - codec: video codec fourcc code
+
+    Set quick=True to only check that the stream opens and sends data, with
+    minimal probing; width, height, fps, and codec are then omitted.
     """
-    return hls.check_stream(hls_url, timeout_seconds)
+    hls = _import_tool("hls")
+
+    return hls.check_stream(hls_url, timeout_seconds, quick, low_latency)
 
 
 # Camera Streaming Tools
-@mcp.tool()
-def start_stream(camera_index: int = 0, port: int = 8080):
+def start_stream(camera_index: int = 0, port: int = 8080, max_width: int = 1280):
     """
     Start streaming a camera to a localhost HTTP server.
 
@@ -138,14 +237,16 @@ def start_stream(camera_index: int = 0, port: int = 8080):
     Args:
         camera_index: The camera index to stream (default 0)
         port: The port to serve the stream on (default 8080)
+        max_width: Downscale wider frames to this width (default 1280, 0 = full resolution)
 
     Returns:
         Dictionary with stream URL and status
     """
-    return stream.start_stream(camera_index, port)
+    stream = _import_tool("stream")
+
+    return stream.start_stream(camera_index, port, max_width)
 
 
-@mcp.tool()
 def stop_stream(camera_index: int = 0):
     """
     Stop streaming a camera.
@@ -156,10 +257,11 @@ def stop_stream(camera_index: int = 0):
     Returns:
         Dictionary with status
     """
+    stream = _import_tool("stream")
+
     return stream.stop_stream(camera_index)
 
 
-@mcp.tool()
 def list_streams():
     """
     List all active camera streams.
@@ -167,10 +269,11 @@ def list_streams():
     Returns:
         List of active stream information including URLs and ports
     """
+    stream = _import_tool("stream")
+
     return stream.list_streams()
 
 
-@mcp.tool()
 def start_dashboard(port: int = 9000):
     """
     Start the multi-camera dashboard server.
@@ -185,10 +288,11 @@ def start_dashboard(port: int = 9000):
     Returns:
         Dictionary with dashboard URL and status
     """
+    stream = _import_tool("stream")
+
     return stream.start_dashboard(port)
 
 
-@mcp.tool()
 def stop_dashboard():
     """
     Stop the multi-camera dashboard server.
@@ -196,11 +300,12 @@ def stop_dashboard():
     Returns:
         Dictionary with status
     """
+    stream = _import_tool("stream")
+
     return stream.stop_dashboard()
 
 
 # MJPEG Stream Tools
-@mcp.tool()
 def mjpeg_save_image(mjpeg_url: str, file_path: str, timeout_seconds: int = 10):
     """
     Captures a frame from an MJPEG stream and saves it to the given file path.
@@ -221,10 +326,11 @@ def mjpeg_save_image(mjpeg_url: str, file_path: str, timeout_seconds: int = 10):
     Returns:
         Dictionary with status, file_path, and size_bytes
     """
+    mjpeg = _import_tool("mjpeg")
+
     return mjpeg.save_image(mjpeg_url, file_path, timeout_seconds)
 
 
-@mcp.tool()
 def mjpeg_check_stream(mjpeg_url: str, timeout_seconds: int = 10):
     """
     Validates an MJPEG stream URL and returns stream information.
@@ -237,11 +343,12 @@ def mjpeg_check_stream(mjpeg_url: str, timeout_seconds: int = 10):
     Returns:
         Dictionary with status, url (sanitized), content_type, and error if unavailable
     """
+    mjpeg = _import_tool("mjpeg")
+
     return mjpeg.check_stream(mjpeg_url, timeout_seconds)
 
 
 # Screen Capture Tools
-@mcp.tool()
 def screen_list_monitors():
     """
     Lists all available monitors/displays connected to the system.
@@ -250,11 +357,12 @@ def screen_list_monitors():
     Returns:
         List of monitors with id, left, top, width, height, and primary flag
     """
+    screen = _import_tool("screen")
+
     return screen.list_monitors()
 
 
-@mcp.tool()
-def screen_save_image(file_path: str, monitor: int = 0):
+async def screen_save_image(file_path: str, monitor: int = 0):
     """
     Captures full screenshot of specified monitor and saves to file.
     Monitor 0 captures all monitors combined into one image.
@@ -267,11 +375,12 @@ def screen_save_image(file_path: str, monitor: int = 0):
     Returns:
         Dictionary with status, file_path, width, height, and monitor index
     """
-    return screen.save_image(file_path, monitor)
+    screen = _import_tool("screen")
 
+    return await anyio.to_thread.run_sync(screen.save_image, file_path, monitor)
 
-@mcp.tool()
-def screen_save_region(file_path: str, x: int, y: int, width: int, height: int):
+
+async def screen_save_region(file_path: str, x: int, y: int, width: int, height: int):
     """
     Captures a specific region of the screen and saves to file.
     Coordinates are absolute screen coordinates (0,0 is top-left of primary monitor).
@@ -286,11 +395,54 @@ def screen_save_region(file_path: str, x: int, y: int, width: int, height: int):
     Returns:
         Dictionary with status, file_path, width, height, and region details
     """
-    return screen.save_region(file_path, x, y, width, height)
+    screen = _import_tool("screen")
+
+    return await anyio.to_thread.run_sync(screen.save_region, file_path, x, y, width, height)
+
+
+async def screen_save_all_monitors(output_dir: str, extension: str = ".jpg"):
+    """
+    Captures every individual monitor in parallel and saves each to its own file.
+    Files are named monitor_<id><extension> inside output_dir.
+
+    Args:
+        output_dir: Directory where the images will be saved
+        extension: Image extension to save as (default .jpg)
+
+    Returns:
+        Dictionary with status, count, and images list (file_path, width, height, monitor)
+    """
+    screen = _import_tool("screen")
+
+    return await anyio.to_thread.run_sync(screen.save_all_monitors, output_dir, extension)
+
+
+async def screen_save_images(
+    path_template: str, count: int, interval_ms: int = 1000, monitor: int = 0
+):
+    """
+    Captures a timed sequence of screenshots of a monitor.
+    Each frame is encoded while the next one is grabbed.
+
+    Args:
+        path_template: Destination path with an {index} placeholder
+            (e.g. /tmp/frame_{index}.jpg)
+        count: Number of frames to capture (1-100)
+        interval_ms: Milliseconds between grabs (default 1000); count * interval_ms
+            may be at most 60000
+        monitor: Monitor index to capture (0 = all monitors, 1+ = specific monitor)
+
+    Returns:
+        Dictionary with status, count, monitor, and images list (file_path, width, height)
+    """
+    screen = _import_tool("screen")
+
+    return await anyio.to_thread.run_sync(
+        screen.save_images, path_template, count, interval_ms, monitor
+    )
 
 
 # HTTP Image Tools
-@mcp.tool()
 def http_save_image(url: str, file_path: str, timeout_seconds: int = 30):
     """
     Downloads image from URL and saves to the given file path.
@@ -304,10 +456,11 @@ def http_save_image(url: str, file_path: str, timeout_seconds: int = 30):
     Returns:
         Dictionary with status, file_path, size_bytes, and content_type
     """
+    http_image = _import_tool("http_image")
+
     return http_image.save_image(url, file_path, timeout_seconds)
 
 
-@mcp.tool()
 def http_check_image(url: str, timeout_seconds: int = 10):
     """
     Validates an HTTP image URL using a HEAD request.
@@ -320,76 +473,48 @@ def http_check_image(url: str, timeout_seconds: int = 10):
     Returns:
         Dictionary with status, url (sanitized), content_type, size_bytes, and error if unavailable
     """
+    http_image = _import_tool("http_image")
+
     return http_image.check_image(url, timeout_seconds)
 
 
 # QR/Barcode Decode Tools (requires libzbar system library)
-if DECODE_AVAILABLE:
-
-    @mcp.tool()
-    def decode_qr(file_path: str):
-        """
-        Decodes QR codes from an image file.
-        Only detects QR codes, ignores other barcode types.
-
-        Args:
-            file_path: Path to the image file to decode
-
-        Returns:
-            Dictionary with found (bool), count, and codes list containing
-            data, type, rect (bounding box), and polygon (corner points)
-        """
-        return decode.decode_qr(file_path)
-
-    @mcp.tool()
-    def decode_barcode(file_path: str):
-        """
-        Decodes barcodes from an image file.
-        Detects common barcode formats: EAN, UPC, Code128, Code39, etc.
-        Does NOT detect QR codes (use decode_qr for that).
-
-        Args:
-            file_path: Path to the image file to decode
-
-        Returns:
-            Dictionary with found (bool), count, and codes list containing
-            data, type (EAN13, CODE128, etc.), rect, and polygon
-        """
-        return decode.decode_barcode(file_path)
-
-    @mcp.tool()
-    def decode_all(file_path: str):
-        """
-        Decodes all supported code types from an image file.
-        Detects both QR codes and all barcode formats.
-
-        Args:
-            file_path: Path to the image file to decode
-
-        Returns:
-            Dictionary with found (bool), count, and codes list containing
-            data, type (QRCODE, EAN13, CODE128, etc.), rect, and polygon
-        """
-        return decode.decode_all(file_path)
-
-    @mcp.tool()
-    def decode_and_annotate(file_path: str, output_path: str):
-        """
-        Decodes all codes from an image and saves annotated image with bounding boxes.
-        Each detected code is outlined and labeled with its type and data.
-
-        Args:
-            file_path: Path to the input image file
-            output_path: Path where annotated image will be saved
-
-        Returns:
-            Dictionary with found, count, output_path, and codes list
-        """
-        return decode.decode_and_annotate(file_path, output_path)
+def decode_codes(file_path: str, kind: str = "all"):
+    """
+    Decodes QR codes and/or barcodes from an image file.
+
+    Args:
+        file_path: Path to the image file to decode
+        kind: Which codes to look for - 'qr', 'barcode' (EAN, UPC, Code128,
+            Code39, etc.; excludes QR), or 'all' (default)
+
+    Returns:
+        Dictionary with found (bool), count, and codes list containing
+        data, type (QRCODE, EAN13, CODE128, etc.), rect, and polygon
+    """
+    decode = _import_tool("decode")
+
+    return decode.decode_codes(file_path, kind)
+
+
+def decode_and_annotate(file_path: str, output_path: str):
+    """
+    Decodes all codes from an image and saves annotated image with bounding boxes.
+    Each detected code is outlined and labeled with its type and data.
+
+    Args:
+        file_path: Path to the input image file
+        output_path: Path where annotated image will be saved
+
+    Returns:
+        Dictionary with found, count, output_path, and codes list
+    """
+    decode = _import_tool("decode")
+
+    return decode.decode_and_annotate(file_path, output_path)
 
 
 # Image Analysis Tools
-@mcp.tool()
 def image_get_metadata(file_path: str):
     """
     Extract metadata from an image file including dimensions, format, and EXIF data.
@@ -402,10 +527,11 @@ def image_get_metadata(file_path: str):
     Returns:
         Dictionary with width, height, format, mode, file_size_bytes, and exif dict
     """
+    analyze = _import_tool("analyze")
+
     return analyze.get_metadata(file_path)
 
 
-@mcp.tool()
 def image_get_stats(file_path: str):
     """
     Calculate basic image statistics including brightness, contrast, and sharpness.
@@ -421,11 +547,12 @@ def image_get_stats(file_path: str):
     Returns:
         Dictionary with brightness, contrast, sharpness, and is_grayscale
     """
+    analyze = _import_tool("analyze")
+
     return analyze.get_stats(file_path)
 
 
-@mcp.tool()
-def image_get_histogram(file_path: str, output_path: str = None):
+def image_get_histogram(file_path: str, output_path: str = None, packed: bool = False):
     """
     Calculate color histogram for an image, optionally saving a visualization.
 
@@ -434,19 +561,23 @@ def image_get_histogram(file_path: str, output_path: str = None):
     Args:
         file_path: Path to the image file
         output_path: Optional path to save histogram visualization image
+        packed: Return raw counts as one base64 uint32 buffer (channels_b64,
+                shape [3, 256], 'rgb' row order) for programmatic clients
 
     Returns:
         Dictionary with channels (r, g, b arrays of 256 values each), and output_path if provided
     """
-    return analyze.get_histogram(file_path, output_path)
+    analyze = _import_tool("analyze")
+
+    return analyze.get_histogram(file_path, output_path, packed)
 
 
-@mcp.tool()
 def image_get_dominant_colors(file_path: str, num_colors: int = 5):
     """
-    Extract dominant colors from an image using K-means clustering.
+    Extract dominant colors from an image using a quantized color histogram.
 
     Identifies the most prevalent colors in the image, sorted by prevalence.
+    Returns fewer than num_colors entries if the image has fewer distinct colors.
 
     Args:
         file_path: Path to the image file
@@ -455,11 +586,12 @@ def image_get_dominant_colors(file_path: str, num_colors: int = 5):
     Returns:
         Dictionary with colors list, each containing rgb [r,g,b], hex code, and percentage
     """
+    analyze = _import_tool("analyze")
+
     return analyze.get_dominant_colors(file_path, num_colors)
 
 
 # Image Comparison Tools
-@mcp.tool()
 def image_compare_ssim(file_path_1: str, file_path_2: str, threshold: float = 0.95):
     """
     Compare two images using Structural Similarity Index (SSIM).
@@ -475,10 +607,11 @@ def image_compare_ssim(file_path_1: str, file_path_2: str, threshold: float = 0.
     Returns:
         Dictionary with ssim_score, is_similar, and threshold
     """
+    compare = _import_tool("compare")
+
     return compare.compare_ssim(file_path_1, file_path_2, threshold)
 
 
-@mcp.tool()
 def image_compare_mse(file_path_1: str, file_path_2: str):
     """
     Compare two images using Mean Squared Error (MSE).
@@ -493,10 +626,11 @@ def image_compare_mse(file_path_1: str, file_path_2: str):
     Returns:
         Dictionary with mse, is_identical, and normalized_mse (0-1 range)
     """
+    compare = _import_tool("compare")
+
     return compare.compare_mse(file_path_1, file_path_2)
 
 
-@mcp.tool()
 def image_compare_hash(file_path_1: str, file_path_2: str, hash_type: str = "phash"):
     """
     Compare two images using perceptual hashing.
@@ -517,10 +651,11 @@ def image_compare_hash(file_path_1: str, file_path_2: str, hash_type: str = "pha
     Returns:
         Dictionary with hash_1, hash_2, distance, is_similar, and hash_type
     """
+    compare = _import_tool("compare")
+
     return compare.compare_hash(file_path_1, file_path_2, hash_type)
 
 
-@mcp.tool()
 def image_get_hash(file_path: str, hash_type: str = "phash"):
     """
     Calculate perceptual hash for a single image.
@@ -535,10 +670,49 @@ def image_get_hash(file_path: str, hash_type: str = "phash"):
     Returns:
         Dictionary with hash (hex string) and hash_type
     """
+    compare = _import_tool("compare")
+
     return compare.get_hash(file_path, hash_type)
 
 
-@mcp.tool()
+async def image_compare_hash_batch(file_paths: List[str], hash_type: str = "phash"):
+    """
+    Compare every pair in a list of images using perceptual hashing.
+
+    Each image is hashed once and all pairwise distances are returned in a
+    single call. Prefer this over repeated image_compare_hash calls when
+    comparing more than two images.
+
+    Args:
+        file_paths: List of image paths (up to 50)
+        hash_type: Type of hash ('phash', 'dhash', 'ahash')
+
+    Returns:
+        Dictionary with hashes, distances (N x N matrix), similar_pairs, and hash_type
+    """
+    compare = _import_tool("compare")
+
+    return await anyio.to_thread.run_sync(compare.compare_hash_batch, file_paths, hash_type)
+
+
+async def image_compare_mse_batch(file_paths: List[str]):
+    """
+    Compare every pair in a list of images using Mean Squared Error (MSE).
+
+    Each image is loaded once and all pairwise MSE values are returned in a
+    single call. Images are resized to the size of the first image.
+
+    Args:
+        file_paths: List of image paths (up to 50)
+
+    Returns:
+        Dictionary with mse and normalized_mse (N x N matrices) and identical_pairs
+    """
+    compare = _import_tool("compare")
+
+    return await anyio.to_thread.run_sync(compare.compare_mse_batch, file_paths)
+
+
 def image_diff(file_path_1: str, file_path_2: str, output_path: str, threshold: int = 30):
     """
     Create a visual diff highlighting differences between two images.
@@ -555,10 +729,11 @@ def image_diff(file_path_1: str, file_path_2: str, output_path: str, threshold:
     Returns:
         Dictionary with status, output_path, diff_percentage, and diff_pixels
     """
+    compare = _import_tool("compare")
+
     return compare.image_diff(file_path_1, file_path_2, output_path, threshold)
 
 
-@mcp.tool()
 def image_compare_histograms(file_path_1: str, file_path_2: str, method: str = "correlation"):
     """
     Compare two images by their color histograms.
@@ -580,49 +755,38 @@ def image_compare_histograms(file_path_1: str, file_path_2: str, method: str = "
     Returns:
         Dictionary with score, method, and is_similar
     """
+    compare = _import_tool("compare")
+
     return compare.compare_histograms(file_path_1, file_path_2, method)
 
 
 # Detection Tools
-@mcp.tool()
-def detect_faces(file_path: str, method: str = "haar"):
+def detect_faces(file_path: str, method: str = "haar", output_path: Optional[str] = None):
     """
     Detect faces in an image using Haar cascades or DNN.
 
     Uses OpenCV's pre-trained face detection models. Haar cascades are fast
     but less accurate. DNN method uses a deep learning model for better accuracy.
+    If output_path is given, an annotated copy is saved with each face outlined
+    in green (and confidence scores shown for DNN detections).
 
     Args:
         file_path: Path to the image file
         method: Detection method - 'haar' (fast) or 'dnn' (accurate)
+        output_path: Optional path to save the annotated image
 
     Returns:
         Dictionary with found (bool), count, and faces list containing
-        x, y, width, height, and confidence (for DNN method)
-    """
-    return detect.detect_faces(file_path, method)
-
-
-@mcp.tool()
-def detect_faces_save(file_path: str, output_path: str, method: str = "haar"):
+        x, y, width, height, and confidence (for DNN method), plus
+        output_path when an annotated image was saved
     """
-    Detect faces and save image with bounding boxes drawn around them.
-
-    Each detected face is outlined with a green rectangle.
-    Confidence scores are shown for DNN method detections.
-
-    Args:
-        file_path: Path to the input image file
-        output_path: Path to save the annotated output image
-        method: Detection method - 'haar' (fast) or 'dnn' (accurate)
+    detect = _import_tool("detect")
 
-    Returns:
-        Dictionary with found, count, output_path, and faces list
-    """
-    return detect.detect_faces_save(file_path, output_path, method)
+    if output_path:
+        return detect.detect_faces_save(file_path, output_path, method)
+    return detect.detect_faces(file_path, method)
 
 
-@mcp.tool()
 def detect_motion(file_path_1: str, file_path_2: str, threshold: float = 25.0):
     """
     Compare two frames to detect motion between them.
@@ -639,10 +803,11 @@ def detect_motion(file_path_1: str, file_path_2: str, threshold: float = 25.0):
         Dictionary with motion_detected, motion_percentage, motion_regions list,
         and changed_pixels count
     """
+    detect = _import_tool("detect")
+
     return detect.detect_motion(file_path_1, file_path_2, threshold)
 
 
-@mcp.tool()
 def detect_edges(file_path: str, output_path: str, method: str = "canny"):
     """
     Detect edges in an image using various methods.
@@ -663,10 +828,11 @@ def detect_edges(file_path: str, output_path: str, method: str = "canny"):
     Returns:
         Dictionary with status, output_path, and method used
     """
+    detect = _import_tool("detect")
+
     return detect.detect_edges(file_path, output_path, method)
 
 
-@mcp.tool()
 def detect_objects(file_path: str, confidence_threshold: float = 0.5):
     """
     Detect common objects in an image using OpenCV's DNN module.
@@ -685,12 +851,154 @@ def detect_objects(file_path: str, confidence_threshold: float = 0.5):
         Dictionary with found (bool), count, and objects list containing
         class, confidence, x, y, width, height
     """
+    detect = _import_tool("detect")
+
     return detect.detect_objects(file_path, confidence_threshold)
 
 
+# Tool registry. All tools are registered with FastMCP in one pass here.
+# Batch and screen capture tools are async and run their work on a worker
+# thread so a long capture does not block the event loop.
+# Registration goes through the thin wrappers above rather than the module
+# functions so that tool modules (and cv2) stay lazily imported.
+TOOLS = [
+    list_cameras,
+    save_image,
+    rtsp_save_image,
+    rtsp_check_stream,
+    hls_save_image,
+    hls_check_stream,
+    start_stream,
+    stop_stream,
+    list_streams,
+    start_dashboard,
+    stop_dashboard,
+    mjpeg_save_image,
+    mjpeg_check_stream,
+    screen_list_monitors,
+    screen_save_image,
+    screen_save_region,
+    screen_save_all_monitors,
+    screen_save_images,
+    http_save_image,
+    http_check_image,
+    image_get_metadata,
+    image_get_stats,
+    image_get_histogram,
+    image_get_dominant_colors,
+    image_compare_ssim,
+    image_compare_mse,
+    image_compare_hash,
+    image_get_hash,
+    image_compare_hash_batch,
+    image_compare_mse_batch,
+    image_diff,
+    image_compare_histograms,
+    detect_faces,
+    detect_motion,
+    detect_edges,
+    detect_objects,
+]
+
+# Registered only when libzbar is available
+DECODE_TOOLS = [
+    decode_codes,
+    decode_and_annotate,
+]
+
+for _tool in TOOLS + (DECODE_TOOLS if DECODE_AVAILABLE else []):
+    mcp.tool()(_tool)
+
+
+# Image Resources
+async def read_image(path: str) -> bytes:
+    """
+    Read an image file written by one of the tools.
+
+    Lets clients that cannot see the server's filesystem (e.g. over the HTTP
+    transport) fetch a captured image on demand, while tool results stay
+    metadata-only. Only image files inside the allowed output directories
+    can be read.
+
+    Args:
+        path: Absolute file path as returned by a tool, percent-encoded
+            (e.g. %2Ftmp%2Fcapture.jpg)
+
+    Returns:
+        The raw file bytes
+
+    Raises:
+        ValueError: If the path, or the file a symlink in it points to, is
+            not an image inside the allowed directories.
+    """
+    from urllib.parse import unquote
+
+    from optic_mcp.validation import (
+        ALLOWED_IMAGE_EXTENSIONS,
+        get_allowed_directories,
+        validate_file_path,
+    )
+
+    validated_path = validate_file_path(unquote(path))
+
+    # validate_file_path only normalizes the path, so a symlink inside an
+    # allowed directory could still lead anywhere; check its real target
+    real_path = os.path.realpath(validated_path)
+    if real_path != validated_path:
+        real_dirs = tuple(
+            os.path.join(os.path.realpath(os.path.expanduser(directory)), "")
+            for directory in get_allowed_directories()
+        )
+        extension = os.path.splitext(real_path)[1].lower()
+        if not real_path.startswith(real_dirs) or extension not in ALLOWED_IMAGE_EXTENSIONS:
+            raise ValueError(
+                f"File path resolves outside the allowed directories: {validated_path}"
+            )
+
+    def _read() -> bytes:
+        # O_NOFOLLOW: don't follow a symlink swapped in after the check
+        fd = os.open(real_path, os.O_RDONLY | getattr(os, "O_NOFOLLOW", 0))
+        with os.fdopen(fd, "rb") as f:
+            return f.read()
+
+    return await anyio.to_thread.run_sync(_read)
+
+
+mcp.resource(IMAGE_RESOURCE_TEMPLATE, mime_type="application/octet-stream")(read_image)
+
+
+def _prewarm_detection():
+    """Import the detect module and load its models ahead of the first request."""
+    _import_tool("detect").prewarm_models()
+
+
 def main():
-    """Main entry point for the MCP server."""
-    mcp.run()
+    """
+    Main entry point for the MCP server.
+
+    Uses stdio by default. Set OPTIC_MCP_TRANSPORT=streamable-http to serve
+    over HTTP instead, with OPTIC_MCP_HOST (default 127.0.0.1) and
+    OPTIC_MCP_PORT (default 8000) selecting the listen address.
+
+    Set OPTIC_MCP_PREWARM=1 to load the detection models in a background
+    thread at startup, so the first detect_* call does not pay for it.
+    """
+    transport = os.environ.get("OPTIC_MCP_TRANSPORT", "stdio")
+    if transport not in SUPPORTED_TRANSPORTS:
+        raise ValueError(
+            f"Unsupported OPTIC_MCP_TRANSPORT '{transport}'. Supported: {list(SUPPORTED_TRANSPORTS)}"
+        )
+
+    if transport == "streamable-http":
+        from optic_mcp.validation import validate_port
+
+        mcp.settings.host = os.environ.get("OPTIC_MCP_HOST", "127.0.0.1")
+        mcp.settings.port = validate_port(int(os.environ.get("OPTIC_MCP_PORT", "8000")))
+
+    if os.environ.get("OPTIC_MCP_PREWARM") == "1":
+        threading.Thread(target=_prewarm_detection, daemon=True).start()
+
+    mcp.run(transport=transport)
 
 
 if __name__ == "__main__":
@@ -1,18 +1,90 @@
 """Camera streaming module - serves MJPEG streams over HTTP."""
 
 import json
+import socket
 import threading
 import time
-from http.server import HTTPServer, BaseHTTPRequestHandler
-from typing import Dict, Optional
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple, Union
 
 import cv2
+import numpy as np
 
+from optic_mcp.jpeg import encode_jpeg
+from optic_mcp.usb import acquire_capture, release_capture
 from optic_mcp.validation import validate_camera_index, validate_port
 
 # Maximum number of concurrent streams to prevent resource exhaustion
 MAX_CONCURRENT_STREAMS = 10
 
+# How long a stream handler waits for a new frame before rechecking whether
+# the stream is still running
+FRAME_WAIT_TIMEOUT_SECONDS = 1.0
+
+# How long start() waits for the camera to open before serving anyway
+CAMERA_READY_TIMEOUT_SECONDS = 5.0
+
+# Frames wider than this are downscaled before encoding; dashboards and
+# browser tabs rarely show more, and encode cost scales with pixel count
+DEFAULT_STREAM_MAX_WIDTH = 1280
+
+# JPEG quality for streamed frames; lower than saved images to keep bandwidth down
+STREAM_JPEG_QUALITY = 70
+
+
+# FOURCC a camera reports when it delivers JPEG frames that can be forwarded
+MJPG_FOURCC = cv2.VideoWriter_fourcc(*"MJPG")
+
+# Part header for each MJPEG frame; Content-Length lets clients read the JPEG
+# without scanning for the next boundary
+MJPEG_PART_HEADER = b"--frame\r\nContent-Type: image/jpeg\r\nContent-Length: %d\r\n\r\n"
+
+
+def _send_all(sock: socket.socket, parts: List[Union[bytes, memoryview]]) -> None:
+    """
+    Send several buffers as one gathered write.
+
+    Uses sendmsg() so the kernel reads the buffers in place, falling back to
+    a single joined sendall() where sendmsg() is unavailable (Windows).
+
+    Args:
+        sock: Connected socket.
+        parts: Buffers to send, in order.
+    """
+    if not hasattr(sock, "sendmsg"):
+        sock.sendall(b"".join(parts))
+        return
+
+    views = [memoryview(part) for part in parts]
+    while views:
+        sent = sock.sendmsg(views)
+        # sendmsg may send only part of the data; drop what went out
+        while views and sent >= len(views[0]):
+            sent -= len(views[0])
+            views.pop(0)
+        if views and sent:
+            views[0] = views[0][sent:]
+
+
+# Status page for a single stream, rendered once per StreamServer.
+# camera_index is validated as int, safe to use in HTML.
+STATUS_PAGE_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+    <title>OpticMCP Stream</title>
+    <style>
+        body {{ font-family: sans-serif; text-align: center; background: #1a1a1a; color: #fff; }}
+        img {{ max-width: 100%; border: 2px solid #333; }}
+        h1 {{ color: #4CAF50; }}
+    </style>
+</head>
+<body>
+    <h1>OpticMCP Camera Stream</h1>
+    <p>Camera Index: {camera_index}</p>
+    <img src="/stream" alt="Camera Stream">
+</body>
+</html>"""
+
 
 class MJPEGHandler(BaseHTTPRequestHandler):
     """HTTP request handler that serves MJPEG streams."""
@@ -40,29 +112,12 @@ class MJPEGHandler(BaseHTTPRequestHandler):
     def _serve_status_page(self):
         """Serve a simple HTML page with the stream embedded."""
         stream_server: StreamServer = self.server  # type: ignore[assignment]
-        # camera_index is validated as int, safe to use in HTML
-        html = f"""<!DOCTYPE html>
-<html>
-<head>
-    <title>OpticMCP Stream</title>
-    <style>
-        body {{ font-family: sans-serif; text-align: center; background: #1a1a1a; color: #fff; }}
-        img {{ max-width: 100%; border: 2px solid #333; }}
-        h1 {{ color: #4CAF50; }}
-    </style>
-</head>
-<body>
-    <h1>OpticMCP Camera Stream</h1>
-    <p>Camera Index: {int(stream_server.camera_index)}</p>
-    <img src="/stream" alt="Camera Stream">
-</body>
-</html>"""
         self.send_response(200)
         self.send_header("Content-Type", "text/html")
-        self.send_header("Content-Length", str(len(html)))
+        self.send_header("Content-Length", str(len(stream_server.status_page)))
         self._send_security_headers()
         self.end_headers()
-        self.wfile.write(html.encode())
+        self.wfile.write(stream_server.status_page)
 
     def _serve_mjpeg_stream(self):
         """Serve the MJPEG stream."""
@@ -76,74 +131,237 @@ class MJPEGHandler(BaseHTTPRequestHandler):
         self.end_headers()
 
         try:
+            last_frame_id = 0
             while stream_server.streaming:
-                frame_data = stream_server.get_frame()
-                if frame_data is not None:
-                    self.wfile.write(b"--frame\r\n")
-                    self.wfile.write(b"Content-Type: image/jpeg\r\n\r\n")
-                    self.wfile.write(frame_data)
-                    self.wfile.write(b"\r\n")
-                else:
-                    time.sleep(0.01)
+                frame_id, frame_data = stream_server.wait_for_frame(last_frame_id)
+                if frame_data is None or frame_id == last_frame_id:
+                    continue
+                last_frame_id = frame_id
+                # One syscall per frame instead of four unbuffered writes
+                _send_all(
+                    self.connection,
+                    [MJPEG_PART_HEADER % len(frame_data), frame_data, b"\r\n"],
+                )
         except (BrokenPipeError, ConnectionResetError):
             # Client disconnected
             pass
 
 
-class StreamServer(HTTPServer):
-    """HTTP server that captures and serves camera frames."""
+def _raw_jpeg(frame: np.ndarray) -> Optional[memoryview]:
+    """
+    Return a view of the JPEG data in an undecoded MJPEG frame.
+
+    With CAP_PROP_CONVERT_RGB off, backends that support it (e.g. V4L2)
+    return the camera's compressed buffer as a single row of bytes.
+
+    Args:
+        frame: Frame from VideoCapture.retrieve().
+
+    Returns:
+        Byte view of the frame, or None if the frame is a decoded image.
+    """
+    if frame.dtype != np.uint8 or frame.ndim > 2 or (frame.ndim == 2 and frame.shape[0] != 1):
+        return None
+    data = memoryview(np.ascontiguousarray(frame)).cast("B")
+    return data if data[:2] == b"\xff\xd8" else None
+
+
+def _encode_frame(frame: np.ndarray) -> Optional[memoryview]:
+    """
+    Encode a decoded frame for the stream.
+
+    Uses libjpeg-turbo when the turbojpeg extra is installed. The capture
+    loop calls this outside the frame lock (the encoders release the GIL),
+    so handlers sending the previous frame only wait for the reference swap
+    in _publish_frame.
+
+    Args:
+        frame: BGR frame from VideoCapture.retrieve().
+
+    Returns:
+        Byte view of the JPEG (no copy of OpenCV's output array), or None if
+        encoding failed and the previous frame should keep being served.
+    """
+    try:
+        return memoryview(encode_jpeg(frame, STREAM_JPEG_QUALITY)).cast("B")
+    except (RuntimeError, cv2.error):
+        return None
+
+
+class StreamServer(ThreadingHTTPServer):
+    """
+    HTTP server that captures and serves camera frames.
+
+    Each client gets its own handler thread, so several viewers (e.g. the
+    dashboard and a browser tab) can watch one camera at once. Handler
+    threads sleep on the frame condition between frames and exit when the
+    stream stops.
+    """
+
+    # Don't let open client connections block stop() or interpreter exit
+    daemon_threads = True
 
-    def __init__(self, camera_index: int, port: int):
+    def __init__(self, camera_index: int, port: int, max_width: int = DEFAULT_STREAM_MAX_WIDTH):
         """
         Initialize the stream server.
 
         Args:
             camera_index: The camera index to stream from
             port: The port to serve the stream on
+            max_width: Downscale wider frames to this width (0 = full resolution)
         """
         super().__init__(("localhost", port), MJPEGHandler)
         self.camera_index = camera_index
         self.port = port
+        self.max_width = max_width
+        self.status_page = STATUS_PAGE_TEMPLATE.format(camera_index=int(camera_index)).encode()
         self.streaming = False
-        self._frame: Optional[bytes] = None
-        self._frame_lock = threading.Lock()
+        # Latest (frame_id, JPEG buffer), replaced as a whole by the capture
+        # thread. Reading one attribute is atomic, so handlers can load it
+        # without a lock; frame_id lets them send each frame only once.
+        self._frame_slot: Tuple[int, Optional[memoryview]] = (0, None)
+        # Only used to sleep until the next frame, never on the read path
+        self._frame_cond = threading.Condition()
         self._cap: Optional[cv2.VideoCapture] = None
+        # Set by the capture thread once the camera is warmed up or failed to open
+        self._ready = threading.Event()
+        # Latest retrieved camera frame at full resolution, for save_image
+        self._latest_frame: Optional[np.ndarray] = None
         self._capture_thread: Optional[threading.Thread] = None
         self._server_thread: Optional[threading.Thread] = None
 
-    def get_frame(self) -> Optional[bytes]:
-        """Get the latest frame as JPEG bytes."""
-        with self._frame_lock:
-            return self._frame
+    def get_frame(self) -> Optional[memoryview]:
+        """Get the latest frame as a read-only view of its JPEG bytes."""
+        return self._frame_slot[1]
+
+    def wait_for_frame(
+        self, last_frame_id: int, timeout: float = FRAME_WAIT_TIMEOUT_SECONDS
+    ) -> Tuple[int, Optional[memoryview]]:
+        """
+        Block until a frame newer than last_frame_id is available.
+
+        Args:
+            last_frame_id: ID of the last frame the caller has already sent.
+            timeout: Seconds to wait before returning the current frame anyway.
+
+        Returns:
+            Tuple of (frame_id, JPEG buffer). frame_id equals last_frame_id if
+            the wait timed out or the stream was stopped.
+        """
+        slot = self._frame_slot
+        if slot[0] != last_frame_id:
+            # A newer frame is already there; no need to touch the condition
+            return slot
+
+        with self._frame_cond:
+            self._frame_cond.wait_for(
+                lambda: self._frame_slot[0] != last_frame_id or not self.streaming, timeout
+            )
+        return self._frame_slot
+
+    def _publish_frame(self, frame_data: Union[bytes, memoryview]):
+        """Make frame_data the latest frame and wake handlers waiting for it."""
+        with self._frame_cond:
+            # Read-only so no handler can modify the buffer every client shares
+            self._frame_slot = (self._frame_slot[0] + 1, memoryview(frame_data).toreadonly())
+            self._frame_cond.notify_all()
+
+    def latest_frame(self) -> Optional[np.ndarray]:
+        """
+        Get the most recent camera frame as a full-resolution BGR image.
+
+        Returns:
+            The frame, or None if no frame has been captured yet.
+        """
+        frame = self._latest_frame
+        if frame is not None and _raw_jpeg(frame) is not None:
+            # MJPEG passthrough keeps frames compressed
+            return cv2.imdecode(frame.reshape(-1), cv2.IMREAD_COLOR)
+        return frame
+
+    def _needs_downscale(self, width: int) -> bool:
+        """Return True if frames of this width exceed max_width."""
+        return 0 < self.max_width < width
+
+    def _downscale(self, frame: np.ndarray) -> np.ndarray:
+        """Resize frame to max_width, keeping its aspect ratio, if it is wider."""
+        height, width = frame.shape[:2]
+        if not self._needs_downscale(width):
+            return frame
+        new_height = max(1, round(height * self.max_width / width))
+        return cv2.resize(frame, (self.max_width, new_height), interpolation=cv2.INTER_AREA)
 
     def _capture_loop(self):
         """Continuously capture frames from the camera."""
-        self._cap = cv2.VideoCapture(self.camera_index)
+        # Reuse the camera if a recent save_image/list_cameras left it open
+        self._cap = acquire_capture(self.camera_index)
 
         if not self._cap.isOpened():
+            self._cap.release()
             self.streaming = False
+            self._ready.set()
             return
 
-        # Minimize buffer size to reduce latency - only keep the latest frame
-        self._cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
-
-        # Warm up the camera
-        for _ in range(3):
-            self._cap.grab()
-
-        while self.streaming:
-            # Grab the latest frame (flush any buffered frames)
-            if self._cap.grab():
-                ret, frame = self._cap.retrieve()
-                if ret and frame is not None:
-                    _, buffer = cv2.imencode(".jpg", frame, [cv2.IMWRITE_JPEG_QUALITY, 70])
-                    with self._frame_lock:
-                        self._frame = buffer.tobytes()
-            # Minimal sleep to yield CPU but maintain low latency
-            time.sleep(0.001)
+        passthrough = False
+        try:
+            # Minimize buffer size to reduce latency - only keep the latest frame
+            self._cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+
+            # Ask for MJPEG and the undecoded buffer; cameras that deliver JPEG
+            # are then forwarded as-is instead of decoded and re-encoded.
+            # Compressed frames can't be downscaled, so only forward them as-is
+            # when they already fit max_width. Cameras that ignore the FOURCC
+            # request would hand out raw YUYV buffers, so leave decoding on.
+            self._cap.set(cv2.CAP_PROP_FOURCC, MJPG_FOURCC)
+            passthrough = (
+                int(self._cap.get(cv2.CAP_PROP_FOURCC)) == MJPG_FOURCC
+                and not self._needs_downscale(int(self._cap.get(cv2.CAP_PROP_FRAME_WIDTH)))
+                and bool(self._cap.set(cv2.CAP_PROP_CONVERT_RGB, 0))
+            )
 
-        self._cap.release()
-        self._cap = None
+            # Warm up the camera
+            for _ in range(3):
+                self._cap.grab()
+            self._ready.set()
+
+            last_frame: Optional[np.ndarray] = None
+            while self.streaming:
+                # Grab the latest frame (flush any buffered frames)
+                if self._cap.grab():
+                    ret, frame = self._cap.retrieve()
+                    frame_data = None
+                    if ret and frame is not None and passthrough:
+                        frame_data = _raw_jpeg(frame)
+                        if frame_data is None:
+                            # Not JPEG after all; decode from the next frame on
+                            # and drop this undecoded buffer
+                            self._cap.set(cv2.CAP_PROP_CONVERT_RGB, 1)
+                            passthrough = False
+                            continue
+                    if ret and frame is not None:
+                        self._latest_frame = frame
+                    # Static sources (virtual or screen-capture cameras) repeat
+                    # identical frames; comparing costs about a tenth of an encode.
+                    # Skipped frames are not republished, so clients get no resend.
+                    unchanged = last_frame is not None and np.array_equal(frame, last_frame)
+                    if ret and frame is not None and not unchanged:
+                        last_frame = frame
+                        if frame_data is None:
+                            frame_data = _encode_frame(self._downscale(frame))
+                        if frame_data is not None:
+                            self._publish_frame(frame_data)
+                # Minimal sleep to yield CPU but maintain low latency
+                time.sleep(0.001)
+        finally:
+            if passthrough:
+                # Pooled captures must hand decoded BGR frames to the next user
+                self._cap.set(cv2.CAP_PROP_CONVERT_RGB, 1)
+
+            # Hand the camera back to the pool so a follow-up capture is fast
+            release_capture(self.camera_index, self._cap)
+            self._cap = None
+            # Don't leave start() waiting if setup raised
+            self._ready.set()
 
     def start(self):
         """Start the camera capture and HTTP server."""
@@ -156,8 +374,8 @@ class StreamServer(HTTPServer):
         self._capture_thread = threading.Thread(target=self._capture_loop, daemon=True)
         self._capture_thread.start()
 
-        # Wait a bit for camera to initialize
-        time.sleep(0.5)
+        # Wait for the camera to open instead of a fixed delay
+        self._ready.wait(timeout=CAMERA_READY_TIMEOUT_SECONDS)
 
         if not self.streaming:
             raise RuntimeError(f"Could not open camera at index {self.camera_index}")
@@ -168,7 +386,10 @@ class StreamServer(HTTPServer):
 
     def stop(self):
         """Stop the camera capture and HTTP server."""
-        self.streaming = False
+        with self._frame_cond:
+            self.streaming = False
+            # Wake handlers waiting for a frame so they see the stream ended
+            self._frame_cond.notify_all()
         self.shutdown()
 
         if self._capture_thread:
@@ -189,6 +410,10 @@ class StreamManager:
     def __init__(self):
         """Initialize the stream manager."""
         self._streams: Dict[int, StreamServer] = {}
+        # Bumped whenever a stream starts or stops
+        self._streams_version = 0
+        # (version, encoded list_streams()) for dashboard polling
+        self._streams_json: Tuple[int, Optional[bytes]] = (-1, None)
 
     def __new__(cls):
         """Singleton pattern to ensure only one manager exists."""
@@ -198,13 +423,20 @@ class StreamManager:
                     cls._instance = super().__new__(cls)
         return cls._instance
 
-    def start_stream(self, camera_index: int = 0, port: int = 8080) -> dict:
+    def start_stream(
+        self,
+        camera_index: int = 0,
+        port: int = 8080,
+        max_width: int = DEFAULT_STREAM_MAX_WIDTH,
+    ) -> dict:
         """
         Start streaming a camera to a localhost HTTP server.
 
         Args:
             camera_index: The camera index to stream (0-100, default 0)
             port: The port to serve the stream on (1024-65535, default 8080)
+            max_width: Downscale wider frames to this width before encoding
+                (default 1280, 0 = full resolution)
 
         Returns:
             Dictionary with stream URL and status
@@ -216,6 +448,8 @@ class StreamManager:
         # Validate inputs
         validated_index = validate_camera_index(camera_index)
         validated_port = validate_port(port)
+        if not isinstance(max_width, int) or max_width < 0:
+            raise ValueError(f"max_width must be a non-negative integer, got {max_width!r}")
 
         # Check max concurrent streams
         if len(self._streams) >= MAX_CONCURRENT_STREAMS:
@@ -242,9 +476,10 @@ class StreamManager:
                     f"Choose a different port."
                 )
 
-        server = StreamServer(validated_index, validated_port)
+        server = StreamServer(validated_index, validated_port, max_width)
         server.start()
         self._streams[validated_index] = server
+        self._streams_version += 1
 
         return {
             "status": "started",
@@ -270,13 +505,16 @@ class StreamManager:
         # Validate input
         validated_index = validate_camera_index(camera_index)
 
-        if validated_index not in self._streams:
+        # pop() rather than check-then-pop: dashboard handlers can stop the
+        # same stream from two threads at once
+        server = self._streams.pop(validated_index, None)
+        self._streams_version += 1
+        if server is None:
             return {
                 "status": "not_running",
                 "camera_index": validated_index,
             }
 
-        server = self._streams.pop(validated_index)
         server.stop()
 
         return {
@@ -292,7 +530,8 @@ class StreamManager:
             List of active stream information
         """
         streams = []
-        for camera_index, server in self._streams.items():
+        # Copy first; another thread may start or stop a stream meanwhile
+        for camera_index, server in list(self._streams.items()):
             streams.append(
                 {
                     "camera_index": camera_index,
@@ -304,6 +543,23 @@ class StreamManager:
             )
         return streams
 
+    def streams_json(self) -> bytes:
+        """
+        List all active streams as encoded JSON, reusing the last encoding
+        until a stream starts or stops.
+
+        Returns:
+            UTF-8 JSON array of active stream information
+        """
+        version, data = self._streams_json
+        if data is None or version != self._streams_version:
+            # Read the version first: if a stream changes while encoding, the
+            # stored version is already stale and the next call re-encodes
+            version = self._streams_version
+            data = json.dumps(self.list_streams()).encode()
+            self._streams_json = (version, data)
+        return data
+
     def stop_all(self):
         """Stop all active streams."""
         for camera_index in list(self._streams.keys()):
@@ -314,7 +570,9 @@ class StreamManager:
 _manager = StreamManager()
 
 
-def start_stream(camera_index: int = 0, port: int = 8080) -> dict:
+def start_stream(
+    camera_index: int = 0, port: int = 8080, max_width: int = DEFAULT_STREAM_MAX_WIDTH
+) -> dict:
     """
     Start streaming a camera to a localhost HTTP server.
 
@@ -324,11 +582,12 @@ def start_stream(camera_index: int = 0, port: int = 8080) -> dict:
     Args:
         camera_index: The camera index to stream (default 0)
         port: The port to serve the stream on (default 8080)
+        max_width: Downscale wider frames to this width (default 1280, 0 = full resolution)
 
     Returns:
         Dictionary with stream URL and status
     """
-    return _manager.start_stream(camera_index, port)
+    return _manager.start_stream(camera_index, port, max_width)
 
 
 def stop_stream(camera_index: int = 0) -> dict:
@@ -354,73 +613,24 @@ def list_streams() -> list:
     return _manager.list_streams()
 
 
-class DashboardHandler(BaseHTTPRequestHandler):
-    """HTTP request handler for the multi-camera dashboard."""
-
-    def log_message(self, format, *args):
-        """Suppress HTTP server logs to avoid polluting MCP stdio."""
-        pass
-
-    def _send_security_headers(self):
-        """Send security headers to prevent common attacks."""
-        self.send_header("X-Content-Type-Options", "nosniff")
-        self.send_header("X-Frame-Options", "SAMEORIGIN")
-        self.send_header("X-XSS-Protection", "1; mode=block")
-        self.send_header("Referrer-Policy", "strict-origin-when-cross-origin")
-
-    def do_GET(self):
-        """Handle GET requests - serve dashboard or API."""
-        if self.path == "/":
-            self._serve_dashboard()
-        elif self.path == "/api/streams":
-            self._serve_streams_api()
-        else:
-            self.send_error(404, "Not Found")
+def latest_frame(camera_index: int) -> Optional[np.ndarray]:
+    """
+    Get the most recent frame of an active stream.
 
-    def do_POST(self):
-        """Handle POST requests - stop streams."""
-        if self.path == "/api/stop-all":
-            self._stop_all_streams()
-        elif self.path.startswith("/api/stop/"):
-            # Validate camera index from URL to prevent injection
-            try:
-                camera_index_str = self.path.split("/")[-1]
-                camera_index = int(camera_index_str)
-                # Basic range validation (full validation in stop_stream)
-                if camera_index < 0 or camera_index > 100:
-                    self.send_error(400, "Invalid camera index")
-                    return
-                self._stop_stream(camera_index)
-            except (ValueError, IndexError):
-                self.send_error(400, "Invalid camera index")
-        else:
-            self.send_error(404, "Not Found")
+    Args:
+        camera_index: The camera index
 
-    def _stop_stream(self, camera_index: int):
-        """Stop a specific camera stream."""
-        result = _manager.stop_stream(camera_index)
-        data = json.dumps(result)
-        self.send_response(200)
-        self.send_header("Content-Type", "application/json")
-        self.send_header("Content-Length", str(len(data)))
-        self._send_security_headers()
-        self.end_headers()
-        self.wfile.write(data.encode())
+    Returns:
+        Full-resolution BGR frame, or None if the camera is not streaming or
+        has not delivered a frame yet.
+    """
+    server = _manager._streams.get(camera_index)
+    return server.latest_frame() if server is not None else None
 
-    def _stop_all_streams(self):
-        """Stop all camera streams."""
-        _manager.stop_all()
-        data = json.dumps({"status": "stopped_all"})
-        self.send_response(200)
-        self.send_header("Content-Type", "application/json")
-        self.send_header("Content-Length", str(len(data)))
-        self._send_security_headers()
-        self.end_headers()
-        self.wfile.write(data.encode())
 
-    def _serve_dashboard(self):
-        """Serve the dynamic multi-camera dashboard HTML page."""
-        html = """<!DOCTYPE html>
+# The dashboard page is static (it fetches streams from /api/streams), so it
+# is encoded once at import
+DASHBOARD_HTML = """<!DOCTYPE html>
 <html>
 <head>
     <title>OpticMCP Dashboard</title>
@@ -588,30 +798,101 @@ class DashboardHandler(BaseHTTPRequestHandler):
         setInterval(updateDashboard, 3000);
     </script>
 </body>
-</html>"""
+</html>""".encode()
+
+
+class DashboardHandler(BaseHTTPRequestHandler):
+    """HTTP request handler for the multi-camera dashboard."""
+
+    def log_message(self, format, *args):
+        """Suppress HTTP server logs to avoid polluting MCP stdio."""
+        pass
+
+    def _send_security_headers(self):
+        """Send security headers to prevent common attacks."""
+        self.send_header("X-Content-Type-Options", "nosniff")
+        self.send_header("X-Frame-Options", "SAMEORIGIN")
+        self.send_header("X-XSS-Protection", "1; mode=block")
+        self.send_header("Referrer-Policy", "strict-origin-when-cross-origin")
+
+    def do_GET(self):
+        """Handle GET requests - serve dashboard or API."""
+        if self.path == "/":
+            self._serve_dashboard()
+        elif self.path == "/api/streams":
+            self._serve_streams_api()
+        else:
+            self.send_error(404, "Not Found")
+
+    def do_POST(self):
+        """Handle POST requests - stop streams."""
+        if self.path == "/api/stop-all":
+            self._stop_all_streams()
+        elif self.path.startswith("/api/stop/"):
+            # Validate camera index from URL to prevent injection
+            try:
+                camera_index_str = self.path.split("/")[-1]
+                camera_index = int(camera_index_str)
+                # Basic range validation (full validation in stop_stream)
+                if camera_index < 0 or camera_index > 100:
+                    self.send_error(400, "Invalid camera index")
+                    return
+                self._stop_stream(camera_index)
+            except (ValueError, IndexError):
+                self.send_error(400, "Invalid camera index")
+        else:
+            self.send_error(404, "Not Found")
+
+    def _stop_stream(self, camera_index: int):
+        """Stop a specific camera stream."""
+        result = _manager.stop_stream(camera_index)
+        data = json.dumps(result)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self._send_security_headers()
+        self.end_headers()
+        self.wfile.write(data.encode())
+
+    def _stop_all_streams(self):
+        """Stop all camera streams."""
+        _manager.stop_all()
+        data = json.dumps({"status": "stopped_all"})
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self._send_security_headers()
+        self.end_headers()
+        self.wfile.write(data.encode())
+
+    def _serve_dashboard(self):
+        """Serve the dynamic multi-camera dashboard HTML page."""
         self.send_response(200)
         self.send_header("Content-Type", "text/html")
-        self.send_header("Content-Length", str(len(html)))
+        self.send_header("Content-Length", str(len(DASHBOARD_HTML)))
         self._send_security_headers()
         self.end_headers()
-        self.wfile.write(html.encode())
+        self.wfile.write(DASHBOARD_HTML)
 
     def _serve_streams_api(self):
         """Serve JSON API with list of active streams."""
-        streams = _manager.list_streams()
-        data = json.dumps(streams)
+        data = _manager.streams_json()
         self.send_response(200)
         self.send_header("Content-Type", "application/json")
         self.send_header("Content-Length", str(len(data)))
         self.send_header("Access-Control-Allow-Origin", "*")
         self._send_security_headers()
         self.end_headers()
-        self.wfile.write(data.encode())
+        self.wfile.write(data)
 
 
-class DashboardServer(HTTPServer):
+class DashboardServer(ThreadingHTTPServer):
     """HTTP server for the multi-camera dashboard."""
 
+    # A slow client must not hold up other tabs; don't let open connections
+    # block stop() or interpreter exit
+    daemon_threads = True
+
     def __init__(self, port: int):
         """
         Initialize the dashboard server.
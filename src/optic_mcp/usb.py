@@ -1,42 +1,243 @@
 """USB camera handling module."""
 
-from typing import List
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 
 import cv2
+import numpy as np
 
 from optic_mcp.validation import validate_file_path, validate_camera_index
 
+# Opening a camera (device open + format negotiation) can take hundreds of ms,
+# so captures are kept open between tool calls and closed once idle this long.
+CAPTURE_IDLE_TIMEOUT_SECONDS = 30.0
+
+# How often the reaper thread checks for idle captures
+CAPTURE_REAP_INTERVAL_SECONDS = 5.0
+
+# Frames grabbed and discarded before capturing, so auto-exposure has settled
+# on a fresh capture and stale buffered frames are flushed on a pooled one.
+WARMUP_FRAMES = 5
+
+# list_cameras probes indices 0..CAMERA_SCAN_COUNT-1. Device opens block in the
+# driver with the GIL released, so every index is probed on its own thread.
+CAMERA_SCAN_COUNT = 10
+
+# Linux lists video device nodes here; indices without a node are not probed
+V4L2_SYSFS_DIR = "/sys/class/video4linux"
+
+# Idle captures keyed by camera index, with the time they were returned
+_capture_pool: Dict[int, Tuple[cv2.VideoCapture, float]] = {}
+_pool_lock = threading.Lock()
+_reaper: Optional[threading.Thread] = None
+
+
+def _take_pooled_capture(camera_index: int) -> Optional[cv2.VideoCapture]:
+    """
+    Removes and returns the pooled capture for camera_index, if it is still open.
+
+    Args:
+        camera_index: The camera index.
+
+    Returns:
+        The pooled capture, or None if there is no open one.
+    """
+    with _pool_lock:
+        entry = _capture_pool.pop(camera_index, None)
+
+    if entry is not None:
+        cap = entry[0]
+        if cap.isOpened():
+            return cap
+        cap.release()
+    return None
+
+
+def acquire_capture(camera_index: int) -> cv2.VideoCapture:
+    """
+    Takes the pooled capture for camera_index, or opens a new one.
+    The caller owns the capture until it hands it back with release_capture
+    or closes it with release().
+
+    Args:
+        camera_index: The camera index to open.
+
+    Returns:
+        VideoCapture for the camera (check isOpened() before use).
+    """
+    cap = _take_pooled_capture(camera_index)
+    if cap is not None:
+        return cap
+    return cv2.VideoCapture(camera_index)
+
+
+def release_capture(camera_index: int, cap: cv2.VideoCapture) -> None:
+    """
+    Returns a working capture to the pool so the next call can reuse it.
+
+    Args:
+        camera_index: The camera index the capture belongs to.
+        cap: Capture previously obtained from acquire_capture.
+    """
+    global _reaper
+
+    with _pool_lock:
+        previous = _capture_pool.pop(camera_index, None)
+        _capture_pool[camera_index] = (cap, time.monotonic())
+        if _reaper is None:
+            _reaper = threading.Thread(target=_reap_idle_captures, daemon=True)
+            _reaper.start()
+
+    if previous is not None and previous[0] is not cap:
+        previous[0].release()
+
+
+def close_cameras() -> None:
+    """Releases every pooled capture."""
+    with _pool_lock:
+        entries = list(_capture_pool.values())
+        _capture_pool.clear()
+
+    for cap, _ in entries:
+        cap.release()
+
+
+def _reap_idle_captures() -> None:
+    """
+    Background loop that releases captures idle for longer than
+    CAPTURE_IDLE_TIMEOUT_SECONDS. Exits once the pool is empty; the next
+    release_capture starts a new reaper.
+    """
+    global _reaper
+
+    while True:
+        time.sleep(CAPTURE_REAP_INTERVAL_SECONDS)
+        now = time.monotonic()
+
+        with _pool_lock:
+            idle = [
+                index
+                for index, (_, returned_at) in _capture_pool.items()
+                if now - returned_at >= CAPTURE_IDLE_TIMEOUT_SECONDS
+            ]
+            expired = [_capture_pool.pop(index)[0] for index in idle]
+            done = not _capture_pool
+            if done:
+                _reaper = None
+
+        for cap in expired:
+            cap.release()
+
+        if done:
+            return
+
+
+def _streamed_frame(camera_index: int) -> Optional[np.ndarray]:
+    """
+    Get the latest frame of an active stream on camera_index.
+
+    A streaming camera is held by the stream's capture thread; opening it
+    again would fail on most drivers or compete with the stream for frames.
+
+    Args:
+        camera_index: The camera index.
+
+    Returns:
+        The frame, or None if the camera is not being streamed.
+    """
+    # stream imports this module, so look it up instead of importing it; if
+    # it was never imported, no stream can be running
+    stream = sys.modules.get("optic_mcp.stream")
+    if stream is None:
+        return None
+    return stream.latest_frame(camera_index)
+
+
+def _probe_camera(index: int) -> Optional[dict]:
+    """
+    Opens camera index and grabs one frame to check it is truly available.
+    The frame is not decoded since only its arrival matters.
+    A capture already in the pool is probed and handed back to it; one opened
+    just for the probe is closed again, so scans don't keep cameras open.
+
+    Args:
+        index: The camera index to probe.
+
+    Returns:
+        Camera info dict, or None if the camera is unavailable.
+    """
+    cap = _take_pooled_capture(index)
+    pooled = cap is not None
+    if not pooled:
+        cap = cv2.VideoCapture(index)
+
+    info = None
+    try:
+        if cap.isOpened() and cap.grab():
+            backend = cap.getBackendName()
+            info = {
+                "index": index,
+                "status": "available",
+                "backend": backend,
+                "description": f"Camera {index} ({backend})",
+            }
+    finally:
+        if pooled and info is not None:
+            release_capture(index, cap)
+        else:
+            cap.release()
+    return info
+
+
+def _scan_indices() -> List[int]:
+    """
+    Camera indices worth probing.
+
+    On Linux, only indices with a /dev/videoN node are returned, so missing
+    devices cost no open attempt (OpenCV tries several backends for each).
+    Elsewhere, or if sysfs is unavailable, all CAMERA_SCAN_COUNT indices are.
+
+    Returns:
+        Indices in ascending order.
+    """
+    if sys.platform.startswith("linux"):
+        try:
+            nodes = set(os.listdir(V4L2_SYSFS_DIR))
+        except OSError:
+            pass
+        else:
+            return [index for index in range(CAMERA_SCAN_COUNT) if f"video{index}" in nodes]
+    return list(range(CAMERA_SCAN_COUNT))
+
 
 def list_cameras() -> List[dict]:
     """
     Scans for available USB cameras connected to the system.
     Returns a list of available camera indices and their status.
-    It attempts to read a frame to ensure the camera is truly available.
+    It attempts to grab a frame to ensure the camera is truly available.
+    Indices are probed in parallel; results stay in index order. On Linux,
+    indices without a video device node are skipped.
+    Cameras opened for the scan are closed again afterwards.
     """
-    available_cameras = []
-    for index in range(10):
-        cap = cv2.VideoCapture(index)
-        if cap.isOpened():
-            ret, _ = cap.read()
-            if ret:
-                backend = cap.getBackendName()
-                available_cameras.append(
-                    {
-                        "index": index,
-                        "status": "available",
-                        "backend": backend,
-                        "description": f"Camera {index} ({backend})",
-                    }
-                )
-            cap.release()
+    indices = _scan_indices()
+    if not indices:
+        return []
 
-    return available_cameras
+    with ThreadPoolExecutor(max_workers=len(indices)) as executor:
+        results = list(executor.map(_probe_camera, indices))
+
+    return [camera for camera in results if camera is not None]
 
 
 def save_image(file_path: str, camera_index: int = 0) -> str:
     """
     Captures a frame from the specified camera and saves it to the given file path.
-    Returns a success message.
+    Returns a success message. If the camera is being streamed, the stream's
+    latest frame is saved instead of opening the camera a second time.
 
     Args:
         file_path: Path where the image will be saved. Must be in an allowed directory
@@ -54,21 +255,31 @@ def save_image(file_path: str, camera_index: int = 0) -> str:
     validated_path = validate_file_path(file_path)
     validated_index = validate_camera_index(camera_index)
 
-    cap = cv2.VideoCapture(validated_index)
-
-    if not cap.isOpened():
-        raise RuntimeError(f"Could not open camera at index {validated_index}")
+    frame = _streamed_frame(validated_index)
+    if frame is not None:
+        cv2.imwrite(validated_path, frame)
+        return f"Image saved to {validated_path}"
 
+    cap = acquire_capture(validated_index)
+    pooled = False
     try:
-        for _ in range(5):
-            cap.read()
+        if not cap.isOpened():
+            raise RuntimeError(f"Could not open camera at index {validated_index}")
+
+        for _ in range(WARMUP_FRAMES):
+            cap.grab()
 
         ret, frame = cap.read()
         if not ret:
             raise RuntimeError(f"Failed to capture frame from camera {validated_index}")
 
-        cv2.imwrite(validated_path, frame)
-        return f"Image saved to {validated_path}"
-
+        release_capture(validated_index, cap)
+        pooled = True
     finally:
-        cap.release()
+        # Don't pool a capture that failed to open, stopped delivering
+        # frames or raised
+        if not pooled:
+            cap.release()
+
+    cv2.imwrite(validated_path, frame)
+    return f"Image saved to {validated_path}"
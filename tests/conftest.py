@@ -0,0 +1,19 @@
+"""Shared pytest fixtures."""
+
+import numpy as np
+import pytest
+
+
+@pytest.fixture(scope="session")
+def blank_frame() -> np.ndarray:
+    """A read-only black 640x480 BGR frame shared by every test."""
+    frame = np.zeros((480, 640, 3), dtype=np.uint8)
+    frame.setflags(write=False)
+    return frame
+
+
+@pytest.fixture
+def output_dir(tmp_path, monkeypatch):
+    """A per-test temporary directory that output paths are allowed in."""
+    monkeypatch.setenv("OPTIC_MCP_ALLOWED_DIRS", str(tmp_path))
+    return tmp_path
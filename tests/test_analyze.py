@@ -1,7 +1,9 @@
 """Tests for the analyze module."""
 
+import base64
 import os
 import tempfile
+from unittest.mock import patch
 
 import cv2
 import numpy as np
@@ -57,16 +59,69 @@ class TestAnalyze:
         finally:
             os.unlink(path)
 
+    def test_get_histogram_packed(self):
+        """Test packed histogram decodes to the same data as the lists."""
+        path = create_test_image()
+        try:
+            lists = analyze.get_histogram(path)
+            result = analyze.get_histogram(path, packed=True)
+            counts = np.frombuffer(
+                base64.b64decode(result["channels_b64"]), dtype=np.uint32
+            ).reshape(result["shape"])
+
+            assert result["shape"] == [3, 256]
+            assert result["order"] == "rgb"
+            assert counts.sum(axis=1).tolist() == [result["total_pixels"]] * 3
+            for row, channel in zip(counts, "rgb"):
+                normalized = np.round(row / result["total_pixels"], 6).tolist()
+                assert normalized == lists["channels"][channel]
+        finally:
+            os.unlink(path)
+
     def test_get_dominant_colors(self):
         """Test dominant colors extraction."""
         path = create_test_image(50, 50, (255, 0, 0))  # Single color
         try:
             result = analyze.get_dominant_colors(path, num_colors=3)
-            assert len(result["colors"]) == 3
-            # First color should dominate
-            assert result["colors"][0]["percentage"] > 90
+            # Only colors present in the image are returned
+            assert len(result["colors"]) == 1
+            assert result["colors"][0]["percentage"] == 100
+            # (255, 0, 0) is blue in BGR; allow for JPEG rounding
+            r, g, b = result["colors"][0]["rgb"]
+            assert b > 240 and r < 16 and g < 16
             assert "hex" in result["colors"][0]
-            assert "rgb" in result["colors"][0]
+        finally:
+            os.unlink(path)
+
+    def test_get_dominant_colors_ordering(self):
+        """Test dominant colors are sorted by prevalence."""
+        img = np.zeros((100, 100, 3), dtype=np.uint8)
+        img[:, :70] = (255, 0, 0)  # Blue in BGR, 70%
+        img[:, 70:] = (0, 255, 0)  # Green, 30%
+        fd, path = tempfile.mkstemp(suffix=".png")
+        os.close(fd)
+        cv2.imwrite(path, img)
+        try:
+            colors = analyze.get_dominant_colors(path, num_colors=5)["colors"]
+            assert [c["hex"] for c in colors] == ["#0000FF", "#00FF00"]
+            assert [c["percentage"] for c in colors] == [70.0, 30.0]
+        finally:
+            os.unlink(path)
+
+    def test_get_stats_cached_until_file_changes(self):
+        """Test repeated calls reuse cached stats until the file is rewritten."""
+        path = create_test_image(color=(0, 0, 0))
+        try:
+            analyze.clear_analysis_cache()
+            first = analyze.get_stats(path)
+            with patch("optic_mcp.analyze.cv2.imread") as mock_imread:
+                assert analyze.get_stats(path) == first
+                mock_imread.assert_not_called()
+
+            img = np.full((100, 100, 3), 255, dtype=np.uint8)
+            cv2.imwrite(path, img)
+            os.utime(path, ns=(0, 0))
+            assert analyze.get_stats(path)["brightness"] > first["brightness"]
         finally:
             os.unlink(path)
 
@@ -2,6 +2,7 @@
 
 import os
 import tempfile
+from unittest.mock import patch
 
 import cv2
 import numpy as np
@@ -62,10 +63,22 @@ class TestCompare:
         finally:
             os.unlink(path)
 
-    def test_image_diff(self):
+    def test_get_hash_cached(self):
+        """Test repeated hashing of an unchanged file skips decoding."""
+        path = create_test_image()
+        try:
+            compare.clear_hash_cache()
+            first = compare.get_hash(path, "ahash")
+            with patch("optic_mcp.compare.cv2.imread") as mock_imread:
+                assert compare.get_hash(path, "ahash") == first
+                mock_imread.assert_not_called()
+        finally:
+            os.unlink(path)
+
+    def test_image_diff(self, output_dir):
         """Test image diff creates output file."""
         path = create_test_image()
-        output_path = "/tmp/test_diff.png"
+        output_path = str(output_dir / "diff.png")
         try:
             result = compare.image_diff(path, path, output_path)
             assert result["status"] == "success"
@@ -73,8 +86,41 @@ class TestCompare:
             assert os.path.exists(output_path)
         finally:
             os.unlink(path)
-            if os.path.exists(output_path):
-                os.unlink(output_path)
+
+    def test_image_diff_identical_files_decode_once(self, output_dir):
+        """Test image diff of byte-identical files decodes one image, not both."""
+        path = create_test_image()
+        fd, copy_path = tempfile.mkstemp(suffix=".jpg")
+        os.close(fd)
+        output_path = str(output_dir / "diff_identical.png")
+        try:
+            with open(path, "rb") as src, open(copy_path, "wb") as dst:
+                dst.write(src.read())
+
+            with patch("optic_mcp.compare.cv2.imread", wraps=cv2.imread) as mock_imread:
+                result = compare.image_diff(path, copy_path, output_path)
+
+            mock_imread.assert_called_once_with(copy_path)
+            assert result["diff_pixels"] == 0
+            assert result["diff_percentage"] == 0
+            # Same decoded 8-bit BGR output as the normal diff path writes
+            assert np.array_equal(cv2.imread(output_path), cv2.imread(copy_path))
+        finally:
+            os.unlink(path)
+            os.unlink(copy_path)
+
+    def test_image_diff_identical_corrupt_files_rejected(self, output_dir):
+        """Test byte-identical files that are not decodable images still raise."""
+        path = create_test_image()
+        try:
+            with open(path, "r+b") as f:
+                f.truncate(16)
+            output_path = output_dir / "diff.jpg"
+            with pytest.raises(ValueError, match="Failed to load image"):
+                compare.image_diff(path, path, str(output_path))
+            assert not output_path.exists()
+        finally:
+            os.unlink(path)
 
     def test_compare_histograms(self):
         """Test histogram comparison returns score."""
@@ -86,6 +132,40 @@ class TestCompare:
         finally:
             os.unlink(path)
 
+    def test_compare_hash_batch_matches_pairwise(self):
+        """Test batch hash distances match compare_hash for each pair."""
+        paths = [create_test_image(color=c) for c in [(0, 0, 0), (128, 128, 128)]]
+        paths.append(paths[0])
+        try:
+            result = compare.compare_hash_batch(paths, "dhash")
+            for i in range(3):
+                for j in range(3):
+                    pair = compare.compare_hash(paths[i], paths[j], "dhash")
+                    assert result["distances"][i][j] == pair["distance"]
+            assert [0, 2] in result["similar_pairs"]
+        finally:
+            for path in set(paths):
+                os.unlink(path)
+
+    def test_compare_mse_batch_matches_pairwise(self):
+        """Test batch MSE values match compare_mse for each pair."""
+        paths = [create_test_image(color=c) for c in [(0, 0, 0), (10, 20, 30), (200, 200, 200)]]
+        try:
+            result = compare.compare_mse_batch(paths)
+            for i in range(3):
+                for j in range(3):
+                    pair = compare.compare_mse(paths[i], paths[j])
+                    assert result["mse"][i][j] == pytest.approx(pair["mse"])
+            assert result["identical_pairs"] == []
+        finally:
+            for path in paths:
+                os.unlink(path)
+
+    def test_compare_batch_rejects_empty(self):
+        """Test batch comparison rejects an empty list."""
+        with pytest.raises(ValueError):
+            compare.compare_hash_batch([])
+
     def test_file_not_found(self):
         """Test FileNotFoundError for missing files."""
         with pytest.raises(FileNotFoundError):
@@ -2,6 +2,7 @@
 
 import os
 import tempfile
+from unittest.mock import patch
 
 import cv2
 import numpy as np
@@ -45,6 +46,17 @@ class TestDetect:
         finally:
             os.unlink(path)
 
+    def test_haar_cascade_loaded_once(self):
+        """Test the Haar cascade is shared between detect_faces calls."""
+        path = create_test_image()
+        try:
+            detect.prewarm_models()
+            with patch("optic_mcp.detect.cv2.CascadeClassifier") as mock_cascade:
+                detect.detect_faces(path)
+                mock_cascade.assert_not_called()
+        finally:
+            os.unlink(path)
+
     def test_detect_faces_invalid_method(self):
         """Test detect_faces raises on invalid method."""
         path = create_test_image()
@@ -54,10 +66,10 @@ class TestDetect:
         finally:
             os.unlink(path)
 
-    def test_detect_faces_save(self):
+    def test_detect_faces_save(self, output_dir):
         """Test detect_faces_save creates output file."""
         path = create_test_image()
-        output_path = "/tmp/test_faces.png"
+        output_path = str(output_dir / "faces.png")
         try:
             result = detect.detect_faces_save(path, output_path)
             assert "found" in result
@@ -65,8 +77,6 @@ class TestDetect:
             assert os.path.exists(output_path)
         finally:
             os.unlink(path)
-            if os.path.exists(output_path):
-                os.unlink(output_path)
 
     def test_detect_motion(self):
         """Test detect_motion detects changes between images."""
@@ -82,10 +92,10 @@ class TestDetect:
             os.unlink(path1)
             os.unlink(path2)
 
-    def test_detect_edges(self):
+    def test_detect_edges(self, output_dir):
         """Test detect_edges creates output file."""
         path = create_test_image()
-        output_path = "/tmp/test_edges.png"
+        output_path = str(output_dir / "edges.png")
         try:
             result = detect.detect_edges(path, output_path, method="canny")
             assert result["status"] == "success"
@@ -93,15 +103,13 @@ class TestDetect:
             assert os.path.exists(output_path)
         finally:
             os.unlink(path)
-            if os.path.exists(output_path):
-                os.unlink(output_path)
 
-    def test_detect_edges_invalid_method(self):
+    def test_detect_edges_invalid_method(self, output_dir):
         """Test detect_edges raises on invalid method."""
         path = create_test_image()
         try:
             with pytest.raises(ValueError, match="Invalid method"):
-                detect.detect_edges(path, "/tmp/out.png", method="invalid")
+                detect.detect_edges(path, str(output_dir / "out.png"), method="invalid")
         finally:
             os.unlink(path)
 
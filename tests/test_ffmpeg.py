@@ -0,0 +1,120 @@
+"""Tests for shared FFmpeg capture options."""
+
+import os
+import threading
+
+import pytest
+
+from optic_mcp.ffmpeg import CAPTURE_OPTIONS_ENV, HLS_LOW_LATENCY_OPTIONS, capture_options
+
+
+def test_capture_options_shared_by_concurrent_opens():
+    """Test opens with the same options share the variable until the last one leaves."""
+    first_inside = threading.Event()
+    second_inside = threading.Event()
+    release_first = threading.Event()
+    seen = {}
+
+    def first():
+        with capture_options("probesize;32768"):
+            first_inside.set()
+            release_first.wait(timeout=2)
+            seen["first"] = os.environ.get(CAPTURE_OPTIONS_ENV)
+
+    def second():
+        first_inside.wait(timeout=2)
+        with capture_options("probesize;32768"):
+            second_inside.set()
+            seen["second"] = os.environ.get(CAPTURE_OPTIONS_ENV)
+        # first is still inside, so the variable must survive second leaving
+        seen["after_second"] = os.environ.get(CAPTURE_OPTIONS_ENV)
+        release_first.set()
+
+    threads = [threading.Thread(target=first), threading.Thread(target=second)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert second_inside.is_set()
+    assert seen == {
+        "first": "probesize;32768",
+        "second": "probesize;32768",
+        "after_second": "probesize;32768",
+    }
+    assert CAPTURE_OPTIONS_ENV not in os.environ
+
+
+def test_capture_options_different_options_wait():
+    """Test an open with different options waits until the current ones are released."""
+    first_inside = threading.Event()
+    release_first = threading.Event()
+    seen = []
+
+    def first():
+        with capture_options("rtsp_transport;tcp"):
+            first_inside.set()
+            release_first.wait(timeout=2)
+            seen.append(("first", os.environ.get(CAPTURE_OPTIONS_ENV)))
+
+    def second():
+        with capture_options("probesize;32768"):
+            seen.append(("second", os.environ.get(CAPTURE_OPTIONS_ENV)))
+
+    first_thread = threading.Thread(target=first)
+    first_thread.start()
+    assert first_inside.wait(timeout=2)
+
+    second_thread = threading.Thread(target=second)
+    second_thread.start()
+    second_thread.join(timeout=0.1)
+    # Still blocked: the variable holds first's options
+    assert second_thread.is_alive()
+    assert seen == []
+
+    release_first.set()
+    first_thread.join(timeout=2)
+    second_thread.join(timeout=2)
+
+    assert seen == [("first", "rtsp_transport;tcp"), ("second", "probesize;32768")]
+    assert CAPTURE_OPTIONS_ENV not in os.environ
+
+
+@pytest.mark.parametrize("user_options", [None, "rtsp_transport;udp"])
+def test_capture_options_default_opens_hold_the_variable(monkeypatch, user_options):
+    """Test opens with OpenCV's defaults or the user's options block other option sets."""
+    if user_options is None:
+        monkeypatch.delenv(CAPTURE_OPTIONS_ENV, raising=False)
+    else:
+        monkeypatch.setenv(CAPTURE_OPTIONS_ENV, user_options)
+    first_inside = threading.Event()
+    release_first = threading.Event()
+    seen = []
+
+    def first():
+        with capture_options(""):
+            first_inside.set()
+            release_first.wait(timeout=2)
+            seen.append(("first", os.environ.get(CAPTURE_OPTIONS_ENV)))
+
+    def second():
+        with capture_options(HLS_LOW_LATENCY_OPTIONS):
+            seen.append(("second", os.environ.get(CAPTURE_OPTIONS_ENV)))
+
+    first_thread = threading.Thread(target=first)
+    first_thread.start()
+    assert first_inside.wait(timeout=2)
+
+    second_thread = threading.Thread(target=second)
+    second_thread.start()
+    second_thread.join(timeout=0.1)
+    # Without a user variable, second must wait instead of changing first's options
+    assert second_thread.is_alive() == (user_options is None)
+
+    release_first.set()
+    first_thread.join(timeout=2)
+    second_thread.join(timeout=2)
+
+    expected_second = HLS_LOW_LATENCY_OPTIONS if user_options is None else user_options
+    assert sorted(seen) == [("first", user_options), ("second", expected_second)]
+    assert os.environ.get(CAPTURE_OPTIONS_ENV) == user_options
@@ -1,28 +1,37 @@
 """Tests for HLS stream functions."""
 
+import os
 from unittest.mock import MagicMock, patch
+import cv2
 import numpy as np
+import pytest
 
 
-@patch("optic_mcp.hls.cv2")
-def test_save_image_success(mock_cv2):
+@pytest.fixture
+def mock_cv2():
+    """cv2 as seen by the hls module and ffmpeg.open_capture, patched with one mock."""
+    with patch("optic_mcp.hls.cv2") as mock, patch("optic_mcp.ffmpeg.cv2", mock):
+        yield mock
+
+
+def test_save_image_success(mock_cv2, blank_frame, output_dir):
     """Test HLS save_image saves file successfully."""
-    mock_cap = MagicMock()
+    mock_cap = MagicMock(spec=cv2.VideoCapture)
     mock_cap.isOpened.return_value = True
-    mock_cap.read.return_value = (True, np.zeros((480, 640, 3), dtype=np.uint8))
+    mock_cap.read.return_value = (True, blank_frame)
     mock_cv2.VideoCapture.return_value = mock_cap
     mock_cv2.CAP_FFMPEG = 1900
 
     from optic_mcp.hls import save_image
 
-    result = save_image(hls_url="http://example.com/stream.m3u8", file_path="/tmp/test.jpg")
-    assert "Image saved to /tmp/test.jpg" in result
+    file_path = str(output_dir / "test.jpg")
+    result = save_image(hls_url="http://example.com/stream.m3u8", file_path=file_path)
+    assert f"Image saved to {file_path}" in result
 
 
-@patch("optic_mcp.hls.cv2")
 def test_check_stream_available(mock_cv2):
     """Test check_stream returns info for available stream."""
-    mock_cap = MagicMock()
+    mock_cap = MagicMock(spec=cv2.VideoCapture)
     mock_cap.isOpened.return_value = True
     mock_cap.read.return_value = (True, np.zeros((1080, 1920, 3), dtype=np.uint8))
     mock_cap.get.side_effect = lambda prop: {3: 1920, 4: 1080, 5: 25.0, 6: 0}.get(prop, 0)
@@ -39,3 +48,24 @@ def test_check_stream_available(mock_cv2):
     result = check_stream(hls_url="http://example.com/stream.m3u8")
     assert result["status"] == "available"
     assert result["width"] == 1920
+
+
+def test_save_image_low_latency_options(mock_cv2, blank_frame, output_dir):
+    """Test HLS opens use low-latency FFmpeg options unless disabled."""
+    from optic_mcp.ffmpeg import CAPTURE_OPTIONS_ENV, HLS_LOW_LATENCY_OPTIONS
+    from optic_mcp.hls import save_image
+
+    options_at_open = []
+    mock_cap = MagicMock(spec=cv2.VideoCapture)
+    mock_cap.isOpened.return_value = True
+    mock_cap.read.return_value = (True, blank_frame)
+    mock_cv2.VideoCapture.side_effect = lambda *args: (
+        options_at_open.append(os.environ.get(CAPTURE_OPTIONS_ENV)) or mock_cap
+    )
+
+    file_path = str(output_dir / "frame.jpg")
+    save_image(hls_url="http://example.com/stream.m3u8", file_path=file_path)
+    save_image(hls_url="http://example.com/stream.m3u8", file_path=file_path, low_latency=False)
+
+    assert options_at_open == [HLS_LOW_LATENCY_OPTIONS, None]
+    assert CAPTURE_OPTIONS_ENV not in os.environ
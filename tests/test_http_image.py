@@ -0,0 +1,45 @@
+"""Tests for HTTP image functions."""
+
+from unittest.mock import MagicMock, patch
+
+
+def _mock_response(status_code: int, headers: dict) -> MagicMock:
+    """Create a fake requests response."""
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = headers
+    return response
+
+
+@patch("optic_mcp.http_image.requests")
+def test_check_image_head(mock_requests):
+    """Test check_image uses HEAD only when the server supports it."""
+    mock_requests.head.return_value = _mock_response(
+        200, {"Content-Type": "image/jpeg", "Content-Length": "2048"}
+    )
+
+    from optic_mcp.http_image import check_image
+
+    result = check_image("http://example.com/image.jpg")
+    assert result["status"] == "available"
+    assert result["size_bytes"] == 2048
+    mock_requests.get.assert_not_called()
+
+
+@patch("optic_mcp.http_image.requests")
+def test_check_image_range_fallback(mock_requests):
+    """Test check_image falls back to a one-byte ranged GET when HEAD is rejected."""
+    mock_requests.head.return_value = _mock_response(405, {})
+    mock_requests.get.return_value = _mock_response(
+        206,
+        {"Content-Type": "image/png", "Content-Length": "1", "Content-Range": "bytes 0-0/4096"},
+    )
+
+    from optic_mcp.http_image import check_image
+
+    result = check_image("http://example.com/image.png")
+    assert result["status"] == "available"
+    assert result["size_bytes"] == 4096
+    assert mock_requests.get.call_args.kwargs["headers"] == {"Range": "bytes=0-0"}
+    assert mock_requests.get.call_args.kwargs["stream"] is True
+    mock_requests.get.return_value.close.assert_called_once()
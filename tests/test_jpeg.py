@@ -0,0 +1,42 @@
+"""Tests for JPEG encoding helpers."""
+
+import os
+import tempfile
+
+import cv2
+import numpy as np
+
+from optic_mcp import jpeg
+
+
+def test_save_jpeg_roundtrip():
+    """Test save_jpeg writes a decodable JPEG and returns its size."""
+    img = np.full((40, 60, 3), (0, 0, 255), dtype=np.uint8)
+    fd, path = tempfile.mkstemp(suffix=".jpg")
+    os.close(fd)
+    try:
+        size = jpeg.save_jpeg(path, img)
+        assert size == os.path.getsize(path)
+        decoded = cv2.imread(path)
+        assert decoded.shape == (40, 60, 3)
+        assert decoded[20, 30, 2] > 200
+    finally:
+        os.unlink(path)
+
+
+def test_encode_jpeg_bgra():
+    """Test BGRA input encodes to a 3-channel JPEG."""
+    img = np.zeros((8, 8, 4), dtype=np.uint8)
+    data = jpeg.encode_jpeg(img)
+    assert bytes(memoryview(data).cast("B")[:2]) == b"\xff\xd8"
+
+
+def test_encode_jpeg_uses_420_subsampling():
+    """Test frames are encoded with 2x2 luma and 1x1 chroma sampling factors."""
+    data = bytes(memoryview(jpeg.encode_jpeg(np.zeros((16, 16, 3), dtype=np.uint8))).cast("B"))
+    # SOF0 segment: marker, length(2), precision, height(2), width(2), components,
+    # then (id, sampling factors, quant table) per component
+    sof = data.index(b"\xff\xc0")
+    components = data[sof + 9]
+    factors = [data[sof + 11 + 3 * i] for i in range(components)]
+    assert factors == [0x22, 0x11, 0x11]
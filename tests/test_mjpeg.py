@@ -0,0 +1,46 @@
+"""Tests for MJPEG stream functions."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+
+FRAME = b"\xff\xd8" + b"\x00" * 100 + b"\xff\xd9"
+
+
+def test_read_jpeg_frame_split_markers():
+    """Test frame extraction when markers are split across chunks."""
+    from optic_mcp.mjpeg import _read_jpeg_frame
+
+    stream = b"--frame\r\nContent-Type: image/jpeg\r\n\r\n" + FRAME + b"\r\n--frame"
+    split_at = stream.index(b"\xd8")  # Between the two start marker bytes
+    chunks = [stream[:split_at], stream[split_at:-12], stream[-12:-11], stream[-11:]]
+
+    assert _read_jpeg_frame(iter(chunks), max_bytes=1024) == FRAME
+
+
+def test_read_jpeg_frame_limits():
+    """Test frame extraction gives up past max_bytes and on a truncated stream."""
+    from optic_mcp.mjpeg import _read_jpeg_frame
+
+    with pytest.raises(ValueError):
+        _read_jpeg_frame(iter([b"\xff\xd8" + b"\x00" * 64] * 4), max_bytes=128)
+
+    assert _read_jpeg_frame(iter([b"\xff\xd8\x00"]), max_bytes=128) is None
+
+
+@patch("optic_mcp.mjpeg.requests")
+def test_save_image_success(mock_requests, output_dir):
+    """Test save_image writes the first JPEG frame from the stream."""
+    response = MagicMock()
+    response.status_code = 200
+    response.iter_content.return_value = iter([b"--frame\r\n\r\n", FRAME[:50], FRAME[50:]])
+    mock_requests.get.return_value = response
+
+    from optic_mcp.mjpeg import save_image
+
+    output_path = output_dir / "test_mjpeg.jpg"
+    result = save_image("http://example.com/video.mjpg", str(output_path))
+    assert result["size_bytes"] == len(FRAME)
+    assert output_path.read_bytes() == FRAME
+    response.close.assert_called_once()
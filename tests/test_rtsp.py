@@ -1,28 +1,37 @@
 """Tests for RTSP stream functions."""
 
+import os
 from unittest.mock import MagicMock, patch
+import cv2
 import numpy as np
+import pytest
 
 
-@patch("optic_mcp.rtsp.cv2")
-def test_save_image_success(mock_cv2):
+@pytest.fixture
+def mock_cv2():
+    """cv2 as seen by the rtsp module and ffmpeg.open_capture, patched with one mock."""
+    with patch("optic_mcp.rtsp.cv2") as mock, patch("optic_mcp.ffmpeg.cv2", mock):
+        yield mock
+
+
+def test_save_image_success(mock_cv2, blank_frame, output_dir):
     """Test RTSP save_image saves file successfully."""
-    mock_cap = MagicMock()
+    mock_cap = MagicMock(spec=cv2.VideoCapture)
     mock_cap.isOpened.return_value = True
-    mock_cap.read.return_value = (True, np.zeros((480, 640, 3), dtype=np.uint8))
+    mock_cap.read.return_value = (True, blank_frame)
     mock_cv2.VideoCapture.return_value = mock_cap
     mock_cv2.CAP_FFMPEG = 1900
 
     from optic_mcp.rtsp import save_image
 
-    result = save_image(rtsp_url="rtsp://192.168.1.100:554/stream", file_path="/tmp/test.jpg")
-    assert "Image saved to /tmp/test.jpg" in result
+    file_path = str(output_dir / "test.jpg")
+    result = save_image(rtsp_url="rtsp://192.168.1.100:554/stream", file_path=file_path)
+    assert f"Image saved to {file_path}" in result
 
 
-@patch("optic_mcp.rtsp.cv2")
 def test_check_stream_available(mock_cv2):
     """Test check_stream returns info for available stream."""
-    mock_cap = MagicMock()
+    mock_cap = MagicMock(spec=cv2.VideoCapture)
     mock_cap.isOpened.return_value = True
     mock_cap.read.return_value = (True, np.zeros((1080, 1920, 3), dtype=np.uint8))
     mock_cap.get.side_effect = lambda prop: {3: 1920, 4: 1080, 5: 30.0, 6: 0}.get(prop, 0)
@@ -39,3 +48,80 @@ def test_check_stream_available(mock_cv2):
     result = check_stream(rtsp_url="rtsp://192.168.1.100:554/stream")
     assert result["status"] == "available"
     assert result["width"] == 1920
+
+
+def test_check_stream_quick(mock_cv2):
+    """Test quick check_stream opens with minimal probing and skips decoding."""
+    from optic_mcp.ffmpeg import CAPTURE_OPTIONS_ENV, QUICK_PROBE_OPTIONS, RTSP_TRANSPORT_OPTIONS
+    from optic_mcp.rtsp import check_stream
+
+    options_at_open = []
+    mock_cap = MagicMock(spec=cv2.VideoCapture)
+    mock_cap.isOpened.return_value = True
+    mock_cap.grab.return_value = True
+    mock_cap.getBackendName.return_value = "FFMPEG"
+    mock_cv2.VideoCapture.side_effect = lambda *args: (
+        options_at_open.append(os.environ.get(CAPTURE_OPTIONS_ENV)) or mock_cap
+    )
+
+    result = check_stream(rtsp_url="rtsp://192.168.1.100:554/stream", quick=True)
+
+    assert result == {
+        "status": "available",
+        "url": "rtsp://192.168.1.100:554/stream",
+        "backend": "FFMPEG",
+    }
+    assert len(options_at_open) == 1
+    assert options_at_open[0].startswith(RTSP_TRANSPORT_OPTIONS)
+    assert options_at_open[0].endswith(QUICK_PROBE_OPTIONS)
+    assert CAPTURE_OPTIONS_ENV not in os.environ
+    mock_cap.read.assert_not_called()
+
+
+def test_save_image_low_latency_options(mock_cv2, blank_frame, output_dir):
+    """Test RTSP opens use low-latency FFmpeg options unless disabled."""
+    from optic_mcp.ffmpeg import CAPTURE_OPTIONS_ENV, RTSP_LOW_LATENCY_OPTIONS
+    from optic_mcp.rtsp import save_image
+
+    options_at_open = []
+    mock_cap = MagicMock(spec=cv2.VideoCapture)
+    mock_cap.isOpened.return_value = True
+    mock_cap.read.return_value = (True, blank_frame)
+    mock_cv2.VideoCapture.side_effect = lambda *args: (
+        options_at_open.append(os.environ.get(CAPTURE_OPTIONS_ENV)) or mock_cap
+    )
+
+    file_path = str(output_dir / "test.jpg")
+    save_image(rtsp_url="rtsp://192.168.1.100:554/stream", file_path=file_path)
+    save_image(
+        rtsp_url="rtsp://192.168.1.100:554/stream",
+        file_path=file_path,
+        low_latency=False,
+    )
+
+    assert RTSP_LOW_LATENCY_OPTIONS in options_at_open[0]
+    assert "rtsp_transport;tcp" in options_at_open[0]
+    assert options_at_open[1] is None
+    assert CAPTURE_OPTIONS_ENV not in os.environ
+
+
+def test_user_capture_options_are_kept(mock_cv2, blank_frame, output_dir):
+    """Test a user-set OPENCV_FFMPEG_CAPTURE_OPTIONS is not overridden."""
+    from optic_mcp.ffmpeg import CAPTURE_OPTIONS_ENV
+    from optic_mcp.rtsp import save_image
+
+    options_at_open = []
+    mock_cap = MagicMock(spec=cv2.VideoCapture)
+    mock_cap.isOpened.return_value = True
+    mock_cap.read.return_value = (True, blank_frame)
+    mock_cv2.VideoCapture.side_effect = lambda *args: (
+        options_at_open.append(os.environ.get(CAPTURE_OPTIONS_ENV)) or mock_cap
+    )
+
+    with patch.dict(os.environ, {CAPTURE_OPTIONS_ENV: "rtsp_transport;udp"}):
+        save_image(
+            rtsp_url="rtsp://192.168.1.100:554/stream", file_path=str(output_dir / "test.jpg")
+        )
+        assert os.environ[CAPTURE_OPTIONS_ENV] == "rtsp_transport;udp"
+
+    assert options_at_open == ["rtsp_transport;udp"]
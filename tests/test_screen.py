@@ -0,0 +1,125 @@
+"""Tests for screen capture functions."""
+
+import os
+from unittest.mock import MagicMock, patch
+
+import mss.exception
+import pytest
+
+
+def _mock_screenshot(width: int = 4, height: int = 2) -> MagicMock:
+    """Create a fake mss screenshot with real RGB bytes."""
+    screenshot = MagicMock()
+    screenshot.width = width
+    screenshot.height = height
+    screenshot.size = (width, height)
+    screenshot.rgb = bytes(width * height * 3)
+    screenshot.bgra = bytes(width * height * 4)
+    return screenshot
+
+
+@patch("optic_mcp.screen.mss")
+def test_save_all_monitors(mock_mss, output_dir):
+    """Test save_all_monitors saves one file per individual monitor."""
+    sct = mock_mss.mss.return_value.__enter__.return_value
+    sct.monitors = [{}, {}, {}]  # combined + 2 monitors
+    sct.grab.return_value = _mock_screenshot()
+
+    from optic_mcp.screen import save_all_monitors
+
+    result = save_all_monitors(str(output_dir), extension=".jpg")
+    assert result["status"] == "success"
+    assert result["count"] == 2
+    assert [img["monitor"] for img in result["images"]] == [1, 2]
+    assert result["images"][0]["file_path"] == str(output_dir / "monitor_1.jpg")
+    assert all(os.path.exists(img["file_path"]) for img in result["images"])
+
+
+@patch("optic_mcp.screen.mss")
+def test_save_image_png(mock_mss, output_dir):
+    """Test save_image writes PNG bytes produced by mss in one pass."""
+    sct = mock_mss.mss.return_value.__enter__.return_value
+    sct.monitors = [{}, {}]
+    sct.grab.return_value = _mock_screenshot()
+    mock_mss.tools.to_png.return_value = b"\x89PNG fake"
+
+    from optic_mcp.screen import save_image
+
+    output_path = output_dir / "test_screen.png"
+    result = save_image(str(output_path), monitor=1)
+    assert result["status"] == "success"
+    assert output_path.read_bytes() == b"\x89PNG fake"
+
+
+@patch("optic_mcp.screen.mss")
+def test_list_monitors_cached(mock_mss):
+    """Test list_monitors reuses cached results until the cache is cleared."""
+    sct = mock_mss.mss.return_value.__enter__.return_value
+    sct.monitors = [{"left": 0, "top": 0, "width": 1920, "height": 1080}] * 2
+
+    from optic_mcp.screen import clear_monitor_cache, list_monitors
+
+    clear_monitor_cache()
+    first = list_monitors()
+    second = list_monitors()
+    assert first == second
+    assert len(first) == 2
+    assert mock_mss.mss.call_count == 1
+
+    clear_monitor_cache()
+    list_monitors()
+    assert mock_mss.mss.call_count == 2
+    clear_monitor_cache()
+
+
+@patch("optic_mcp.screen.mss")
+def test_save_region_capture_error(mock_mss, output_dir):
+    """Test capture failures surface as RuntimeError chained to the mss error."""
+    mock_mss.exception.ScreenShotError = mss.exception.ScreenShotError
+    sct = mock_mss.mss.return_value.__enter__.return_value
+    sct.grab.side_effect = mss.exception.ScreenShotError("no display")
+
+    from optic_mcp.screen import save_region
+
+    with pytest.raises(RuntimeError, match="no display") as exc_info:
+        save_region(str(output_dir / "test_region.png"), 0, 0, 10, 10)
+    assert isinstance(exc_info.value.__cause__, mss.exception.ScreenShotError)
+
+
+@patch("optic_mcp.screen.mss")
+def test_save_images_sequence(mock_mss, output_dir):
+    """Test save_images writes one file per frame in capture order."""
+    sct = mock_mss.mss.return_value.__enter__.return_value
+    sct.monitors = [{}, {}]
+    sct.grab.return_value = _mock_screenshot()
+
+    from optic_mcp.screen import save_images
+
+    result = save_images(
+        str(output_dir / "test_seq_{index}.jpg"), count=3, interval_ms=0, monitor=1
+    )
+    assert result["count"] == 3
+    assert [img["file_path"] for img in result["images"]] == [
+        str(output_dir / f"test_seq_{i}.jpg") for i in range(3)
+    ]
+    assert sct.grab.call_count == 3
+    assert all(os.path.exists(img["file_path"]) for img in result["images"])
+
+
+def test_save_images_requires_index_placeholder(output_dir):
+    """Test save_images rejects a path template without {index}."""
+    from optic_mcp.screen import save_images
+
+    with pytest.raises(ValueError, match="index"):
+        save_images(str(output_dir / "frame.jpg"), count=2)
+
+
+def test_save_images_caps_total_duration(output_dir):
+    """Test save_images rejects sequences lasting longer than a minute."""
+    from optic_mcp.screen import MAX_SEQUENCE_DURATION_MS, save_images
+
+    path_template = str(output_dir / "frame_{index}.jpg")
+    with pytest.raises(ValueError, match="count \\* interval_ms"):
+        save_images(path_template, count=100, interval_ms=1000)
+    with pytest.raises(ValueError, match="count \\* interval_ms"):
+        save_images(path_template, count=2, interval_ms=MAX_SEQUENCE_DURATION_MS // 2 + 1)
@@ -1,7 +1,26 @@
 """Tests for OpticMCP server module structure."""
 
+import asyncio
+import os
+import subprocess
+import sys
+import threading
+from unittest.mock import patch
+from urllib.parse import quote
+
 import pytest
 
+from optic_mcp import detect
+
+
+@pytest.fixture(scope="module")
+def server():
+    """Import the server module once, skipping if mcp is not installed."""
+    pytest.importorskip("mcp")
+    from optic_mcp import server as server_module
+
+    return server_module
+
 
 def test_import_module():
     """Test that the module can be imported."""
@@ -11,13 +30,8 @@ def test_import_module():
     assert optic_mcp.__version__.count(".") == 2
 
 
-def test_mcp_tools_registered():
+def test_mcp_tools_registered(server):
     """Test that all MCP tools are available."""
-    # Skip if mcp is not installed
-    pytest.importorskip("mcp")
-
-    from optic_mcp import server
-
     # USB tools
     assert hasattr(server, "list_cameras")
     assert hasattr(server, "save_image")
@@ -34,3 +48,172 @@ def test_mcp_tools_registered():
     # Dashboard tools
     assert hasattr(server, "start_dashboard")
     assert hasattr(server, "stop_dashboard")
+
+
+def test_tool_registry(server):
+    """Test that every tool in the registry is registered with FastMCP."""
+    registered = set(server.mcp._tool_manager._tools)
+    assert {tool.__name__ for tool in server.TOOLS} <= registered
+    if server.DECODE_AVAILABLE:
+        assert {tool.__name__ for tool in server.DECODE_TOOLS} <= registered
+
+
+def test_import_tool_waits_for_import_lock(server):
+    """Test loaded tool modules are still returned under the import lock, never half-imported."""
+    server._import_tool("usb")
+    with server._IMPORT_LOCK:
+        thread = threading.Thread(target=server._import_tool, args=("usb",))
+        thread.start()
+        thread.join(timeout=0.05)
+        assert thread.is_alive()
+    thread.join(timeout=2)
+    assert not thread.is_alive()
+
+
+def test_probe_libzbar_loads_library_directly(server):
+    """Test the libzbar probe succeeds without importing pyzbar when dlopen works."""
+    with (
+        patch("optic_mcp.server.platform.system", return_value="Linux"),
+        patch("optic_mcp.server.ctypes.CDLL") as mock_cdll,
+        patch.dict(sys.modules, {"pyzbar": None, "pyzbar.pyzbar": None}),
+    ):
+        assert server._probe_libzbar() is True
+    mock_cdll.assert_called_once_with("libzbar.so.0")
+
+
+def test_probe_libzbar_survives_broken_library(server):
+    """Test a libzbar that fails to load disables decode tools instead of raising."""
+    with (
+        patch("optic_mcp.server.platform.system", return_value="Linux"),
+        patch("optic_mcp.server.ctypes.CDLL", side_effect=OSError("broken")),
+    ):
+        assert server._probe_libzbar() is False
+
+    with (
+        patch("optic_mcp.server.platform.system", return_value="Windows"),
+        patch("builtins.__import__", side_effect=OSError("broken")),
+    ):
+        assert server._probe_libzbar() is False
+
+
+def test_detect_faces_output_path_dispatch(server):
+    """Test detect_faces only saves an annotated image when output_path is given."""
+    with (
+        patch.object(detect, "detect_faces") as mock_detect,
+        patch.object(detect, "detect_faces_save") as mock_save,
+    ):
+        server.detect_faces("in.jpg")
+        mock_detect.assert_called_once_with("in.jpg", "haar")
+        mock_save.assert_not_called()
+
+        server.detect_faces("in.jpg", output_path="out.jpg")
+        mock_save.assert_called_once_with("in.jpg", "out.jpg", "haar")
+
+
+def test_read_image_resource(tmp_path, monkeypatch, server):
+    """Test output images can be read back through the optic://image resource."""
+    monkeypatch.setenv("OPTIC_MCP_ALLOWED_DIRS", str(tmp_path))
+    image_path = tmp_path / "capture.jpg"
+    image_path.write_bytes(b"\xff\xd8\xff\xd9")
+
+    uri = "optic://image/" + quote(str(image_path), safe="")
+    contents = list(asyncio.run(server.mcp.read_resource(uri)))
+    assert contents[0].content == b"\xff\xd8\xff\xd9"
+
+    outside = "optic://image/" + quote("/etc/passwd.jpg", safe="")
+    with pytest.raises(Exception, match="not in allowed directories"):
+        asyncio.run(server.mcp.read_resource(outside))
+
+
+def test_read_image_rejects_symlink_escape(tmp_path, monkeypatch, server):
+    """Test a symlink inside an allowed directory can't expose files outside it."""
+    allowed = tmp_path / "allowed"
+    allowed.mkdir()
+    secret = tmp_path / "secret.jpg"
+    secret.write_bytes(b"secret")
+    monkeypatch.setenv("OPTIC_MCP_ALLOWED_DIRS", str(allowed))
+
+    (allowed / "escape.jpg").symlink_to(secret)
+    uri = "optic://image/" + quote(str(allowed / "escape.jpg"), safe="")
+    with pytest.raises(Exception, match="resolves outside the allowed directories"):
+        asyncio.run(server.mcp.read_resource(uri))
+
+    # Symlinks to images that stay inside the allowed directories still work
+    (allowed / "real.jpg").write_bytes(b"\xff\xd8\xff\xd9")
+    (allowed / "link.jpg").symlink_to(allowed / "real.jpg")
+    uri = "optic://image/" + quote(str(allowed / "link.jpg"), safe="")
+    assert list(asyncio.run(server.mcp.read_resource(uri)))[0].content == b"\xff\xd8\xff\xd9"
+
+
+def test_server_import_is_lazy():
+    """Test that tool modules and their heavy dependencies load only when a tool runs."""
+    pytest.importorskip("mcp")
+
+    code = (
+        "import sys, optic_mcp.server\n"
+        "heavy = ('cv2', 'numpy', 'PIL', 'mss', 'requests')\n"
+        "loaded = [m for m in sys.modules if m.split('.')[0] in heavy]\n"
+        "loaded += [m for m in sys.modules if m.startswith('optic_mcp.')"
+        " and m != 'optic_mcp.server']\n"
+        "print(', '.join(loaded))"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    assert result.returncode == 0
+    assert result.stdout.strip() == ""
+
+
+@pytest.mark.parametrize(
+    "env, transport",
+    [
+        ({}, "stdio"),
+        ({"OPTIC_MCP_TRANSPORT": "streamable-http", "OPTIC_MCP_PORT": "8123"}, "streamable-http"),
+    ],
+)
+def test_main_transport(monkeypatch, env, transport, server):
+    """Test main() selects the transport from OPTIC_MCP_TRANSPORT."""
+    monkeypatch.delenv("OPTIC_MCP_TRANSPORT", raising=False)
+    for key, value in env.items():
+        monkeypatch.setenv(key, value)
+    # main() writes the HTTP host and port into the shared settings; restore them
+    monkeypatch.setattr(server.mcp.settings, "host", server.mcp.settings.host)
+    monkeypatch.setattr(server.mcp.settings, "port", server.mcp.settings.port)
+
+    with patch.object(server.mcp, "run") as mock_run:
+        server.main()
+
+    mock_run.assert_called_once_with(transport=transport)
+    if transport == "streamable-http":
+        assert server.mcp.settings.port == 8123
+
+
+def test_main_prewarm(monkeypatch, server):
+    """Test OPTIC_MCP_PREWARM=1 loads detection models in a background thread."""
+    monkeypatch.delenv("OPTIC_MCP_TRANSPORT", raising=False)
+    monkeypatch.setenv("OPTIC_MCP_PREWARM", "1")
+
+    with (
+        patch.object(server.mcp, "run"),
+        patch.object(detect, "prewarm_models") as mock_prewarm,
+        patch.object(server.threading, "Thread") as mock_thread,
+    ):
+        server.main()
+        mock_thread.assert_called_once_with(target=server._prewarm_detection, daemon=True)
+        mock_thread.return_value.start.assert_called_once()
+
+        server._prewarm_detection()
+        mock_prewarm.assert_called_once()
+
+
+def test_main_rejects_unknown_transport(monkeypatch, server):
+    """Test main() rejects unsupported transports."""
+    monkeypatch.setenv("OPTIC_MCP_TRANSPORT", "carrier-pigeon")
+    with pytest.raises(ValueError, match="Unsupported OPTIC_MCP_TRANSPORT"):
+        server.main()
+
+
+def test_stderr_suppression_is_scoped(server):
+    """Test that stderr is only redirected inside _suppress_opencv_stderr."""
+    before = os.fstat(2)
+    with server._suppress_opencv_stderr():
+        assert os.path.samestat(os.fstat(2), os.stat(os.devnull))
+    assert os.path.samestat(os.fstat(2), before)
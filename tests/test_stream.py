@@ -1,25 +1,59 @@
 """Tests for camera streaming functions."""
 
+import json
+import socket
+import threading
+import time
+import urllib.request
 from unittest.mock import MagicMock, patch
+
+import cv2
 import numpy as np
+import pytest
+
+from optic_mcp.stream import (
+    DASHBOARD_HTML,
+    MJPG_FOURCC,
+    STREAM_JPEG_QUALITY,
+    StreamServer,
+    _encode_frame,
+    _manager,
+    _send_all,
+    list_streams,
+    start_dashboard,
+    start_stream,
+    stop_dashboard,
+    stop_stream,
+)
+from optic_mcp.usb import _capture_pool, close_cameras
+
+
+def _stop_all_streams():
+    """Stop every managed stream (joining its threads) and empty the capture pool."""
+    for camera_index in list(_manager._streams):
+        _manager.stop_stream(camera_index)
+    close_cameras()
+
+
+@pytest.fixture(autouse=True)
+def reset_stream_manager():
+    """Start and end every test with no running streams or pooled captures."""
+    _stop_all_streams()
+    yield
+    _stop_all_streams()
 
 
+@patch("optic_mcp.usb.cv2")
 @patch("optic_mcp.stream.cv2")
-def test_stream_lifecycle(mock_cv2):
+def test_stream_lifecycle(mock_cv2, mock_usb_cv2, blank_frame):
     """Test start, list, and stop stream operations."""
-    mock_cap = MagicMock()
+    mock_cap = MagicMock(spec=cv2.VideoCapture)
     mock_cap.isOpened.return_value = True
     mock_cap.grab.return_value = True
-    mock_cap.retrieve.return_value = (True, np.zeros((480, 640, 3), dtype=np.uint8))
-    mock_cv2.VideoCapture.return_value = mock_cap
-    mock_cv2.imencode.return_value = (True, np.array([255, 216, 255], dtype=np.uint8))
-    mock_cv2.IMWRITE_JPEG_QUALITY = 1
+    mock_cap.retrieve.return_value = (True, blank_frame)
+    mock_usb_cv2.VideoCapture.return_value = mock_cap
     mock_cv2.CAP_PROP_BUFFERSIZE = 38
 
-    from optic_mcp.stream import start_stream, stop_stream, list_streams, _manager
-
-    _manager._streams.clear()
-
     # Start stream
     result = start_stream(camera_index=0, port=18080)
     assert result["status"] == "started"
@@ -30,6 +64,14 @@ def test_stream_lifecycle(mock_cv2):
     assert len(streams) == 1
     assert streams[0]["camera_index"] == 0
 
+    # Frames are encoded as JPEG
+    _, frame = _manager._streams[0].wait_for_frame(0, timeout=2)
+    assert frame is not None and bytes(frame[:2]) == b"\xff\xd8"
+
+    # The dashboard API encoding is reused until the stream set changes
+    assert json.loads(_manager.streams_json()) == streams
+    assert _manager.streams_json() is _manager.streams_json()
+
     # Start again returns already_running
     result = start_stream(camera_index=0, port=18081)
     assert result["status"] == "already_running"
@@ -37,7 +79,314 @@ def test_stream_lifecycle(mock_cv2):
     # Stop stream
     result = stop_stream(camera_index=0)
     assert result["status"] == "stopped"
+    assert json.loads(_manager.streams_json()) == []
 
     # Stop non-existent returns not_running
     result = stop_stream(camera_index=99)
     assert result["status"] == "not_running"
+
+
+@patch("optic_mcp.usb.cv2")
+@patch("optic_mcp.stream.cv2")
+def test_start_stream_waits_for_camera_not_fixed_delay(mock_cv2, mock_usb_cv2):
+    """Test start_stream returns as soon as the camera opens, or fails fast."""
+    mock_cap = MagicMock(spec=cv2.VideoCapture)
+    mock_cap.isOpened.return_value = False
+    mock_usb_cv2.VideoCapture.return_value = mock_cap
+
+    started = time.monotonic()
+    with pytest.raises(RuntimeError, match="Could not open camera"):
+        start_stream(camera_index=0, port=18082)
+    assert time.monotonic() - started < 0.4
+    assert 0 not in _manager._streams
+
+
+@patch("optic_mcp.stream.encode_jpeg", return_value=b"\xff\xd8jpeg")
+@patch("optic_mcp.usb.cv2")
+@patch("optic_mcp.stream.cv2")
+def test_unchanged_frames_are_not_reencoded(mock_cv2, mock_usb_cv2, mock_encode):
+    """Test a camera repeating identical frames is encoded only once."""
+    mock_cap = MagicMock(spec=cv2.VideoCapture)
+    mock_cap.isOpened.return_value = True
+    mock_cap.grab.return_value = True
+    mock_cap.retrieve.side_effect = lambda: (True, np.zeros((48, 64, 3), dtype=np.uint8))
+    mock_usb_cv2.VideoCapture.return_value = mock_cap
+
+    start_stream(camera_index=0, port=18083)
+    server = _manager._streams[0]
+    assert server.wait_for_frame(0, timeout=2)[0] == 1
+    time.sleep(0.05)
+    assert mock_cap.retrieve.call_count > 1
+    assert mock_encode.call_count == 1
+    assert server.wait_for_frame(1, timeout=0.01)[0] == 1
+
+
+@patch("optic_mcp.stream.encode_jpeg")
+@patch("optic_mcp.usb.cv2")
+@patch("optic_mcp.stream.cv2")
+def test_mjpeg_camera_frames_are_forwarded(mock_cv2, mock_usb_cv2, mock_encode):
+    """Test JPEG frames from an MJPEG camera are published without re-encoding."""
+    raw = b"\xff\xd8camera-jpeg\xff\xd9"
+    mock_cap = MagicMock(spec=cv2.VideoCapture)
+    mock_cap.isOpened.return_value = True
+    mock_cap.grab.return_value = True
+    mock_cap.set.return_value = True
+    mock_cap.get.side_effect = lambda prop: MJPG_FOURCC if prop == mock_cv2.CAP_PROP_FOURCC else 640
+    mock_cap.retrieve.return_value = (True, np.frombuffer(raw, dtype=np.uint8).reshape(1, -1))
+    mock_usb_cv2.VideoCapture.return_value = mock_cap
+
+    start_stream(camera_index=0, port=18084)
+    assert _manager._streams[0].wait_for_frame(0, timeout=2) == (1, raw)
+    mock_encode.assert_not_called()
+    stop_stream(camera_index=0)
+
+    # Decoding is switched back on before the capture returns to the pool
+    mock_cap.set.assert_any_call(mock_cv2.CAP_PROP_CONVERT_RGB, 0)
+    assert mock_cap.set.call_args_list[-1] == ((mock_cv2.CAP_PROP_CONVERT_RGB, 1),)
+
+
+@patch("optic_mcp.stream.encode_jpeg", return_value=b"\xff\xd8jpeg")
+@patch("optic_mcp.usb.cv2")
+@patch("optic_mcp.stream.cv2")
+def test_cameras_without_mjpeg_keep_decoding(mock_cv2, mock_usb_cv2, mock_encode, blank_frame):
+    """Test passthrough stays off when the camera keeps a non-MJPEG format."""
+    mock_cap = MagicMock(spec=cv2.VideoCapture)
+    mock_cap.isOpened.return_value = True
+    mock_cap.grab.return_value = True
+    mock_cap.set.return_value = True
+    mock_cap.get.side_effect = lambda prop: (
+        cv2.VideoWriter_fourcc(*"YUYV") if prop == mock_cv2.CAP_PROP_FOURCC else 640
+    )
+    mock_cap.retrieve.return_value = (True, blank_frame)
+    mock_usb_cv2.VideoCapture.return_value = mock_cap
+
+    start_stream(camera_index=0, port=18087)
+    assert _manager._streams[0].wait_for_frame(0, timeout=2)[0] == 1
+    stop_stream(camera_index=0)
+
+    mock_encode.assert_called()
+    assert ((mock_cv2.CAP_PROP_CONVERT_RGB, 0),) not in mock_cap.set.call_args_list
+
+
+@patch("optic_mcp.stream.encode_jpeg", return_value=b"\xff\xd8jpeg")
+@patch("optic_mcp.usb.cv2")
+@patch("optic_mcp.stream.cv2")
+def test_non_jpeg_raw_frames_switch_decoding_back_on(
+    mock_cv2, mock_usb_cv2, mock_encode, blank_frame
+):
+    """Test a camera reporting MJPG but sending raw YUYV falls back to decoded frames."""
+    yuyv = np.zeros((480, 640, 2), dtype=np.uint8)
+    convert_rgb = {"on": True}
+
+    def set_prop(prop, value):
+        if prop == mock_cv2.CAP_PROP_CONVERT_RGB:
+            convert_rgb["on"] = bool(value)
+        return True
+
+    mock_cap = MagicMock(spec=cv2.VideoCapture)
+    mock_cap.isOpened.return_value = True
+    mock_cap.grab.return_value = True
+    mock_cap.set.side_effect = set_prop
+    mock_cap.get.side_effect = lambda prop: MJPG_FOURCC if prop == mock_cv2.CAP_PROP_FOURCC else 640
+    mock_cap.retrieve.side_effect = lambda: (True, blank_frame if convert_rgb["on"] else yuyv)
+    mock_usb_cv2.VideoCapture.return_value = mock_cap
+
+    start_stream(camera_index=0, port=18088)
+    server = _manager._streams[0]
+    assert server.wait_for_frame(0, timeout=2)[0] == 1
+    assert convert_rgb["on"]
+    assert server.latest_frame() is blank_frame
+    mock_encode.assert_called_with(blank_frame, STREAM_JPEG_QUALITY)
+
+
+@patch("optic_mcp.stream.encode_jpeg", side_effect=cv2.error("encode failed"))
+@patch("optic_mcp.usb.cv2")
+@patch("optic_mcp.stream.cv2")
+def test_encode_errors_keep_the_stream_running(mock_cv2, mock_usb_cv2, mock_encode, blank_frame):
+    """Test an OpenCV error while encoding skips the frame instead of killing the loop."""
+    mock_cv2.error = cv2.error
+    frames = iter(range(1_000_000))
+    mock_cap = MagicMock(spec=cv2.VideoCapture)
+    mock_cap.isOpened.return_value = True
+    mock_cap.grab.return_value = True
+    mock_cap.retrieve.side_effect = lambda: (True, np.full((4, 4, 3), next(frames) % 256, np.uint8))
+    mock_usb_cv2.VideoCapture.return_value = mock_cap
+
+    start_stream(camera_index=0, port=18089)
+    time.sleep(0.05)
+    assert mock_encode.call_count > 1
+    assert _manager._streams[0]._capture_thread.is_alive()
+
+
+@patch("optic_mcp.usb.cv2")
+@patch("optic_mcp.stream.cv2")
+def test_capture_is_released_when_the_loop_fails(mock_cv2, mock_usb_cv2):
+    """Test the capture goes back to the pool even if retrieving a frame raises."""
+    mock_cap = MagicMock(spec=cv2.VideoCapture)
+    mock_cap.isOpened.return_value = True
+    mock_cap.grab.return_value = True
+    mock_cap.retrieve.side_effect = OSError("device unplugged")
+    mock_usb_cv2.VideoCapture.return_value = mock_cap
+
+    server = StreamServer(camera_index=0, port=0)
+    try:
+        server.streaming = True
+        with pytest.raises(OSError):
+            server._capture_loop()
+        assert server._cap is None
+        assert _capture_pool[0][0] is mock_cap
+    finally:
+        server.server_close()
+
+
+@patch("optic_mcp.usb.cv2")
+@patch("optic_mcp.stream.cv2")
+def test_stream_serves_concurrent_clients(mock_cv2, mock_usb_cv2):
+    """Test two viewers can watch the same stream at the same time."""
+    mock_cap = MagicMock(spec=cv2.VideoCapture)
+    mock_cap.isOpened.return_value = True
+    mock_cap.grab.return_value = True
+    mock_cap.set.return_value = False
+    mock_cap.retrieve.side_effect = lambda: (
+        True,
+        np.random.randint(0, 255, (48, 64, 3), dtype=np.uint8),
+    )
+    mock_usb_cv2.VideoCapture.return_value = mock_cap
+
+    start_stream(camera_index=0, port=18085)
+    clients = []
+    try:
+        for _ in range(2):
+            client = socket.create_connection(("localhost", 18085), timeout=2)
+            client.sendall(b"GET /stream HTTP/1.1\r\nHost: localhost\r\n\r\n")
+            clients.append(client)
+        for client in clients:
+            assert client.recv(1024).startswith(b"HTTP/1.0 200")
+    finally:
+        for client in clients:
+            client.close()
+
+
+def test_wait_for_frame_returns_only_new_frames():
+    """Test handlers block until a new frame is published instead of polling."""
+    server = StreamServer(camera_index=0, port=0)
+    server._server_thread = threading.Thread(target=server.serve_forever, daemon=True)
+    server._server_thread.start()
+    try:
+        server.streaming = True
+
+        # Nothing published yet: the wait times out with no frame
+        assert server.wait_for_frame(0, timeout=0.01) == (0, None)
+
+        publisher = threading.Timer(0.05, server._publish_frame, args=(b"frame-1",))
+        publisher.start()
+        assert server.wait_for_frame(0, timeout=2) == (1, b"frame-1")
+        publisher.join()
+
+        # The same frame is not handed out twice
+        assert server.wait_for_frame(1, timeout=0.01) == (1, b"frame-1")
+
+        # Stopping wakes waiting handlers right away
+        stopper = threading.Timer(0.05, server.stop)
+        stopper.start()
+        assert server.wait_for_frame(1, timeout=5) == (1, b"frame-1")
+        stopper.join()
+        assert not server.streaming
+    finally:
+        server.server_close()
+
+
+def test_send_all_gathers_parts():
+    """Test _send_all delivers every part in order, with and without sendmsg."""
+    parts = [b"--frame\r\n", bytes(range(256)) * 4096, b"\r\n"]
+    expected = b"".join(parts)
+
+    def read_all(sock, received):
+        while chunk := sock.recv(65536):
+            received.extend(chunk)
+
+    for use_sendmsg in (True, False):
+        left, right = socket.socketpair()
+        left.settimeout(5)
+        right.settimeout(5)
+        try:
+            sock = left if use_sendmsg else MagicMock(spec=["sendall"], sendall=left.sendall)
+            received = bytearray()
+            reader = threading.Thread(target=read_all, args=(right, received))
+            reader.start()
+            _send_all(sock, parts)
+            left.shutdown(socket.SHUT_WR)
+            reader.join(timeout=5)
+            assert bytes(received) == expected
+        finally:
+            left.close()
+            right.close()
+
+
+def test_pages_are_prerendered():
+    """Test the status and dashboard pages are encoded once, not per request."""
+    server = StreamServer(camera_index=3, port=0)
+    try:
+        assert isinstance(server.status_page, bytes)
+        assert b"<p>Camera Index: 3</p>" in server.status_page
+    finally:
+        server.server_close()
+
+    assert isinstance(DASHBOARD_HTML, bytes)
+    assert DASHBOARD_HTML.startswith(b"<!DOCTYPE html>")
+
+
+def test_frames_are_downscaled_to_max_width(blank_frame):
+    """Test wide frames are resized to max_width and narrow ones left alone."""
+    server = StreamServer(camera_index=0, port=0, max_width=320)
+    full = StreamServer(camera_index=0, port=0, max_width=0)
+    try:
+        wide = blank_frame
+        narrow = np.zeros((100, 200, 3), dtype=np.uint8)
+        assert server._downscale(wide).shape == (240, 320, 3)
+        assert server._downscale(narrow) is narrow
+        assert full._downscale(wide) is wide
+    finally:
+        server.server_close()
+        full.server_close()
+
+    with pytest.raises(ValueError, match="max_width"):
+        start_stream(camera_index=0, port=18086, max_width=-1)
+
+
+@patch("optic_mcp.jpeg._get_turbojpeg", return_value=None)
+def test_encoded_frames_are_not_copied(mock_turbo):
+    """Test the stream keeps a view of OpenCV's encode buffer instead of a bytes copy."""
+    view = _encode_frame(np.zeros((16, 16, 3), dtype=np.uint8))
+    assert isinstance(view, memoryview)
+    assert isinstance(view.obj, np.ndarray)
+    assert bytes(view[:2]) == b"\xff\xd8"
+
+
+def test_dashboard_not_blocked_by_idle_client():
+    """Test a connected client that sends nothing doesn't block other dashboard requests."""
+    start_dashboard(port=19000)
+    idle = socket.create_connection(("localhost", 19000), timeout=2)
+    try:
+        with urllib.request.urlopen("http://localhost:19000/api/streams", timeout=2) as response:
+            assert isinstance(json.loads(response.read()), list)
+    finally:
+        idle.close()
+        stop_dashboard()
+
+
+def test_latest_frame_decodes_passthrough_frames():
+    """Test latest_frame returns full-resolution BGR even for forwarded MJPEG frames."""
+    image = np.full((30, 40, 3), 200, dtype=np.uint8)
+    ok, jpeg = cv2.imencode(".jpg", image)
+    assert ok
+
+    server = StreamServer(camera_index=0, port=0)
+    try:
+        assert server.latest_frame() is None
+        server._latest_frame = image
+        assert server.latest_frame() is image
+        server._latest_frame = jpeg.reshape(1, -1)
+        assert server.latest_frame().shape == (30, 40, 3)
+    finally:
+        server.server_close()
@@ -1,35 +1,203 @@
 """Tests for USB camera functions."""
 
 from unittest.mock import MagicMock, patch
+
+import cv2
 import numpy as np
+import pytest
 
+from optic_mcp import usb
+from optic_mcp.usb import _scan_indices, close_cameras, list_cameras, save_image
 
-@patch("optic_mcp.usb.cv2")
-def test_list_cameras(mock_cv2):
-    """Test list_cameras detects available cameras."""
-    mock_cap = MagicMock()
-    mock_cap.isOpened.return_value = True
-    mock_cap.read.return_value = (True, np.zeros((480, 640, 3), dtype=np.uint8))
+
+@pytest.fixture(scope="module")
+def module_cv2():
+    """Patch optic_mcp.usb.cv2 once for the whole module."""
+    with patch("optic_mcp.usb.cv2") as mock:
+        yield mock
+
+
+@pytest.fixture(autouse=True)
+def mock_cv2(module_cv2):
+    """The module-wide cv2 mock, reset so tests cannot see each other's setup."""
+    module_cv2.reset_mock(return_value=True, side_effect=True)
+    return module_cv2
+
+
+@pytest.fixture(autouse=True)
+def empty_capture_pool():
+    """Start and end every test with no pooled captures."""
+    close_cameras()
+    yield
+    close_cameras()
+
+
+@pytest.mark.parametrize("opened, expected", [(False, 0), (True, 10)])
+@patch("optic_mcp.usb._scan_indices", return_value=list(range(10)))
+def test_list_cameras(mock_scan, mock_cv2, opened, expected):
+    """Test list_cameras reports every index whose camera opens."""
+    mock_cap = MagicMock(spec=cv2.VideoCapture)
+    mock_cap.isOpened.return_value = opened
+    mock_cap.grab.return_value = True
     mock_cap.getBackendName.return_value = "AVFOUNDATION"
     mock_cv2.VideoCapture.return_value = mock_cap
 
-    from optic_mcp.usb import list_cameras
+    result = list_cameras()
+    assert len(result) == expected
+    assert all(camera["status"] == "available" for camera in result)
+    # Probing only grabs frames; nothing is decoded
+    mock_cap.retrieve.assert_not_called()
+    mock_cap.read.assert_not_called()
+
+
+@patch("optic_mcp.usb._scan_indices", return_value=list(range(10)))
+def test_list_cameras_keeps_index_order(mock_scan, mock_cv2):
+    """Test list_cameras skips unavailable indices and returns the rest in order."""
+
+    def open_camera(index):
+        cap = MagicMock(spec=cv2.VideoCapture)
+        cap.isOpened.return_value = index in (1, 4, 7)
+        cap.grab.return_value = True
+        cap.getBackendName.return_value = "V4L2"
+        return cap
+
+    mock_cv2.VideoCapture.side_effect = open_camera
 
     result = list_cameras()
-    assert isinstance(result, list)
-    assert len(result) == 10
-    assert result[0]["status"] == "available"
+    assert [camera["index"] for camera in result] == [1, 4, 7]
+    assert mock_cv2.VideoCapture.call_count == 10
+
+
+@patch("optic_mcp.usb._scan_indices", return_value=[0, 1])
+def test_list_cameras_does_not_pool_probed_cameras(mock_scan, mock_cv2):
+    """Test cameras opened for a scan are closed, while pooled ones stay pooled."""
+    pooled = MagicMock(spec=cv2.VideoCapture)
+    pooled.isOpened.return_value = True
+    pooled.grab.return_value = True
+    usb.release_capture(0, pooled)
+
+    probed = MagicMock(spec=cv2.VideoCapture)
+    probed.isOpened.return_value = True
+    probed.grab.return_value = True
+    mock_cv2.VideoCapture.return_value = probed
+
+    assert [camera["index"] for camera in list_cameras()] == [0, 1]
+    mock_cv2.VideoCapture.assert_called_once_with(1)
+    probed.release.assert_called_once()
+    pooled.release.assert_not_called()
+    assert list(usb._capture_pool) == [0]
+
+
+@patch("optic_mcp.usb._scan_indices", return_value=[0])
+def test_list_cameras_releases_capture_on_error(mock_scan, mock_cv2):
+    """Test a probe that raises still releases its capture."""
+    mock_cap = MagicMock(spec=cv2.VideoCapture)
+    mock_cap.isOpened.return_value = True
+    mock_cap.grab.side_effect = OSError("device unplugged")
+    mock_cv2.VideoCapture.return_value = mock_cap
+
+    with pytest.raises(OSError):
+        list_cameras()
+    mock_cap.release.assert_called_once()
+
+
+@patch("optic_mcp.usb._scan_indices", return_value=[])
+def test_list_cameras_without_devices(mock_scan, mock_cv2):
+    """Test list_cameras opens nothing when no index is worth probing."""
+    assert list_cameras() == []
+    mock_cv2.VideoCapture.assert_not_called()
 
 
-@patch("optic_mcp.usb.cv2")
-def test_save_image_success(mock_cv2):
+def test_list_cameras_probes_only_existing_device_nodes(mock_cv2, tmp_path):
+    """Test Linux scans skip indices without a /dev/videoN node."""
+    for name in ("video0", "video1", "video4", "video12"):
+        (tmp_path / name).mkdir()
+    mock_cap = MagicMock(spec=cv2.VideoCapture)
+    mock_cap.isOpened.return_value = True
+    mock_cap.grab.return_value = True
+    mock_cv2.VideoCapture.return_value = mock_cap
+
+    with (
+        patch("optic_mcp.usb.sys.platform", "linux"),
+        patch("optic_mcp.usb.V4L2_SYSFS_DIR", str(tmp_path)),
+    ):
+        result = list_cameras()
+
+    assert [camera["index"] for camera in result] == [0, 1, 4]
+    opened = sorted(call.args[0] for call in mock_cv2.VideoCapture.call_args_list)
+    assert opened == [0, 1, 4]
+
+    with (
+        patch("optic_mcp.usb.sys.platform", "linux"),
+        patch("optic_mcp.usb.V4L2_SYSFS_DIR", str(tmp_path / "missing")),
+    ):
+        assert _scan_indices() == list(range(10))
+
+
+def test_save_image_success(mock_cv2, blank_frame, output_dir):
     """Test save_image saves file successfully."""
-    mock_cap = MagicMock()
+    mock_cap = MagicMock(spec=cv2.VideoCapture)
     mock_cap.isOpened.return_value = True
-    mock_cap.read.return_value = (True, np.zeros((480, 640, 3), dtype=np.uint8))
+    mock_cap.read.return_value = (True, blank_frame)
     mock_cv2.VideoCapture.return_value = mock_cap
 
-    from optic_mcp.usb import save_image
+    file_path = str(output_dir / "test.jpg")
+    result = save_image(file_path=file_path, camera_index=0)
+    assert f"Image saved to {file_path}" in result
+
+
+def test_save_image_reuses_pooled_capture(mock_cv2, blank_frame, output_dir):
+    """Test back-to-back save_image calls open the camera only once."""
+    mock_cap = MagicMock(spec=cv2.VideoCapture)
+    mock_cap.isOpened.return_value = True
+    mock_cap.read.return_value = (True, blank_frame)
+    mock_cv2.VideoCapture.return_value = mock_cap
+
+    save_image(file_path=str(output_dir / "first.jpg"), camera_index=0)
+    save_image(file_path=str(output_dir / "second.jpg"), camera_index=0)
+
+    mock_cv2.VideoCapture.assert_called_once_with(0)
+    mock_cap.release.assert_not_called()
+
+
+def test_save_image_releases_capture_on_error(mock_cv2, output_dir):
+    """Test a capture whose read raises is released instead of leaked or pooled."""
+    mock_cap = MagicMock(spec=cv2.VideoCapture)
+    mock_cap.isOpened.return_value = True
+    mock_cap.read.side_effect = OSError("device unplugged")
+    mock_cv2.VideoCapture.return_value = mock_cap
+
+    with pytest.raises(OSError):
+        save_image(file_path=str(output_dir / "test.jpg"), camera_index=0)
+    mock_cap.release.assert_called_once()
+    assert usb._capture_pool == {}
+
+
+def test_idle_captures_are_released():
+    """Test the reaper releases captures idle past the timeout."""
+    mock_cap = MagicMock(spec=cv2.VideoCapture)
+    usb.release_capture(0, mock_cap)
+
+    with (
+        patch.object(usb, "CAPTURE_IDLE_TIMEOUT_SECONDS", 0.0),
+        patch.object(usb, "CAPTURE_REAP_INTERVAL_SECONDS", 0.01),
+    ):
+        usb._reap_idle_captures()
+
+    mock_cap.release.assert_called_once()
+    assert usb._capture_pool == {}
+
+
+def test_save_image_uses_active_stream(mock_cv2, output_dir):
+    """Test save_image takes the frame from a running stream instead of reopening the camera."""
+    import optic_mcp.stream  # noqa: F401
+
+    file_path = str(output_dir / "test.jpg")
+    frame = np.zeros((1080, 1920, 3), dtype=np.uint8)
+    with patch("optic_mcp.stream.latest_frame", return_value=frame) as mock_latest:
+        result = save_image(file_path=file_path, camera_index=2)
 
-    result = save_image(file_path="/tmp/test.jpg", camera_index=0)
-    assert "Image saved to /tmp/test.jpg" in result
+    assert f"Image saved to {file_path}" in result
+    mock_latest.assert_called_once_with(2)
+    mock_cv2.VideoCapture.assert_not_called()
+    mock_cv2.imwrite.assert_called_once_with(file_path, frame)